@@ -0,0 +1,371 @@
+"""
+k-nearest-neighbours classification for millions of labelled points.
+
+The KNN notebook (.ipynb_checkpoints/KNN-checkpoint.ipynb) fits sklearn's
+KNeighborsClassifier on ten height/weight rows. This module runs the same
+workflow at scale, with two indexes:
+
+- KDTree (low dimensions): a balanced tree whose nodes are contiguous
+  slices of one permuted point array. Queries are processed a batch at a
+  time. Every query first scans its home leaf, which bounds its k-th
+  distance. Then all (query, node) pairs descend the tree together, and a
+  pair is dropped as soon as the node's bounding box is farther away than
+  that bound. Only the surviving leaves are scanned exactly.
+- BruteForceIndex (higher dimensions, where trees stop pruning): blocked
+  distances ||q||² - 2 q·x + ||x||², one matrix multiply per block, keeping
+  a running top-k per query.
+
+Query batches run on a thread pool; the NumPy kernels release the GIL.
+Indexes are plain arrays, so save() writes them as .npy files and load()
+memory-maps them back without rebuilding.
+"""
+
+import json
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Above this many features, KD-tree bounding boxes prune little and "auto" uses brute force
+KD_TREE_MAX_DIM = 10
+
+
+def _top_k(d2, idx, k):
+    """Sort each row's k smallest squared distances (d2, idx are (m, c), c >= k)."""
+    if d2.shape[1] > k:
+        part = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        d2, idx = np.take_along_axis(d2, part, 1), np.take_along_axis(idx, part, 1)
+    order = np.argsort(d2, axis=1, kind="stable")
+    return np.take_along_axis(d2, order, 1), np.take_along_axis(idx, order, 1)
+
+
+class BruteForceIndex:
+    """Exact neighbours by blocked matrix-multiply distances."""
+
+    kind = "brute"
+    array_names = ("points", "sq_norms")
+
+    def __init__(self, X, block_size=8192):
+        self.points = np.ascontiguousarray(X, dtype=np.float64)
+        self.sq_norms = np.einsum("ij,ij->i", self.points, self.points)
+        self.block_size = block_size
+
+    def query(self, Q, k):
+        """Squared distances and row indices of the k nearest points, both (m, k)."""
+        q_norms = np.einsum("ij,ij->i", Q, Q)[:, np.newaxis]
+        best_d2 = np.full((len(Q), 0), np.inf)
+        best_idx = np.empty((len(Q), 0), dtype=np.int64)
+        for start in range(0, len(self.points), self.block_size):
+            block = self.points[start:start + self.block_size]
+            d2 = Q @ block.T
+            d2 *= -2
+            d2 += q_norms
+            d2 += self.sq_norms[start:start + self.block_size]
+            idx = np.broadcast_to(np.arange(start, start + len(block)), d2.shape)
+            if len(block) > k:
+                # Cut the block to its own top k before merging with the running best
+                part = np.argpartition(d2, k - 1, axis=1)[:, :k]
+                d2, idx = np.take_along_axis(d2, part, 1), np.take_along_axis(idx, part, 1)
+            best_d2, best_idx = _top_k(np.hstack([best_d2, d2]), np.hstack([best_idx, idx]), k)
+        return np.maximum(best_d2, 0), best_idx
+
+    def arrays(self):
+        return {name: getattr(self, name) for name in self.array_names}
+
+    @classmethod
+    def from_arrays(cls, arrays, block_size=8192):
+        index = cls.__new__(cls)
+        index.points, index.sq_norms, index.block_size = arrays["points"], arrays["sq_norms"], block_size
+        return index
+
+
+class KDTree:
+    """
+    Balanced KD-tree in array form.
+
+    Node i has children 2i+1 and 2i+2. At depth l, node j covers rows
+    [j*n >> l, (j+1)*n >> l) of `points` (the input rows reordered by
+    `order`). Each split is at the median of the widest dimension. A node
+    stores its split and its bounding box; the 2**depth leaves hold at most
+    leaf_size points each.
+    """
+
+    kind = "kd_tree"
+    array_names = ("points", "order", "split_dim", "split_val", "node_lo", "node_hi")
+    max_chunk = 2 ** 22  # floats per exact-distance chunk (32 MB)
+
+    def __init__(self, X, leaf_size=40):
+        X = np.asarray(X, dtype=np.float64)
+        n, d = X.shape
+        self.depth = max(0, math.ceil(math.log2(n / leaf_size)))
+        n_nodes = 2 ** (self.depth + 1) - 1
+        order = np.arange(n)
+        self.split_dim = np.zeros(n_nodes, dtype=np.int64)
+        self.split_val = np.zeros(n_nodes)
+        for level in range(self.depth):
+            for j in range(2 ** level):
+                start, mid, stop = (j * n) >> level, ((2 * j + 1) * n) >> (level + 1), ((j + 1) * n) >> level
+                segment = X[order[start:stop]]
+                dim = int(np.argmax(np.ptp(segment, axis=0)))
+                part = np.argpartition(segment[:, dim], mid - start)
+                order[start:stop] = order[start:stop][part]
+                node = 2 ** level - 1 + j
+                self.split_dim[node], self.split_val[node] = dim, segment[part[mid - start], dim]
+
+        self.order = order
+        self.points = X[order]
+        self._build_boxes(n, d)
+
+    def _build_boxes(self, n, d):
+        n_leaves = 2 ** self.depth
+        starts = (np.arange(n_leaves) * n) >> self.depth
+        self.node_lo = np.empty((2 * n_leaves - 1, d))
+        self.node_hi = np.empty((2 * n_leaves - 1, d))
+        self.node_lo[n_leaves - 1:] = np.minimum.reduceat(self.points, starts)
+        self.node_hi[n_leaves - 1:] = np.maximum.reduceat(self.points, starts)
+        for level in range(self.depth - 1, -1, -1):
+            nodes = np.arange(2 ** level - 1, 2 ** (level + 1) - 1)
+            self.node_lo[nodes] = np.minimum(self.node_lo[2 * nodes + 1], self.node_lo[2 * nodes + 2])
+            self.node_hi[nodes] = np.maximum(self.node_hi[2 * nodes + 1], self.node_hi[2 * nodes + 2])
+
+    def _leaf_distances(self, Q, leaves):
+        """Squared distances from Q[i] to every point of leaves[i], padded with inf; (m, max leaf)."""
+        n = len(self.points)
+        starts = (leaves * n) >> self.depth
+        stops = ((leaves + 1) * n) >> self.depth
+        width = -(-n >> self.depth)  # ceil(n / 2**depth), the largest leaf
+        rows = starts[:, np.newaxis] + np.arange(width)
+        valid = rows < stops[:, np.newaxis]
+        rows = np.minimum(rows, n - 1)
+        d2 = ((self.points[rows] - Q[:, np.newaxis, :]) ** 2).sum(axis=2)
+        d2[~valid] = np.inf
+        return d2, rows
+
+    def query(self, Q, k):
+        """Squared distances and original row indices of the k nearest points, both (m, k)."""
+        m, first_leaf = len(Q), 2 ** self.depth - 1
+
+        # Home leaf: its k-th distance bounds the true k-th distance
+        node = np.zeros(m, dtype=np.int64)
+        for _ in range(self.depth):
+            right = Q[np.arange(m), self.split_dim[node]] > self.split_val[node]
+            node = 2 * node + 1 + right
+        home_d2, _ = self._leaf_distances(Q, node - first_leaf)
+        bound = np.partition(home_d2, k - 1, axis=1)[:, k - 1] if home_d2.shape[1] >= k else np.full(m, np.inf)
+
+        # Descend all (query, node) pairs together, pruning boxes beyond the bound
+        query_ids, nodes = np.arange(m), np.zeros(m, dtype=np.int64)
+        for level in range(self.depth + 1):
+            q = Q[query_ids]
+            gap = np.maximum(self.node_lo[nodes] - q, 0) + np.maximum(q - self.node_hi[nodes], 0)
+            keep = (gap * gap).sum(axis=1) <= bound[query_ids]
+            query_ids, nodes = query_ids[keep], nodes[keep]
+            if level < self.depth:
+                query_ids = np.repeat(query_ids, 2)
+                nodes = 2 * np.repeat(nodes, 2) + np.tile([1, 2], len(nodes))
+
+        # Exact distances in the surviving leaves, a bounded chunk of pairs at a
+        # time (in high dimensions nearly every leaf survives), keeping the k best
+        best_d2, best_rows = np.full((m, k), np.inf), np.zeros((m, k), dtype=np.int64)
+        width = -(-len(self.points) >> self.depth)
+        chunk = max(1, self.max_chunk // (width * Q.shape[1]))
+        for start in range(0, len(nodes), chunk):
+            ids = query_ids[start:start + chunk]
+            d2, rows = self._leaf_distances(Q[ids], nodes[start:start + chunk] - first_leaf)
+            owner = np.concatenate([np.repeat(np.arange(m), k), np.repeat(ids, d2.shape[1])])
+            d2 = np.concatenate([best_d2.ravel(), d2.ravel()])
+            rows = np.concatenate([best_rows.ravel(), rows.ravel()])
+            ranked = np.lexsort((d2, owner))
+            group_start = np.searchsorted(owner[ranked], np.arange(m))
+            take = ranked[group_start[:, np.newaxis] + np.arange(k)]
+            best_d2, best_rows = d2[take], rows[take]
+        return best_d2, self.order[best_rows]
+
+    def arrays(self):
+        return {name: getattr(self, name) for name in self.array_names}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        index = cls.__new__(cls)
+        for name, array in arrays.items():
+            setattr(index, name, array)
+        index.depth = int(math.log2(len(index.split_dim) + 1)) - 1
+        return index
+
+
+class KNeighborsClassifier:
+    """
+    k-nearest-neighbours classifier on a KD-tree or brute-force index.
+
+    Parameters:
+    - n_neighbors: k
+    - algorithm: "kd_tree", "brute" or "auto" (KD-tree up to KD_TREE_MAX_DIM
+      features)
+    - weights: "uniform" votes or "distance" (1/d; exact matches win outright)
+    - leaf_size: points per KD-tree leaf
+    - block_size: index rows per brute-force matrix multiply
+    - batch_size: queries per task
+    - workers: query threads (None = ThreadPoolExecutor default)
+    """
+
+    def __init__(self, n_neighbors=5, algorithm="auto", weights="uniform", leaf_size=40,
+                 block_size=8192, batch_size=1024, workers=None):
+        if algorithm not in ("auto", "kd_tree", "brute"):
+            raise ValueError(f"Unknown algorithm: {algorithm!r}")
+        if weights not in ("uniform", "distance"):
+            raise ValueError(f"Unknown weights: {weights!r}")
+        self.n_neighbors = n_neighbors
+        self.algorithm = algorithm
+        self.weights = weights
+        self.leaf_size = leaf_size
+        self.block_size = block_size
+        self.batch_size = batch_size
+        self.workers = workers
+        self.index = None
+
+    def fit(self, X, y):
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or len(X) != len(y):
+            raise ValueError("X must be 2-D with one row per label.")
+        if len(X) < self.n_neighbors:
+            raise ValueError("n_neighbors cannot exceed the number of training rows.")
+        self.classes_, self.labels = np.unique(np.asarray(y), return_inverse=True)
+        algorithm = self.algorithm
+        if algorithm == "auto":
+            algorithm = "kd_tree" if X.shape[1] <= KD_TREE_MAX_DIM else "brute"
+        if algorithm == "kd_tree":
+            self.index = KDTree(X, self.leaf_size)
+        else:
+            self.index = BruteForceIndex(X, self.block_size)
+        return self
+
+    def kneighbors(self, X, n_neighbors=None, return_distance=True):
+        """Distances and training-row indices of each query's neighbours, nearest first."""
+        if self.index is None:
+            raise ValueError("The model has not been fitted.")
+        k = n_neighbors if n_neighbors is not None else self.n_neighbors
+        if not 1 <= k <= len(self.index.points):
+            raise ValueError(f"n_neighbors must be between 1 and the number of training rows "
+                             f"({len(self.index.points)}), got {k}.")
+        Q = np.asarray(X, dtype=np.float64)
+        Q = Q[np.newaxis, :] if Q.ndim == 1 else Q
+        if Q.ndim != 2 or Q.shape[1] != self.index.points.shape[1]:
+            raise ValueError(f"X has {Q.shape[-1]} features, but the model was fitted with "
+                             f"{self.index.points.shape[1]}.")
+        distances = np.empty((len(Q), k))
+        indices = np.empty((len(Q), k), dtype=np.int64)
+
+        def batch(start):
+            stop = start + self.batch_size
+            d2, idx = self.index.query(Q[start:stop], k)
+            distances[start:stop], indices[start:stop] = np.sqrt(d2), idx
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(batch, range(0, len(Q), self.batch_size)))
+        return (distances, indices) if return_distance else indices
+
+    def predict_proba(self, X):
+        distances, indices = self.kneighbors(X)
+        if self.weights == "uniform":
+            votes = np.ones_like(distances)
+        else:
+            with np.errstate(divide="ignore"):
+                votes = 1 / distances
+            exact = np.isinf(votes)
+            rows = exact.any(axis=1)
+            votes[rows] = exact[rows]
+        proba = np.zeros((len(distances), len(self.classes_)))
+        np.add.at(proba, (np.arange(len(distances))[:, np.newaxis], self.labels[indices]), votes)
+        return proba / proba.sum(axis=1, keepdims=True)
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def score(self, X, y):
+        return float(np.mean(self.predict(X) == np.asarray(y)))
+
+    def save(self, path):
+        """Write the index, labels and settings to a directory of .npy files."""
+        if self.index is None:
+            raise ValueError("The model has not been fitted.")
+        os.makedirs(path, exist_ok=True)
+        for name, array in {**self.index.arrays(), "labels": self.labels}.items():
+            np.save(os.path.join(path, f"{name}.npy"), array)
+        meta = {"kind": self.index.kind, "classes": self.classes_.tolist(), "n_neighbors": self.n_neighbors,
+                "weights": self.weights, "leaf_size": self.leaf_size, "block_size": self.block_size,
+                "batch_size": self.batch_size}
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        return path
+
+    @classmethod
+    def load(cls, path, mmap_mode="r", workers=None):
+        """Open a saved model; with mmap_mode="r" the arrays are paged in on demand."""
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        model = cls(meta["n_neighbors"], meta["kind"], meta["weights"], meta["leaf_size"],
+                    meta["block_size"], meta["batch_size"], workers)
+        index_cls = KDTree if meta["kind"] == "kd_tree" else BruteForceIndex
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+                  for name in index_cls.array_names}
+        if index_cls is BruteForceIndex:
+            model.index = index_cls.from_arrays(arrays, block_size=meta["block_size"])
+        else:
+            model.index = index_cls.from_arrays(arrays)
+        model.labels = np.load(os.path.join(path, "labels.npy"), mmap_mode=mmap_mode)
+        model.classes_ = np.asarray(meta["classes"])
+        return model
+
+    def __repr__(self):
+        kind = None if self.index is None else self.index.kind
+        return f"KNeighborsClassifier(n_neighbors={self.n_neighbors}, index={kind})"
+
+
+def benchmark(sizes=(10**4, 10**5, 10**6), n_features=2, n_queries=2000, k=5, seed=0):
+    """Query latency against index size for both indexes (exactness checked against brute force)."""
+    rng = np.random.default_rng(seed)
+    queries = rng.normal(size=(n_queries, n_features))
+    print(f"{n_queries:,} queries, k={k}, {n_features} features")
+    print(f"{'index size':>12} {'kd build s':>11} {'kd µs/query':>12} {'brute µs/query':>15} {'same':>5}")
+    for n in sizes:
+        X = rng.normal(size=(n, n_features))
+        y = (X[:, 0] > 0).astype(int)
+        start = time.perf_counter()
+        tree = KNeighborsClassifier(k, algorithm="kd_tree").fit(X, y)
+        build = time.perf_counter() - start
+        brute = KNeighborsClassifier(k, algorithm="brute").fit(X, y)
+
+        timings, results = [], []
+        for model in (tree, brute):
+            start = time.perf_counter()
+            results.append(model.kneighbors(queries)[0])
+            timings.append((time.perf_counter() - start) / n_queries * 1e6)
+        same = np.allclose(results[0], results[1])
+        print(f"{n:>12,} {build:>11.2f} {timings[0]:>12.1f} {timings[1]:>15.1f} {same!s:>5}")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    # The KNN notebook's example
+    X = np.array([[150, 50], [160, 60], [170, 70], [180, 80], [175, 75],
+                  [165, 65], [155, 55], [185, 85], [172, 72], [158, 57]])
+    y = np.array(["Light", "Light", "Medium", "Heavy", "Heavy", "Medium", "Light", "Heavy", "Medium", "Light"])
+    knn = KNeighborsClassifier(n_neighbors=3).fit(X, y)
+    print(f"Predicted Category for Height 161 cm & Weight 61 kg: {knn.predict([[161, 61]])[0]}")
+
+    # A million points: persist the index, then query it memory-mapped
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(1_000_000, 2))
+    y = (X[:, 0] * X[:, 1] > 0).astype(int)
+    model = KNeighborsClassifier(n_neighbors=15).fit(X, y)
+    with tempfile.TemporaryDirectory() as path:
+        reloaded = KNeighborsClassifier.load(model.save(os.path.join(path, "knn")))
+        test = rng.normal(size=(10_000, 2))
+        print(f"Accuracy of the memory-mapped model: {reloaded.score(test, (test[:, 0] * test[:, 1] > 0))}")
+        print("Same predictions after reload:", np.array_equal(model.predict(test), reloaded.predict(test)))
+        del reloaded
+    print()
+    benchmark()
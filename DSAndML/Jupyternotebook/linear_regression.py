@@ -0,0 +1,238 @@
+"""
+Simple and multiple linear regression from sufficient statistics.
+
+LinearRegrssionManually.ipynb computes b0/b1 and then R² with Python loops
+over NumPy scalars. Here each chunk of rows is reduced in one vectorized
+pass to its count, means and centered cross-products (X'X, X'y, y'y about
+the means). Chunks and shards are combined with the exact pairwise update
+of Chan et al., the same scheme as statistics/moments.py. Centering keeps
+the normal equations well conditioned for large-valued columns like head
+size. The coefficients, R², MSE and residual standard error all come from
+these statistics, so a CSV larger than memory is read only once.
+
+For streaming data, partial_fit() folds each new batch into the state in
+O(batch * d²) with no pass over earlier rows, and an optional forgetting
+factor down-weights old rows exponentially (as in recursive least squares),
+so the model tracks drift.
+"""
+
+import numpy as np
+
+
+class LinearRegression:
+    """
+    Ordinary least squares y ≈ b0 + X @ b.
+
+    Fit in one call with fit(X, y), or accumulate chunks with update() /
+    partial_fit() and combine shards with merge(). Properties are recomputed
+    from the sufficient statistics on demand.
+
+    Parameters:
+    - fit_intercept: estimate b0 (statistics are centered) or force b0 = 0
+    - forgetting: factor λ in (0, 1]; each new row multiplies the weight of
+      every earlier row by λ, giving an effective memory of about 1 / (1 - λ)
+      rows. λ = 1 (default) weights all rows equally.
+    """
+
+    def __init__(self, fit_intercept=True, forgetting=1.0):
+        if not 0 < forgetting <= 1:
+            raise ValueError("forgetting must be in (0, 1].")
+        self.fit_intercept = fit_intercept
+        self.forgetting = forgetting
+        self.n = 0  # total row weight (the row count when forgetting == 1)
+        self.mean_x = None
+        self.mean_y = 0.0
+        self.Sxx = None  # centered X'X
+        self.Sxy = None  # centered X'y
+        self.Syy = 0.0   # centered y'y
+
+    @staticmethod
+    def _as_2d(X):
+        X = np.asarray(X, dtype=np.float64)
+        return X[:, np.newaxis] if X.ndim == 1 else X
+
+    def _chunk_stats(self, X, y, weights=None):
+        chunk = LinearRegression(self.fit_intercept, self.forgetting)
+        if weights is None:
+            chunk.n = len(y)
+            if self.fit_intercept:
+                chunk.mean_x, chunk.mean_y = X.mean(axis=0), y.mean()
+                X, y = X - chunk.mean_x, y - chunk.mean_y
+            else:
+                chunk.mean_x = np.zeros(X.shape[1])
+            chunk.Sxx, chunk.Sxy, chunk.Syy = X.T @ X, X.T @ y, float(y @ y)
+            return chunk
+
+        chunk.n = float(weights.sum())
+        if self.fit_intercept:
+            chunk.mean_x, chunk.mean_y = weights @ X / chunk.n, float(weights @ y) / chunk.n
+            X, y = X - chunk.mean_x, y - chunk.mean_y
+        else:
+            chunk.mean_x = np.zeros(X.shape[1])
+        weighted = X * weights[:, np.newaxis]
+        chunk.Sxx, chunk.Sxy, chunk.Syy = weighted.T @ X, weighted.T @ y, float(weights @ (y * y))
+        return chunk
+
+    def _decay(self, factor):
+        self.n *= factor
+        self.Sxx = self.Sxx * factor
+        self.Sxy = self.Sxy * factor
+        self.Syy *= factor
+
+    def update(self, X, y, sample_weight=None):
+        """
+        Add a chunk of rows (rows in arrival order when forgetting < 1).
+
+        Returns self so calls can be chained.
+        """
+        X, y = self._as_2d(X), np.asarray(y, dtype=np.float64).ravel()
+        if len(X) != len(y):
+            raise ValueError("X and y must have the same number of rows.")
+        if len(y) == 0:
+            return self
+
+        weights = None if sample_weight is None else np.asarray(sample_weight, dtype=np.float64).ravel()
+        if self.forgetting < 1:
+            # Row i of m is weighted λ^(m-1-i); everything seen before decays by λ^m
+            ages = np.arange(len(y) - 1, -1, -1)
+            decay = self.forgetting ** ages
+            weights = decay if weights is None else weights * decay
+            if self.n:
+                self._decay(self.forgetting ** len(y))
+        return self.merge(self._chunk_stats(X, y, weights))
+
+    def partial_fit(self, X, y, sample_weight=None):
+        """Incorporate a new batch without revisiting earlier rows (alias of update)."""
+        return self.update(X, y, sample_weight)
+
+    def merge(self, other):
+        """
+        Combine with statistics from another chunk or shard (exact).
+
+        With forgetting, `other` is treated as the newer data; its rows are
+        not used to decay this state.
+
+        Returns self so calls can be chained.
+        """
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean_x, self.mean_y = other.n, other.mean_x.copy(), other.mean_y
+            self.Sxx, self.Sxy, self.Syy = other.Sxx.copy(), other.Sxy.copy(), other.Syy
+            return self
+        if self.Sxx.shape != other.Sxx.shape:
+            raise ValueError("Cannot merge models with different numbers of features.")
+
+        n = self.n + other.n
+        dx, dy = other.mean_x - self.mean_x, other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+        self.Sxx = self.Sxx + other.Sxx + weight * np.outer(dx, dx)
+        self.Sxy = self.Sxy + other.Sxy + weight * dx * dy
+        self.Syy = self.Syy + other.Syy + weight * dy * dy
+        self.mean_x = self.mean_x + dx * other.n / n
+        self.mean_y = self.mean_y + dy * other.n / n
+        self.n = n
+        return self
+
+    def fit(self, X, y):
+        """Fit from scratch on in-memory arrays."""
+        self.__init__(self.fit_intercept, self.forgetting)
+        return self.update(X, y)
+
+    @classmethod
+    def from_csv(cls, path, x_columns, y_column, chunksize=100_000, fit_intercept=True, **read_csv_options):
+        """Fit over a CSV in chunks, never holding more than `chunksize` rows."""
+        import pandas as pd
+
+        model = cls(fit_intercept)
+        for chunk in pd.read_csv(path, usecols=list(x_columns) + [y_column], chunksize=chunksize,
+                                 **read_csv_options):
+            model.update(chunk[list(x_columns)].to_numpy(), chunk[y_column].to_numpy())
+        return model
+
+    @property
+    def coef_(self):
+        """Slopes b1..bp (lstsq, so collinear features do not raise)."""
+        if self.n == 0:
+            raise ValueError("The model has not been fitted.")
+        return np.linalg.lstsq(self.Sxx, self.Sxy, rcond=None)[0]
+
+    @property
+    def intercept_(self):
+        return float(self.mean_y - self.mean_x @ self.coef_) if self.fit_intercept else 0.0
+
+    def predict(self, X):
+        return self._as_2d(X) @ self.coef_ + self.intercept_
+
+    @property
+    def ss_total(self):
+        """Σ(y - mean_y)² (about 0 when fit_intercept=False)."""
+        return float(self.Syy)
+
+    @property
+    def ss_residual(self):
+        """Σ(y - ŷ)², from the normal equations: Syy - b'Sxy."""
+        return max(float(self.Syy - self.coef_ @ self.Sxy), 0.0)
+
+    @property
+    def r2(self):
+        return 1 - self.ss_residual / self.ss_total
+
+    @property
+    def mse(self):
+        return self.ss_residual / self.n
+
+    @property
+    def residual_std_error(self):
+        """sqrt(SS_residual / degrees of freedom), with n the total row weight."""
+        dof = self.n - len(self.Sxy) - int(self.fit_intercept)
+        return (self.ss_residual / dof) ** 0.5
+
+    def residuals(self, X, y):
+        return np.asarray(y, dtype=np.float64) - self.predict(X)
+
+    def summary(self):
+        return {"n": self.n, "intercept": self.intercept_, "coef": self.coef_.tolist(),
+                "r2": self.r2, "mse": self.mse, "residual_std_error": self.residual_std_error}
+
+    def __repr__(self):
+        return f"LinearRegression(n={self.n}, features={0 if self.Sxy is None else len(self.Sxy)})"
+
+
+def simple_linear_regression(x, y):
+    """(b1, b0) of the least-squares line y = b0 + b1 x, as in the notebook."""
+    model = LinearRegression().fit(x, y)
+    return float(model.coef_[0]), model.intercept_
+
+
+if __name__ == "__main__":
+    import os
+
+    import pandas as pd
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "headbrain.csv")
+
+    # Simple regression, in chunks of 50 rows
+    model = LinearRegression.from_csv(path, ["Head Size(cm^3)"], "Brain Weight(grams)", chunksize=50)
+    print(f"Slope (b1): {model.coef_[0]}, Intercept (b0): {model.intercept_}")
+    print(f"R-squared value: {model.r2}")
+
+    # Multiple regression, fitted on two shards and merged
+    columns = ["Gender", "Age Range", "Head Size(cm^3)"]
+    data = pd.read_csv(path)
+    half = len(data) // 2
+    left = LinearRegression().fit(data[columns][:half], data["Brain Weight(grams)"][:half])
+    right = LinearRegression().fit(data[columns][half:], data["Brain Weight(grams)"][half:])
+    print(left.merge(right).summary())
+
+    # Streaming: batches of 10 rows, with and without forgetting, on data
+    # whose slope changes halfway through
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 10, 20_000)
+    slope = np.where(np.arange(len(x)) < len(x) // 2, 2.0, -1.0)
+    y = 1 + slope * x + rng.normal(0, 1, len(x))
+    static, adaptive = LinearRegression(), LinearRegression(forgetting=0.999)
+    for start in range(0, len(x), 10):
+        static.partial_fit(x[start:start + 10], y[start:start + 10])
+        adaptive.partial_fit(x[start:start + 10], y[start:start + 10])
+    print(f"Final slope: no forgetting {static.coef_[0]:.3f}, forgetting=0.999 {adaptive.coef_[0]:.3f} (true -1)")
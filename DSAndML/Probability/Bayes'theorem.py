@@ -23,4 +23,11 @@ for i, posterior in enumerate(posteriors):
 
 '''
 enumerate is a built-in Python function that allows us to loop over a list and get both the index and the value at each step of the iteration.
-'''
\ No newline at end of file
+'''
+
+# Vectorized, log-space version for many hypotheses and several observations
+from bayesposterior import posterior
+
+likelihoods_per_observation = [[0.8, 0.6, 0.4], [0.3, 0.5, 0.9]]  # P(B1|A_i), P(B2|A_i)
+for i, p in enumerate(posterior(priors, likelihoods_per_observation)):
+    print(f"The posterior probability P(A{i+1}|B1,B2) is {p:.4f}")
@@ -0,0 +1,97 @@
+"""
+Vectorized Bayes' theorem over many hypotheses and many pieces of evidence.
+
+bayes_theorem_multiple in Bayes'theorem.py handles one observation with
+Python lists and divides by a plain sum, which underflows once the
+likelihoods get small. Here everything happens in log space:
+
+    log P(A_i | B_1..B_m) = log P(A_i) + sum_j log P(B_j | A_i) - logsumexp(...)
+
+Leading dimensions are treated as a batch of independent problems.
+"""
+
+import numpy as np
+
+
+def logsumexp(a, axis=-1, keepdims=False):
+    """
+    Stable log(sum(exp(a))) along an axis; rows that are all -inf give -inf.
+    """
+    a = np.asarray(a)
+    peak = np.max(a, axis=axis, keepdims=True)
+    peak = np.where(np.isfinite(peak), peak, 0)
+    with np.errstate(divide="ignore"):
+        result = np.log(np.sum(np.exp(a - peak), axis=axis, keepdims=True)) + peak
+    return result if keepdims else np.squeeze(result, axis=axis)
+
+
+def log_posterior(log_priors, log_likelihoods, trajectory=False):
+    """
+    Log-posterior after all evidence, from log-priors and log-likelihoods.
+
+    Parameters:
+    - log_priors: (..., hypotheses) log P(A_i)
+    - log_likelihoods: (..., observations, hypotheses) log P(B_j | A_i)
+    - trajectory: if True, return the posterior after each observation,
+      shape (..., observations, hypotheses); otherwise only the final one,
+      shape (..., hypotheses)
+
+    The result keeps the input floating-point dtype (float32 stays float32).
+    """
+    log_priors = np.asarray(log_priors)
+    log_likelihoods = np.asarray(log_likelihoods)
+    if log_likelihoods.ndim < 2:
+        raise ValueError("log_likelihoods must have shape (..., observations, hypotheses).")
+
+    if trajectory:
+        log_joint = np.expand_dims(log_priors, -2) + np.cumsum(log_likelihoods, axis=-2)
+    else:
+        log_joint = log_priors + np.sum(log_likelihoods, axis=-2)
+    return log_joint - logsumexp(log_joint, axis=-1, keepdims=True)
+
+
+def posterior(priors, likelihoods, trajectory=False, dtype=np.float64, return_log=False):
+    """
+    Posterior probabilities P(A_i | all evidence) from probabilities.
+
+    Parameters:
+    - priors: (..., hypotheses) prior probabilities P(A_i)
+    - likelihoods: (..., observations, hypotheses) P(B_j | A_i); a 1-D
+      array is treated as a single observation
+    - trajectory: return the posterior after every observation
+    - dtype: np.float32 halves memory for large problems
+    - return_log: return log-posteriors instead of probabilities
+
+    Returns:
+    - NumPy array of shape (..., hypotheses), or (..., observations,
+      hypotheses) when trajectory=True
+    """
+    priors = np.asarray(priors, dtype=dtype)
+    likelihoods = np.asarray(likelihoods, dtype=dtype)
+    if likelihoods.ndim == 1:
+        likelihoods = likelihoods[np.newaxis, :]
+
+    with np.errstate(divide="ignore"):
+        result = log_posterior(np.log(priors), np.log(likelihoods), trajectory=trajectory)
+    return result if return_log else np.exp(result)
+
+
+if __name__ == "__main__":
+    # Same example as Bayes'theorem.py
+    priors = [0.2, 0.5, 0.3]
+    likelihoods = [0.8, 0.6, 0.4]
+    for i, p in enumerate(posterior(priors, likelihoods)):
+        print(f"The posterior probability P(A{i+1}|B) is {p:.4f}")
+
+    # 5,000 hypotheses and 2,000 observations: the plain product underflows to 0
+    rng = np.random.default_rng(0)
+    hypotheses, observations = 5_000, 2_000
+    priors = np.full(hypotheses, 1 / hypotheses)
+    likelihoods = rng.uniform(1e-3, 1e-1, size=(observations, hypotheses))
+    print("\nNaive product of likelihoods for A1:", np.prod(likelihoods[:, 0]))
+    result = posterior(priors, likelihoods, dtype=np.float32)
+    print("Log-space posterior: sum =", result.sum(), " MAP hypothesis =", result.argmax(), " dtype =", result.dtype)
+
+    # A batch of 100 independent 3-hypothesis problems with 10 observations each
+    batch = posterior(rng.dirichlet(np.ones(3), size=100), rng.uniform(size=(100, 10, 3)), trajectory=True)
+    print("Batched trajectory shape:", batch.shape)
@@ -0,0 +1,134 @@
+"""
+Batched PMF validation and normalization.
+
+The helpers in probabilitymassfunc.py check one Python list at a time, print
+on every call and walk the list once for the range check and again for the
+sum. validate_pmfs checks many probability vectors at once, either rows of a
+2-D array or ragged rows stored CSR-style (a flat `values` buffer plus row
+`offsets`). Each block of rows is reduced for its minimum, maximum and sum
+while it is still in cache, and rows can be normalized in place in the same
+loop. Nothing is printed.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+PMFCheck = namedtuple("PMFCheck", ["valid", "bad_rows", "sums", "probabilities"])
+PMFCheck.__doc__ = """
+Result of validate_pmfs.
+
+- valid: boolean mask, True where the row was a valid PMF (before normalizing)
+- bad_rows: indices of the invalid rows
+- sums: row sums before normalizing
+- probabilities: the checked array (normalized in place when requested)
+"""
+
+
+def _as_float_buffer(values, dtype):
+    """Use `values` directly when it is already a writable float array."""
+    if isinstance(values, np.ndarray) and values.dtype.kind == "f" and values.flags.writeable:
+        return values
+    return np.array(values, dtype=dtype)
+
+
+def _normalize_rows(block, sums, ok):
+    # Rows with negative or NaN entries, or nothing to divide by, are left as-is
+    scale = np.where(ok, sums, 1.0)
+    block /= scale[:, None]
+
+
+def validate_pmfs(probabilities, tol=1e-9, normalize=False, offsets=None,
+                  block_rows=65536, dtype=np.float64):
+    """
+    Validate (and optionally normalize) many probability vectors.
+
+    Parameters:
+    - probabilities: (rows, outcomes) array, or a flat values buffer when
+      `offsets` is given
+    - tol: allowed |sum - 1| for a row to count as valid
+    - normalize: divide each row with non-negative entries and a positive
+      sum by that sum, in place when `probabilities` is a writable float array
+    - offsets: CSR row offsets of length rows + 1; row i is
+      values[offsets[i]:offsets[i + 1]]. Empty rows (and a dense
+      block with zero outcomes) are invalid.
+    - block_rows: rows reduced per step of the dense path
+
+    Returns:
+    - PMFCheck(valid, bad_rows, sums, probabilities)
+    """
+    values = _as_float_buffer(probabilities, dtype)
+    if offsets is not None:
+        return _validate_csr(values, np.asarray(offsets, dtype=np.intp), tol, normalize)
+
+    if values.ndim != 2:
+        raise ValueError("probabilities must be 2-D (rows, outcomes); use offsets for ragged rows.")
+    rows = values.shape[0]
+    if values.shape[1] == 0:
+        # Like empty CSR rows: nothing sums to 1, and min/max have no identity
+        return PMFCheck(np.zeros(rows, dtype=bool), np.arange(rows), np.zeros(rows, dtype=values.dtype), values)
+    valid = np.empty(rows, dtype=bool)
+    sums = np.empty(rows, dtype=values.dtype)
+
+    for start in range(0, rows, block_rows):
+        block = values[start:start + block_rows]
+        low, high = block.min(axis=1), block.max(axis=1)
+        total = block.sum(axis=1)
+        in_range = (low >= 0) & (high <= 1)
+        valid[start:start + len(block)] = in_range & (np.abs(total - 1) <= tol)
+        sums[start:start + len(block)] = total
+        if normalize:
+            _normalize_rows(block, total, (low >= 0) & (total > 0))
+
+    return PMFCheck(valid, np.flatnonzero(~valid), sums, values)
+
+
+def _validate_csr(values, offsets, tol, normalize):
+    if values.ndim != 1 or offsets.ndim != 1 or len(offsets) < 1:
+        raise ValueError("CSR input needs a flat values buffer and 1-D offsets.")
+    if offsets[0] != 0 or offsets[-1] != len(values) or np.any(np.diff(offsets) < 0):
+        raise ValueError("offsets must start at 0, end at len(values) and be non-decreasing.")
+
+    lengths = np.diff(offsets)
+    rows = len(lengths)
+    nonempty = lengths > 0
+    starts = offsets[:-1][nonempty]
+
+    sums = np.zeros(rows, dtype=values.dtype)
+    low = np.zeros(rows, dtype=values.dtype)
+    high = np.zeros(rows, dtype=values.dtype)
+    if values.size:
+        # reduceat over the starts of non-empty rows covers each row exactly
+        sums[nonempty] = np.add.reduceat(values, starts)
+        low[nonempty] = np.minimum.reduceat(values, starts)
+        high[nonempty] = np.maximum.reduceat(values, starts)
+
+    valid = nonempty & (low >= 0) & (high <= 1) & (np.abs(sums - 1) <= tol)
+
+    if normalize and values.size:
+        ok = nonempty & (low >= 0) & (sums > 0)
+        values /= np.repeat(np.where(ok, sums, 1.0), lengths)
+
+    return PMFCheck(valid, np.flatnonzero(~valid), sums, values)
+
+
+if __name__ == "__main__":
+    # The examples from probabilitymassfunc.py, as one batch
+    batch = np.array([[0.5, 0.5], [0.4, 0.6], [0.7, 0.7], [-0.1, 1.1]])
+    check = validate_pmfs(batch)
+    print("valid:", check.valid, " bad rows:", check.bad_rows, " sums:", check.sums)
+
+    # One million softmax-like rows with a few corrupted ones, normalized in place
+    rng = np.random.default_rng(0)
+    outputs = rng.random((1_000_000, 10))
+    outputs[[3, 500_000]] *= -1
+    check = validate_pmfs(outputs, normalize=True)
+    print("invalid before normalizing:", check.valid.size - check.valid.sum(), " negative rows:",
+          check.bad_rows[check.probabilities[check.bad_rows].min(axis=1) < 0])
+    print("valid after normalizing:", validate_pmfs(outputs).valid.sum())
+
+    # Ragged rows: [0.2, 0.8], [], [1.0], [0.3, 0.3, 0.3]
+    values = np.array([0.2, 0.8, 1.0, 0.3, 0.3, 0.3])
+    offsets = np.array([0, 2, 2, 3, 6])
+    check = validate_pmfs(values, offsets=offsets, normalize=True)
+    print("CSR valid:", check.valid, " normalized values:", check.probabilities)
@@ -49,12 +49,17 @@ print(probability_mass_func(prob_list))
 
 # Using fractions.Fraction for Exact Arithmetic
 
+import math
 from fractions import Fraction
 
 
 def probability_mass_func_fraction(prob_list):
     prob_list_fraction = [Fraction(p).limit_denominator() for p in prob_list]
-    total = sum(prob_list_fraction)
+
+    # Sum over the common denominator (LCM) in integers and normalize once,
+    # instead of a gcd after every Fraction addition
+    common = math.lcm(*(p.denominator for p in prob_list_fraction))
+    total = Fraction(sum(p.numerator * (common // p.denominator) for p in prob_list_fraction), common)
 
     print(f"Sum of probabilities (as fraction): {total}")
 
@@ -75,3 +80,11 @@ def probability_mass_func_normalized(prob_list):
 
 print(probability_mass_func_normalized(prob_list))
 
+
+
+# Validating many PMFs at once (rows of a 2-D array, or ragged CSR rows)
+
+from pmfbatch import validate_pmfs
+
+check = validate_pmfs([[0.5, 0.5], [0.4, 0.6], [0.7, 0.7]])
+print(check.valid, check.bad_rows)
@@ -1,6 +1,7 @@
-import math
 from fractions import Fraction  # Import Fraction for precise fractional calculations
 
+from distributions import EXACT_BINOMIAL_MAX_TRIALS, Binomial, binomial_pmf_exact
+
 
 def f():
     try:
@@ -23,13 +24,18 @@ def f():
         if x < 0 or x > n:
             raise ValueError("Number of successes (x) must be between 0 and n.")
 
-        # Calculate the combination (nCr) and the binomial probability
-        combination = math.comb(n, x)
-        result = combination * (p**x) * (q ** (n - x))  # Binomial probability
-
-        # Display the result in both fraction and decimal forms
         print(f"Mean = {n * p}")
         print(f"Variance = {n * p * q}")
+
+        # Exact fractions only while they stay small; log-space floats beyond that
+        if n > EXACT_BINOMIAL_MAX_TRIALS:
+            result = float(Binomial(n, float(p)).pmf(x))
+            print(f"Binomial probability as a decimal: {result}")
+            return result
+
+        result = binomial_pmf_exact(n, p, x)  # Binomial probability
+
+        # Display the result in both fraction and decimal forms
         print(f"Binomial probability as a fraction: {result}")
         print(f"Binomial probability as a decimal: {float(result)}")
 
@@ -40,5 +46,6 @@ def f():
         return None
 
 
-# Call the function
-f()
+if __name__ == "__main__":
+    # Call the function
+    f()
@@ -1,5 +1,207 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from scipy.stats import chi2
+
+ChiSquareResult = namedtuple("ChiSquareResult", ["statistic", "dof", "p_value", "expected", "contributions"])
+
+REPORT_COLUMNS = ["observed_value", "Expected_value", "(observed - expected)", "(observed - expected)^2", "(observed - expected)^2/E"]
+
+
+def expected_counts(observed):
+    """
+    Expected counts under independence as the outer product of the margins.
+
+    Args:
+        observed (array-like): Observed count matrix of shape (rows, cols), without totals.
+
+    Returns:
+        np.ndarray: Expected counts, row_total * column_total / grand_total.
+    """
+    observed = np.asarray(observed, dtype=float)
+    row_totals = observed.sum(axis=1)
+    column_totals = observed.sum(axis=0)
+    return np.outer(row_totals, column_totals) / observed.sum()
+
+
+def _degrees_of_freedom(tables):
+    """(non-empty rows - 1) * (non-empty columns - 1) for each table in (..., rows, cols)."""
+    rows = np.count_nonzero(tables.sum(axis=-1), axis=-1)
+    cols = np.count_nonzero(tables.sum(axis=-2), axis=-1)
+    return np.maximum(rows - 1, 0) * np.maximum(cols - 1, 0)
+
+
+def _chi_square_stack(tables):
+    """
+    Chi-Square statistics, degrees of freedom and p-values for a (tables, rows, cols) stack.
+    """
+    tables = np.asarray(tables, dtype=float)
+    row_totals = tables.sum(axis=2, keepdims=True)
+    column_totals = tables.sum(axis=1, keepdims=True)
+    grand_totals = row_totals.sum(axis=1, keepdims=True)
+    expected = np.divide(row_totals * column_totals, grand_totals,
+                         out=np.zeros_like(tables), where=grand_totals != 0)
+    contributions = np.divide((tables - expected) ** 2, expected,
+                              out=np.zeros_like(tables), where=expected != 0)
+    statistic = contributions.sum(axis=(1, 2))
+    dof = _degrees_of_freedom(tables)
+    p_value = np.where(dof > 0, chi2.sf(statistic, np.maximum(dof, 1)), np.nan)
+    return statistic, dof, p_value
+
+
+def chi_square_test(observed):
+    """
+    Chi-Square test of independence for a contingency table, in one vectorized pass.
+
+    Args:
+        observed (array-like): Observed count matrix of shape (rows, cols), without totals.
+
+    Returns:
+        ChiSquareResult: statistic, degrees of freedom, p-value, the expected
+        table and the per-cell (observed - expected)^2/E contributions.
+        Cells with an expected count of 0 contribute 0.
+    """
+    observed = np.asarray(observed, dtype=float)
+    if observed.ndim != 2:
+        raise ValueError("The observed table must be two-dimensional.")
+    expected = expected_counts(observed)
+    diff_squared = (observed - expected) ** 2
+    contributions = np.divide(diff_squared, expected, out=np.zeros_like(expected), where=expected != 0)
+    statistic = float(contributions.sum())
+    dof = int(_degrees_of_freedom(observed))
+    p_value = float(chi2.sf(statistic, dof)) if dof > 0 else float("nan")
+    return ChiSquareResult(statistic, dof, p_value, expected, contributions)
+
+
+def _split_batches(tables, max_cells):
+    tables = np.asarray(tables, dtype=float)
+    if tables.ndim != 3:
+        raise ValueError("tables must have shape (tables, rows, cols).")
+    per_batch = max(1, max_cells // max(1, tables.shape[1] * tables.shape[2]))
+    return [tables[start:start + per_batch] for start in range(0, len(tables), per_batch)]
+
+
+def _join_results(results):
+    if not results:
+        return np.zeros(0), np.zeros(0, dtype=np.int64), np.zeros(0)
+    return tuple(np.concatenate(column) for column in zip(*results))
+
+
+def chi_square_batch(tables, max_cells=10_000_000, workers=1):
+    """
+    Chi-Square tests of independence for a stack of contingency tables at once.
+
+    Args:
+        tables (array-like): Observed counts of shape (tables, rows, cols).
+        max_cells (int): Maximum number of cells computed in one broadcast batch.
+        workers (int): Number of processes the batches are spread over.
+
+    Returns:
+        pd.DataFrame: One row per table with columns statistic, dof and p_value.
+    """
+    batches = _split_batches(tables, max_cells)
+    if workers > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_chi_square_stack, batches))
+    else:
+        results = [_chi_square_stack(batch) for batch in batches]
+
+    statistic, dof, p_value = _join_results(results)
+    return pd.DataFrame({"statistic": statistic, "dof": dof, "p_value": p_value})
+
+
+def _local_codes(group_codes, codes):
+    """
+    Number each group's own levels 0, 1, ... in order of first appearance.
+
+    Returns the per-observation local codes and the number of levels per group.
+    """
+    levels = int(codes.max(initial=-1)) + 1
+    pair_codes, pairs = pd.factorize(group_codes * levels + codes)
+    pair_groups = pairs // max(levels, 1)
+    local = pd.Series(pair_groups).groupby(pair_groups).cumcount().to_numpy()
+    return local[pair_codes], np.bincount(pair_groups, minlength=int(group_codes.max(initial=-1)) + 1)
+
+
+def chi_square_long(data, group_keys, row, col, count=None, max_cells=10_000_000, workers=1):
+    """
+    Chi-Square tests for every group of a long-format DataFrame.
+
+    Each group's table only spans the row and column levels that occur in
+    that group, and groups are stacked per (rows, cols) shape, so memory
+    follows the real table sizes rather than all levels in the DataFrame.
+    Rows with a missing group, row or column value are ignored.
+
+    Args:
+        data (pd.DataFrame): One row per observation (or per cell if `count` is given).
+        group_keys (str or list): Column(s) identifying each contingency table.
+        row (str): Column holding the table's row category.
+        col (str): Column holding the table's column category.
+        count (str, optional): Column of cell counts; rows are counted if omitted.
+        max_cells (int): Maximum number of cells computed in one broadcast batch.
+        workers (int): Number of processes, shared by all table shapes.
+
+    Returns:
+        pd.DataFrame: statistic, dof and p_value indexed by the group keys.
+    """
+    group_keys = [group_keys] if isinstance(group_keys, str) else list(group_keys)
+    # pd.factorize codes missing values as -1, which would corrupt the tables
+    data = data.dropna(subset=group_keys + [row, col])
+    group_codes, groups = pd.MultiIndex.from_frame(data[group_keys]).factorize()
+    row_codes, n_rows = _local_codes(group_codes, pd.factorize(data[row])[0])
+    col_codes, n_cols = _local_codes(group_codes, pd.factorize(data[col])[0])
+    weights = None if count is None else data[count].to_numpy(dtype=float)
+
+    # Scatter each bucket of same-shaped groups into its own (groups, rows, cols) stack
+    shapes = pd.MultiIndex.from_arrays([n_rows, n_cols])
+    bucket_codes, bucket_shapes = shapes.factorize()
+    position = pd.Series(np.arange(len(groups))).groupby(bucket_codes).cumcount().to_numpy()
+    statistic, dof, p_value = np.zeros(len(groups)), np.zeros(len(groups), dtype=np.int64), np.zeros(len(groups))
+    with ExitStack() as stack:
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers)) if workers > 1 else None
+        for bucket, (rows, cols) in enumerate(bucket_shapes):
+            members = np.flatnonzero(bucket_codes == bucket)
+            observations = np.flatnonzero(bucket_codes[group_codes] == bucket)
+            shape = (len(members), rows, cols)
+            flat = np.ravel_multi_index((position[group_codes[observations]], row_codes[observations],
+                                         col_codes[observations]), shape)
+            tables = np.bincount(flat, weights=None if weights is None else weights[observations],
+                                 minlength=int(np.prod(shape))).reshape(shape)
+            batches = _split_batches(tables, max_cells)
+            results = pool.map(_chi_square_stack, batches) if pool else map(_chi_square_stack, batches)
+            statistic[members], dof[members], p_value[members] = _join_results(list(results))
+
+    result = pd.DataFrame({"statistic": statistic, "dof": dof, "p_value": p_value})
+    result.index = groups if len(group_keys) > 1 else groups.get_level_values(0)
+    return result
+
+
+def report_table(observed, expected):
+    """
+    Build the per-cell Chi-Square analysis table in a single allocation.
+
+    Args:
+        observed (array-like): Observed counts (any shape).
+        expected (array-like): Expected counts with the same shape.
+
+    Returns:
+        pd.DataFrame: One row per cell with the columns in REPORT_COLUMNS.
+    """
+    observed = np.asarray(observed, dtype=float).ravel()
+    expected = np.asarray(expected, dtype=float).ravel()
+    # Column-major so every column below is written contiguously
+    values = np.empty((len(REPORT_COLUMNS), observed.size)).T
+    values[:, 0] = observed
+    values[:, 1] = expected
+    np.subtract(observed, expected, out=values[:, 2])  # observed - expected
+    np.square(values[:, 2], out=values[:, 3])  # (observed - expected)^2
+    np.divide(values[:, 3], expected, out=values[:, 4], where=expected != 0)  # Avoid division by zero
+    values[expected == 0, 4] = 0
+    return pd.DataFrame(values, columns=REPORT_COLUMNS, copy=False)
 
 
 def visualize_table(table):
@@ -30,28 +232,7 @@ def final_table(dynamic_table, expected_table):
     observed_table_df = pd.DataFrame(dynamic_table.iloc[:-1, :-1])  # Exclude totals
     expected_table_df = pd.DataFrame(expected_table)
 
-    # Define columns for the final table
-    cols = ["observed_value", "Expected_value", "(observed - expected)", "(observed - expected)^2", "(observed - expected)^2/E"]
-    final_table = pd.DataFrame(columns=cols)
-
-    # Flatten the observed and expected tables for element-wise operations
-    observed_flat = observed_table_df.values.flatten()
-    expected_flat = expected_table_df.values.flatten()
-
-    # Compute each column for the final table
-    for obs, exp in zip(observed_flat, expected_flat):
-        diff = obs - exp  # observed - expected
-        diff_squared = diff ** 2  # (observed - expected)^2
-        chi_square_contribution = diff_squared / exp if exp != 0 else 0  # Avoid division by zero
-        final_table = pd.concat([final_table, pd.DataFrame({
-            "observed_value": [obs],
-            "Expected_value": [exp],
-            "(observed - expected)": [diff],
-            "(observed - expected)^2": [diff_squared],
-            "(observed - expected)^2/E": [chi_square_contribution]
-        })], ignore_index=True)
-
-    return final_table
+    return report_table(observed_table_df.values.astype(float), expected_table_df.values)
 
 
 def expected_table(dynamic_table):
@@ -64,23 +245,14 @@ def expected_table(dynamic_table):
     Returns:
         pd.DataFrame: A table of expected values.
     """
-    # Calculate totals
-    row_totals = dynamic_table.iloc[:, :-1].sum(axis=1)  # Sum across rows (excluding "Row Total" column)
-    column_totals = dynamic_table.iloc[:-1, :].sum(axis=0)  # Sum across columns (excluding "Column Total" row)
-    grand_total = dynamic_table.iloc[:-1, :-1].values.sum()  # Total of all table values (excluding totals)
-
-    # Initialize an empty DataFrame for expected values
-    rows = dynamic_table.index[:-1]  # Exclude "Column Total" row
-    cols = dynamic_table.columns[:-1]  # Exclude "Row Total" column
-    expected = pd.DataFrame(index=rows, columns=cols)
+    # Observed values without the "Row Total" column and "Column Total" row
+    rows = dynamic_table.index[:-1]
+    cols = dynamic_table.columns[:-1]
+    observed = dynamic_table.iloc[:-1, :-1].values.astype(float)
 
-    # Compute expected values for each cell
-    for row in rows:
-        for col in cols:
-            expected.loc[row, col] = (row_totals[row] * column_totals[col]) / grand_total
+    # Expected values as the outer product of row and column totals
+    expected = pd.DataFrame(expected_counts(observed), index=rows, columns=cols)
 
-    # Convert to numeric for compatibility
-    expected = expected.apply(pd.to_numeric)
     print(expected)  # Optional: Show the expected table for verification
     return expected
 
@@ -131,12 +303,22 @@ def create_dynamic_table(rows, cols):
     return table
 
 
-# Example usage: Define rows and columns
-rows = ["Male", "Female"]  # Example row names
-cols = ["Yes", "No"]  # Example column names
+if __name__ == "__main__":
+    # Example usage: Define rows and columns
+    rows = ["Male", "Female"]  # Example row names
+    cols = ["Yes", "No"]  # Example column names
+
+    # Generate the dynamic table with user inputs
+    dynamic_table = create_dynamic_table(rows, cols)
+
+    # Statistic, degrees of freedom and p-value
+    result = chi_square_test(dynamic_table.iloc[:-1, :-1].values.astype(float))
+    print(f"\nChi-Square = {result.statistic:.4f}, df = {result.dof}, p-value = {result.p_value:.4g}")
 
-# Generate the dynamic table with user inputs
-dynamic_table = create_dynamic_table(rows, cols)
+    # Batch mode: many independent 2x2 tables in one broadcast operation
+    rng = np.random.default_rng(0)
+    print("\nBatch of 5 random 2x2 tables:")
+    print(chi_square_batch(rng.integers(5, 50, size=(5, 2, 2))))
 
-# Optional: Visualize the generated table
-# visualize_table(dynamic_table)
+    # Optional: Visualize the generated table
+    # visualize_table(dynamic_table)
@@ -1,26 +1,11 @@
-import math
-from scipy.integrate import quad
-
-
-def pdf(x, λ):
-    """
-    Exponential probability density function.
-
-    Formula: f(x) = λ * exp(-λ * x)
-    where:
-        - λ > 0 (rate parameter)
-        - x >= 0
-    """
-    if x < 0:
-        return 0  # The PDF is 0 for x < 0
-    return λ * math.exp(-λ * x)
+from distributions import Exponential
 
 
 def exponential_pdf():
     """
     Calculate the probability for an exponential distribution over a specified range.
 
-    Formula: P(a <= X <= b) = ∫[a, b] (λ * exp(-λ * x)) dx
+    Formula: P(a <= X <= b) = ∫[a, b] (λ * exp(-λ * x)) dx = exp(-λa) - exp(-λb)
     where:
         - mean = 1 / λ (mean must be > 0)
         - variance = 1 / λ^2
@@ -32,8 +17,9 @@ def exponential_pdf():
             raise ValueError("Mean must be greater than 0.")
 
         # Calculate the rate parameter λ
-        λ = 1.0 / mean
-        var = 1.0 / (λ**2)
+        distribution = Exponential.from_mean(mean)
+        λ = float(distribution.rate)
+        var = float(distribution.var())
 
         # Display calculated parameters
         print(f"\nExponential Distribution Parameters:")
@@ -47,13 +33,12 @@ def exponential_pdf():
         if a < 0 or b < a:
             raise ValueError("Invalid range. Ensure a >= 0 and b >= a.")
 
-        # Integrate the PDF over the range [a, b]
-        prob, err = quad(pdf, a, b, args=(λ,))
+        # Closed-form CDF difference instead of integrating the PDF
+        prob = float(distribution.interval_probability(a, b))
 
         # Display results
         print(f"\nProbability for range [{a}, {b}]:")
         print(f"  P({a} <= X <= {b}): {prob:.5f}")
-        print(f"  Error Estimate: {err:.5e}")
 
     except ValueError as ve:
         print(f"\nInput Error: {ve}")
@@ -61,5 +46,6 @@ def exponential_pdf():
         print(f"\nUnexpected Error: {e}")
 
 
-# Example usage
-exponential_pdf()
+if __name__ == "__main__":
+    # Example usage
+    exponential_pdf()
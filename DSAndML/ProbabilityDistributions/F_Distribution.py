@@ -1,3 +1,6 @@
+from distributions import f_statistic
+
+
 def f_dist():
     """
     Compute the F-distribution value based on sample sizes and variances.
@@ -11,23 +14,13 @@ def f_dist():
         variance_sample1 = float(input("Enter variance of sample 1: "))
         variance_sample2 = float(input("Enter variance of sample 2: "))
 
-        # Validate sample sizes
-        if sample1 <= 1 or sample2 <= 1:
-            raise ValueError("Sample sizes must be greater than 1.")
-
-        # Degrees of freedom
-        degree_of_freedom1 = sample1 - 1
-        degree_of_freedom2 = sample2 - 1
-
-        # Ensure variance_sample1 >= variance_sample2
+        # Compute F-distribution (validates the sample sizes and puts the larger variance on top)
+        f_distribution, degree_of_freedom1, degree_of_freedom2 = f_statistic(
+            sample1, variance_sample1, sample2, variance_sample2
+        )
         if variance_sample1 < variance_sample2:
             print("Swapping variances to ensure variance_sample1 >= variance_sample2.")
-            variance_sample1, variance_sample2 = variance_sample2, variance_sample1
-            degree_of_freedom1, degree_of_freedom2 = degree_of_freedom2, degree_of_freedom1
-
-        # Compute F-distribution
-        f_distribution = variance_sample1 / variance_sample2
-        print(f"\nDegrees of Freedom: df1 = {degree_of_freedom1}, df2 = {degree_of_freedom2}")
+        print(f"\nDegrees of Freedom: df1 = {int(degree_of_freedom1)}, df2 = {int(degree_of_freedom2)}")
         print(f"F-distribution = {f_distribution:.4f}")
 
     except ValueError as v:
@@ -36,5 +29,6 @@ def f_dist():
         print(f"Error: {e}")
 
 
-# Call the function
-f_dist()
+if __name__ == "__main__":
+    # Call the function
+    f_dist()
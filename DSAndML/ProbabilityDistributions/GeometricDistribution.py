@@ -1,3 +1,6 @@
+from distributions import Geometric
+
+
 def geometric_pmf():
     """
     Calculate the probability mass function (PMF) of a geometric distribution.
@@ -14,8 +17,9 @@ def geometric_pmf():
         if p <= 0 or p > 1:
             raise ValueError("The probability p must be in the range (0, 1].")
 
-        mean = 1.0 / p
-        standard_deviation = (1.0 - p) / p**2
+        distribution = Geometric(p)
+        mean = float(distribution.mean())
+        standard_deviation = float(distribution.std())
 
         # print Mean
         print(f"Mean = {mean}")
@@ -23,17 +27,13 @@ def geometric_pmf():
         # print S.D
         print(f"Standard_deviation = {standard_deviation}")
 
-        # Calculate the probability of failure
-        q = 1 - p
-
         # Input the value of x
         x = int(input("Enter the number of trials (x >= 1): "))
         if x < 1:
             raise ValueError("x must be an integer >= 1.")
 
         # Calculate the PMF
-        probability_mass = q ** (x - 1) * p
-        return probability_mass
+        return float(distribution.pmf(x))
 
     except ValueError as ve:
         print(f"Input Error: {ve}")
@@ -43,7 +43,8 @@ def geometric_pmf():
         return None
 
 
-# Example usage
-result = geometric_pmf()
-if result is not None:
-    print(f"Result: {result}")
+if __name__ == "__main__":
+    # Example usage
+    result = geometric_pmf()
+    if result is not None:
+        print(f"Result: {result}")
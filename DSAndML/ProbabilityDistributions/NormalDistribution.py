@@ -1,4 +1,4 @@
-import math
+from distributions import Normal
 
 
 def f():
@@ -11,9 +11,6 @@ def f():
         if mean < 0 or variance < 0:
             raise ValueError("Mean and variance must be non-negative numbers.")
 
-        # Calculate standard deviation
-        standard_deviation = math.sqrt(variance)
-
         # Input the value of x
         x = float(
             input("Enter value (x): ")
@@ -22,18 +19,12 @@ def f():
             raise ValueError("x must be non-negative.")
 
         # Calculate the probability density using the normal distribution formula
-        probability_density = (
-            1
-            / (standard_deviation * math.sqrt(2 * math.pi))
-            * math.exp(-((x - mean) ** 2) / (2 * variance))
-        )
-
-        # Return the calculated PDF
-        return probability_density
+        return float(Normal(mean, variance).pdf(x))
 
     except ValueError as e:
         print(f"Error: {e}")
         return None
 
 
-print(f"Answer = {f()}")
\ No newline at end of file
+if __name__ == "__main__":
+    print(f"Answer = {f()}")
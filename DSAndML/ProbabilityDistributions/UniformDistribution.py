@@ -1,22 +1,11 @@
-from scipy.integrate import quad
-
-
-def pdf(x, a, b):
-    """
-    Uniform probability density function.
-
-    Formula: f(x) = 1 / (b - a) if a <= x <= b, else 0
-    """
-    if a <= x <= b:
-        return 1.0 / (b - a)
-    return 0.0
+from distributions import Uniform
 
 
 def uniform_pdf():
     """
     Calculate the probability for a Uniform distribution over a specified range.
 
-    Formula: P(a <= X <= b) = ∫[a, b] (1.0/(b - a)) dx
+    Formula: P(rf <= X <= rt) = ∫[rf, rt] (1.0/(b - a)) dx = (rt - rf) / (b - a)
     where:
         - mean = (a + b) / 2
         - variance = (b - a) ** 2 / 12
@@ -29,8 +18,9 @@ def uniform_pdf():
             raise ValueError("b must be greater than a.")
 
         # Calculate mean and variance
-        mean = (a + b) / 2.0
-        variance = (b - a) ** 2 / 12.0
+        distribution = Uniform(a, b)
+        mean = float(distribution.mean())
+        variance = float(distribution.var())
 
         # Display calculated parameters
         print(f"\nUniform Distribution Parameters:")
@@ -45,13 +35,12 @@ def uniform_pdf():
                 "Invalid integration range. Ensure a <= rf <= rt <= b."
             )
 
-        # Integrate the PDF over the range [range_from, range_to]
-        prob, err = quad(pdf, range_from, range_to, args=(a, b))
+        # Closed-form CDF difference instead of integrating the PDF
+        prob = float(distribution.interval_probability(range_from, range_to))
 
         # Display results
         print(f"\nProbability for range [{range_from}, {range_to}]:")
         print(f"  P({range_from} <= X <= {range_to}): {prob:.5f}")
-        print(f"  Error Estimate: {err:.5e}")
 
     except ValueError as ve:
         print(f"\nInput Error: {ve}")
@@ -59,5 +48,6 @@ def uniform_pdf():
         print(f"\nUnexpected Error: {e}")
 
 
-# Example usage
-uniform_pdf()
+if __name__ == "__main__":
+    # Example usage
+    uniform_pdf()
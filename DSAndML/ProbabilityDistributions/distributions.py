@@ -0,0 +1,513 @@
+"""
+Headless, vectorized probability distributions.
+
+The scripts in this folder ask for their parameters with input(); the
+classes here do the same maths without any I/O so they can be used in batch
+jobs. Parameters and arguments may be scalars or NumPy arrays and are
+broadcast against each other, e.g.
+
+    Normal(mean=[0, 10], variance=[[1], [4]]).cdf(x)  # shape (2, 2) + ...
+
+Every distribution provides pdf (or pmf for discrete ones), cdf, sf
+(survival function, 1 - cdf), ppf (inverse cdf), mean, var and
+interval_probability(a, b) = P(a <= X <= b) from the analytic CDF.
+density_interval_probability() covers user-supplied densities with
+vectorized Gauss-Legendre quadrature instead of one scipy quad call per
+interval.
+"""
+
+import time
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+from scipy import special
+from scipy.integrate import quad
+
+
+def _as_float(*values):
+    return [np.asarray(v, dtype=float) for v in values]
+
+
+def _check(condition, message):
+    if not np.all(condition):
+        raise ValueError(message)
+
+
+class Distribution:
+    """Base class with the shared derived quantities."""
+
+    discrete = False
+
+    def sf(self, x):
+        """Survival function P(X > x)."""
+        return 1.0 - self.cdf(x)
+
+    def interval_probability(self, a, b):
+        """
+        P(a <= X <= b) for arrays of interval bounds, from the CDF (no integration).
+
+        Empty intervals (b < a) have probability 0.
+        """
+        a, b = _as_float(a, b)
+        if self.discrete:
+            # Include the left end point: P(X <= b) - P(X <= ceil(a) - 1)
+            result = self.cdf(b) - self.cdf(np.ceil(a) - 1)
+        else:
+            result = self.cdf(b) - self.cdf(a)
+        return np.where(b >= a, result, 0.0)
+
+    def std(self):
+        return np.sqrt(self.var())
+
+    def __repr__(self):
+        params = ", ".join(f"{k}={v}" for k, v in vars(self).items())
+        return f"{type(self).__name__}({params})"
+
+
+class Normal(Distribution):
+    """
+    Normal distribution N(mean, variance).
+
+    Formula: f(x) = 1 / (σ √(2π)) * exp(-(x - μ)² / (2σ²))
+    """
+
+    def __init__(self, mean=0.0, variance=1.0):
+        self.mu, self.variance = _as_float(mean, variance)
+        _check(self.variance > 0, "Variance must be positive.")
+
+    @property
+    def sigma(self):
+        return np.sqrt(self.variance)
+
+    def pdf(self, x):
+        z = (np.asarray(x, dtype=float) - self.mu) / self.sigma
+        return np.exp(-0.5 * z * z) / (self.sigma * np.sqrt(2 * np.pi))
+
+    def cdf(self, x):
+        return special.ndtr((np.asarray(x, dtype=float) - self.mu) / self.sigma)
+
+    def sf(self, x):
+        return special.ndtr((self.mu - np.asarray(x, dtype=float)) / self.sigma)
+
+    def ppf(self, q):
+        return self.mu + self.sigma * special.ndtri(np.asarray(q, dtype=float))
+
+    def mean(self):
+        return self.mu
+
+    def var(self):
+        return self.variance
+
+
+class Exponential(Distribution):
+    """
+    Exponential distribution with rate λ > 0.
+
+    Formula: f(x) = λ * exp(-λ * x) for x >= 0, mean = 1 / λ, variance = 1 / λ²
+    """
+
+    def __init__(self, rate=1.0):
+        (self.rate,) = _as_float(rate)
+        _check(self.rate > 0, "Rate must be greater than 0.")
+
+    @classmethod
+    def from_mean(cls, mean):
+        mean = np.asarray(mean, dtype=float)
+        _check(mean > 0, "Mean must be greater than 0.")
+        return cls(1.0 / mean)
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=float)
+        return np.where(x < 0, 0.0, self.rate * np.exp(-self.rate * np.maximum(x, 0)))
+
+    def cdf(self, x):
+        x = np.maximum(np.asarray(x, dtype=float), 0)
+        return -np.expm1(-self.rate * x)
+
+    def sf(self, x):
+        x = np.maximum(np.asarray(x, dtype=float), 0)
+        return np.exp(-self.rate * x)
+
+    def ppf(self, q):
+        return -np.log1p(-np.asarray(q, dtype=float)) / self.rate
+
+    def interval_probability(self, a, b):
+        """P(a <= X <= b) = exp(-λa) - exp(-λb), with a and b clamped at 0."""
+        a, b = _as_float(a, b)
+        return np.where(b >= a, self.sf(a) - self.sf(b), 0.0)
+
+    def mean(self):
+        return 1.0 / self.rate
+
+    def var(self):
+        return 1.0 / self.rate**2
+
+
+class Uniform(Distribution):
+    """
+    Continuous uniform distribution on [a, b].
+
+    Formula: f(x) = 1 / (b - a) if a <= x <= b, else 0
+    """
+
+    def __init__(self, a=0.0, b=1.0):
+        self.a, self.b = _as_float(a, b)
+        _check(self.b > self.a, "b must be greater than a.")
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=float)
+        return np.where((x >= self.a) & (x <= self.b), 1.0 / (self.b - self.a), 0.0)
+
+    def cdf(self, x):
+        return np.clip((np.asarray(x, dtype=float) - self.a) / (self.b - self.a), 0.0, 1.0)
+
+    def ppf(self, q):
+        return self.a + np.asarray(q, dtype=float) * (self.b - self.a)
+
+    def interval_probability(self, a, b):
+        """P(a <= X <= b) = length of [a, b] ∩ [A, B] divided by (B - A)."""
+        a, b = _as_float(a, b)
+        overlap = np.minimum(b, self.b) - np.maximum(a, self.a)
+        return np.maximum(overlap, 0.0) / (self.b - self.a)
+
+    def mean(self):
+        return (self.a + self.b) / 2.0
+
+    def var(self):
+        return (self.b - self.a) ** 2 / 12.0
+
+
+class Geometric(Distribution):
+    """
+    Number of trials up to and including the first success.
+
+    Formula: P(X = x) = q^(x-1) * p for x = 1, 2, ...
+    """
+
+    discrete = True
+
+    def __init__(self, p):
+        (self.p,) = _as_float(p)
+        _check((self.p > 0) & (self.p <= 1), "The probability p must be in the range (0, 1].")
+
+    def pmf(self, x):
+        x = np.asarray(x, dtype=float)
+        valid = (x >= 1) & (x == np.floor(x))
+        return np.where(valid, np.exp(special.xlog1py(np.maximum(x, 1) - 1, -self.p)) * self.p, 0.0)
+
+    def cdf(self, x):
+        return -np.expm1(special.xlog1py(np.floor(np.maximum(np.asarray(x, dtype=float), 0)), -self.p))
+
+    def sf(self, x):
+        return np.exp(special.xlog1py(np.floor(np.maximum(np.asarray(x, dtype=float), 0)), -self.p))
+
+    def ppf(self, q):
+        q = np.asarray(q, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            trials = np.ceil(np.log1p(-q) / np.log1p(-self.p))
+        return np.where(self.p == 1, 1.0, np.maximum(trials, 1.0))
+
+    def mean(self):
+        return 1.0 / self.p
+
+    def var(self):
+        return (1.0 - self.p) / self.p**2
+
+
+class Binomial(Distribution):
+    """
+    Number of successes in n independent trials with success probability p.
+
+    Formula: P(X = x) = nCx * p^x * q^(n-x)
+    """
+
+    discrete = True
+
+    def __init__(self, n, p):
+        self.n, self.p = _as_float(n, p)
+        _check((self.n >= 0) & (self.n == np.floor(self.n)),
+               "Number of trials (n) must be a non-negative integer.")
+        _check((self.p >= 0) & (self.p <= 1), "Probability must be between 0 and 1.")
+
+    def logpmf(self, x):
+        """
+        log P(X = x) via lgamma, so n in the millions costs the same as n = 10.
+        """
+        x = np.asarray(x, dtype=float)
+        valid = (x >= 0) & (x <= self.n) & (x == np.floor(x))
+        k = np.clip(x, 0, self.n)
+        log_comb = special.gammaln(self.n + 1) - special.gammaln(k + 1) - special.gammaln(self.n - k + 1)
+        log_pmf = log_comb + special.xlogy(k, self.p) + special.xlog1py(self.n - k, -self.p)
+        return np.where(valid, log_pmf, -np.inf)
+
+    def pmf(self, x):
+        return np.exp(self.logpmf(x))
+
+    def pmf_vector(self):
+        """
+        The whole PMF P(X = 0), ..., P(X = n) for scalar n and p.
+
+        Starts at the mode and walks outwards with the ratio
+        P(k+1) / P(k) = (n - k) / (k + 1) * p / q, so the largest terms are
+        computed first and the tails decay smoothly towards 0 without overflow.
+        The vector is renormalized to sum to 1.
+        """
+        if self.n.ndim or self.p.ndim:
+            raise ValueError("pmf_vector() needs scalar n and p.")
+        n, p = int(self.n), float(self.p)
+        if p in (0.0, 1.0):
+            result = np.zeros(n + 1)
+            result[0 if p == 0.0 else n] = 1.0
+            return result
+
+        mode = min(int((n + 1) * p), n)
+        odds = p / (1 - p)
+        up = np.arange(mode, n)  # k -> k + 1 for k = mode .. n - 1
+        down = np.arange(mode, 0, -1)  # k -> k - 1 for k = mode .. 1
+
+        result = np.empty(n + 1)
+        result[mode] = np.exp(self.logpmf(mode))
+        result[mode + 1:] = result[mode] * np.cumprod((n - up) / (up + 1) * odds)
+        result[:mode][::-1] = result[mode] * np.cumprod(down / (n - down + 1) / odds)
+        # lgamma loses ~1e-8 relative precision at the mode for huge n; the
+        # ratios themselves are accurate, so renormalizing removes that error
+        return result / result.sum()
+
+    def cdf(self, x):
+        """P(X <= x) = I_q(n - k, k + 1), the regularized incomplete beta function."""
+        k = np.floor(np.asarray(x, dtype=float))
+        kc = np.clip(k, 0, self.n - 1)
+        inside = special.betainc(np.maximum(self.n - kc, 1), kc + 1, 1 - self.p)
+        return np.where(k < 0, 0.0, np.where(k >= self.n, 1.0, inside))
+
+    def sf(self, x):
+        """P(X > x) = I_p(k + 1, n - k), accurate far into the upper tail."""
+        k = np.floor(np.asarray(x, dtype=float))
+        kc = np.clip(k, 0, self.n - 1)
+        inside = special.betainc(kc + 1, np.maximum(self.n - kc, 1), self.p)
+        return np.where(k < 0, 1.0, np.where(k >= self.n, 0.0, inside))
+
+    def ppf(self, q):
+        """Smallest integer k with cdf(k) >= q, found by vectorized bisection."""
+        q = np.asarray(q, dtype=float)
+        low = np.zeros(np.broadcast(q, self.n, self.p).shape)
+        high = np.broadcast_to(self.n, low.shape).copy()
+        while np.any(low < high):
+            mid = np.floor((low + high) / 2)
+            enough = self.cdf(mid) >= q
+            high = np.where(enough, mid, high)
+            low = np.where(enough, low, mid + 1)
+        return low
+
+    def mean(self):
+        return self.n * self.p
+
+    def var(self):
+        return self.n * self.p * (1.0 - self.p)
+
+
+# Exact rational arithmetic grows with n; beyond this use Binomial(n, p).pmf
+EXACT_BINOMIAL_MAX_TRIALS = 2_000
+
+
+def binomial_pmf_exact(n, p, x, max_trials=EXACT_BINOMIAL_MAX_TRIALS):
+    """
+    Exact binomial probability as a Fraction (opt-in, small n only).
+
+    Parameters:
+    - n: number of trials
+    - p: probability of success, anything Fraction() accepts (e.g. "1/2")
+    - x: number of successes
+    - max_trials: size guard; larger n raises ValueError because the
+      rationals grow to thousands of digits
+    """
+    a, b = _exact_success_ratio(n, p, max_trials)
+    if not 0 <= x <= n:
+        return Fraction(0)
+    # p = a/b, q = (b-a)/b: one integer product and a single normalization
+    return Fraction(binomial_coefficients(n)[x] * a**x * (b - a) ** (n - x), b**n)
+
+
+def binomial_pmf_exact_vector(n, p, max_trials=EXACT_BINOMIAL_MAX_TRIALS):
+    """
+    Exact P(X = 0), ..., P(X = n) as a list of Fractions.
+
+    Powers of p and q are built incrementally over a common denominator b^n.
+    """
+    a, b = _exact_success_ratio(n, p, max_trials)
+    coefficients = binomial_coefficients(n)
+    failure_powers = [1]
+    for _ in range(n):
+        failure_powers.append(failure_powers[-1] * (b - a))
+    denominator = b**n
+    result, success_power = [], 1
+    for k in range(n + 1):
+        result.append(Fraction(coefficients[k] * success_power * failure_powers[n - k], denominator))
+        success_power *= a
+    return result
+
+
+def _exact_success_ratio(n, p, max_trials):
+    """Validate the exact-path inputs and return p as (numerator, denominator)."""
+    p = Fraction(p)
+    if n > max_trials:
+        raise ValueError(f"n = {n} is too large for exact arithmetic (limit {max_trials}); "
+                         f"use Binomial(n, p).pmf instead.")
+    if not 0 <= p <= 1:
+        raise ValueError("Probability must be between 0 and 1.")
+    return p.numerator, p.denominator
+
+
+@lru_cache(maxsize=64)
+def binomial_coefficients(n):
+    """
+    Row n of Pascal's triangle as exact integers, cached across calls.
+
+    Built with the recurrence nC(k+1) = nCk * (n - k) / (k + 1).
+    """
+    row = [1]
+    for k in range(n):
+        row.append(row[-1] * (n - k) // (k + 1))
+    return tuple(row)
+
+
+class FDistribution(Distribution):
+    """
+    Fisher-Snedecor F distribution with d1 and d2 degrees of freedom.
+    """
+
+    def __init__(self, d1, d2):
+        self.d1, self.d2 = _as_float(d1, d2)
+        _check((self.d1 > 0) & (self.d2 > 0), "Degrees of freedom must be positive.")
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=float)
+        d1, d2 = self.d1, self.d2
+        xs = np.maximum(x, np.finfo(float).tiny)
+        log_pdf = (0.5 * (d1 * np.log(d1 * xs) + d2 * np.log(d2) - (d1 + d2) * np.log(d1 * xs + d2))
+                   - np.log(xs) - special.betaln(d1 / 2, d2 / 2))
+        return np.where(x > 0, np.exp(log_pdf), 0.0)
+
+    def cdf(self, x):
+        x = np.maximum(np.asarray(x, dtype=float), 0)
+        return special.betainc(self.d1 / 2, self.d2 / 2, self.d1 * x / (self.d1 * x + self.d2))
+
+    def sf(self, x):
+        x = np.maximum(np.asarray(x, dtype=float), 0)
+        return special.betainc(self.d2 / 2, self.d1 / 2, self.d2 / (self.d1 * x + self.d2))
+
+    def ppf(self, q):
+        b = special.betaincinv(self.d1 / 2, self.d2 / 2, np.asarray(q, dtype=float))
+        with np.errstate(divide="ignore"):
+            return self.d2 * b / (self.d1 * (1 - b))
+
+    def mean(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.d2 > 2, self.d2 / (self.d2 - 2), np.nan)
+
+    def var(self):
+        d1, d2 = self.d1, self.d2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = 2 * d2**2 * (d1 + d2 - 2) / (d1 * (d2 - 2) ** 2 * (d2 - 4))
+        return np.where(d2 > 4, value, np.where(d2 > 2, np.inf, np.nan))
+
+
+def f_statistic(sample1, variance_sample1, sample2, variance_sample2):
+    """
+    F statistic for two sample variances, larger variance in the numerator.
+
+    Works element-wise on arrays of sample sizes and variances.
+
+    Returns:
+    - (F, df1, df2) with df1 belonging to the larger variance
+    """
+    n1, v1, n2, v2 = _as_float(sample1, variance_sample1, sample2, variance_sample2)
+    _check((n1 > 1) & (n2 > 1), "Sample sizes must be greater than 1.")
+    swap = v1 < v2
+    numerator, denominator = np.where(swap, v2, v1), np.where(swap, v1, v2)
+    df1, df2 = np.where(swap, n2 - 1, n1 - 1), np.where(swap, n1 - 1, n2 - 1)
+    return numerator / denominator, df1, df2
+
+
+def density_interval_probability(pdf, a, b, order=32, panels=1):
+    """
+    P(a <= X <= b) for a user-supplied density over arrays of intervals.
+
+    Uses fixed-order Gauss-Legendre quadrature: the density is evaluated
+    once on an (intervals, panels * order) array of nodes, so `pdf` must
+    accept NumPy arrays. Raise `panels` for densities with sharp features.
+
+    Parameters:
+    - pdf: vectorized density function
+    - a, b: interval bounds (scalars or arrays, broadcast together)
+    - order: Gauss-Legendre nodes per panel
+    - panels: number of equal sub-intervals each interval is split into
+    """
+    a, b = np.broadcast_arrays(*_as_float(a, b))
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    edges = np.linspace(0.0, 1.0, panels + 1)
+    # Nodes on [0, 1] for every panel, flattened to shape (panels * order,)
+    half = (edges[1:] - edges[:-1])[:, None] / 2
+    unit_nodes = ((edges[:-1] + edges[1:])[:, None] / 2 + half * nodes).ravel()
+    unit_weights = (half * weights).ravel()
+
+    width = (b - a)[..., None]
+    values = pdf(a[..., None] + width * unit_nodes)
+    return np.where(b >= a, (values * unit_weights).sum(axis=-1) * width[..., 0], 0.0)
+
+
+def benchmark_interval_probability(n=10**6, quad_sample=2_000, seed=0):
+    """
+    Per-query cost of P(a <= X <= b) for n exponential intervals:
+    scipy quad (timed on a sample) vs vectorized quadrature vs closed form.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.uniform(0, 5, n)
+    b = a + rng.uniform(0, 5, n)
+    distribution = Exponential(0.7)
+
+    def scalar_pdf(x, rate):
+        return rate * np.exp(-rate * x)
+
+    start = time.perf_counter()
+    quad_values = [quad(scalar_pdf, lo, hi, args=(0.7,))[0] for lo, hi in zip(a[:quad_sample], b[:quad_sample])]
+    quad_time = (time.perf_counter() - start) / quad_sample
+
+    start = time.perf_counter()
+    gauss = density_interval_probability(distribution.pdf, a, b, order=16)
+    gauss_time = (time.perf_counter() - start) / n
+
+    start = time.perf_counter()
+    closed = distribution.interval_probability(a, b)
+    closed_time = (time.perf_counter() - start) / n
+
+    print(f"{n:,} exponential intervals (quad timed on {quad_sample:,})")
+    print(f"  scipy quad:           {quad_time * 1e9:12.1f} ns/query")
+    print(f"  Gauss-Legendre (16):  {gauss_time * 1e9:12.1f} ns/query"
+          f"  max |error| = {np.max(np.abs(gauss - closed)):.2e}")
+    print(f"  closed-form CDF:      {closed_time * 1e9:12.1f} ns/query"
+          f"  speedup vs quad = {quad_time / closed_time:,.0f}x"
+          f"  max |quad - closed| = {np.max(np.abs(np.array(quad_values) - closed[:quad_sample])):.2e}")
+
+
+if __name__ == "__main__":
+    x = np.linspace(-3, 3, 7)
+    print("Normal(0, 1) pdf:", Normal().pdf(x))
+    print("Exponential(mean=2) P(X <= 1):", Exponential.from_mean(2).cdf(1))
+    print("Binomial(10, 1/2) pmf:", Binomial(10, 0.5).pmf(np.arange(11)))
+    print("Binomial(10, 1/2) exact P(X = 3):", binomial_pmf_exact(10, "1/2", 3))
+    ab_test = Binomial(5_000_000, 0.031)
+    print("A/B test: P(X > 156,000) with n = 5,000,000:", ab_test.sf(156_000))
+    print("A/B test: sum of pmf_vector():", ab_test.pmf_vector().sum())
+    print("Geometric(p=[0.1, 0.5]) pmf at x=3:", Geometric([0.1, 0.5]).pmf(3))
+
+    # One million (x, parameter) pairs in a single call
+    rng = np.random.default_rng(0)
+    means, variances = rng.uniform(0, 10, 1_000_000), rng.uniform(1, 5, 1_000_000)
+    values = rng.uniform(0, 10, 1_000_000)
+    densities = Normal(means, variances).pdf(values)
+    print("1,000,000 normal densities, first five:", densities[:5])
+
+    print()
+    benchmark_interval_probability()
@@ -1,42 +1,369 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
-from itertools import product
+from scipy.signal import fftconvolve
+
+# Above this many output points np.convolve is slower than FFT convolution
+FFT_THRESHOLD = 500
+# Largest dense lattice pmf sum_distribution allocates before using the sparse path
+MAX_LATTICE_POINTS = 10_000_000
+
+
+def _population_histogram(population):
+    """
+    Collapse the population into its distinct values and their probabilities.
+
+    Returns:
+        tuple: (values, probabilities) as NumPy arrays.
+    """
+    values, counts = np.unique(np.asarray(population, dtype=float), return_counts=True)
+    return values, counts / counts.sum()
+
+
+def _lattice_step(values):
+    """
+    Return the lattice step of the values if they are all integers, else None.
+
+    Integer populations live on the grid min + step * k, which lets the sum
+    distribution be computed with plain array convolutions.
+    """
+    if not np.all(values == np.round(values)):
+        return None
+    offsets = (values - values[0]).astype(np.int64)
+    step = int(np.gcd.reduce(offsets)) if len(offsets) > 1 else 1
+    return max(step, 1)
+
+
+def _convolve(a, b):
+    """Convolve two probability vectors, via FFT once the output is long."""
+    if len(a) + len(b) - 1 > FFT_THRESHOLD:
+        result = fftconvolve(a, b)
+        # FFT round-off leaves noise of a few eps * max; drop it and renormalize
+        result[result < 32 * np.finfo(float).eps * result.max()] = 0.0
+        return result / result.sum()
+    return np.convolve(a, b)
+
+
+def _merge_totals(sums, weights, tolerance):
+    """Add up the weights of sorted neighbouring totals less than `tolerance` apart."""
+    order = np.argsort(sums, kind="stable")
+    sums, weights = sums[order], weights[order]
+    group = np.concatenate(([0], np.cumsum(np.diff(sums) > tolerance)))
+    starts = np.flatnonzero(np.diff(group, prepend=-1))
+    return sums[starts], np.bincount(group, weights=weights)
+
+
+def sum_distribution(population, sample_size, max_lattice_points=MAX_LATTICE_POINTS):
+    """
+    Exact distribution of the sample total for samples drawn with replacement.
+
+    For integer populations the value-count histogram is raised to the
+    n-th convolution power by repeated squaring (FFT convolution for long
+    vectors), so the N^n samples are never enumerated. Other populations,
+    and integer ones whose lattice would need more than
+    `max_lattice_points` entries (e.g. [0, 1, 1e9]), add one draw at a time
+    and merge totals that agree up to floating-point round-off.
+
+    Args:
+        population (array-like): Population values.
+        sample_size (int): Sample size n.
+        max_lattice_points (int): Largest dense lattice pmf to allocate.
+
+    Returns:
+        tuple: (totals, probabilities) as NumPy arrays sorted by total.
+    """
+    if sample_size < 1:
+        raise ValueError("Sample size must be at least 1.")
+    values, probs = _population_histogram(population)
+    if len(values) == 0:
+        raise ValueError("The population must not be empty.")
+    step = _lattice_step(values)
+    span = 0 if step is None else int(values[-1] - values[0]) // step
+
+    if step is not None and span * sample_size + 1 <= max_lattice_points:
+        # Integer population: convolution power of the pmf on the lattice
+        base = values[0]
+        pmf = np.zeros(span + 1)
+        pmf[((values - base) // step).astype(np.int64)] = probs
+        result, power, n = None, pmf, sample_size
+        while n:
+            if n & 1:
+                result = power if result is None else _convolve(result, power)
+            n >>= 1
+            if n:
+                power = _convolve(power, power)
+        totals = sample_size * base + step * np.arange(len(result))
+        keep = result > 0
+        return totals[keep], result[keep]
+
+    # Sparse path: add one draw at a time and merge equal totals
+    # Round-off in a sum of n draws is a few eps of the largest possible total
+    tolerance = 64 * np.finfo(float).eps * float(np.abs(values).max()) * sample_size
+    totals, result = _merge_totals(values, probs, tolerance)
+    for _ in range(sample_size - 1):
+        sums = (totals[:, None] + values[None, :]).ravel()
+        weights = (result[:, None] * probs[None, :]).ravel()
+        totals, result = _merge_totals(sums, weights, tolerance)
+    return totals, result
+
+
+def iter_sample_blocks(population, sample_size, chunk_size=65536):
+    """
+    Lazily yield every sample (with replacement) in NumPy blocks.
+
+    Rows come out in the same order as itertools.product(population, repeat=n).
+
+    Args:
+        population (array-like): Population values.
+        sample_size (int): Sample size n.
+        chunk_size (int): Maximum number of samples per block.
+
+    Yields:
+        tuple: (samples, totals, sample_means) where samples has shape (m, n).
+    """
+    population = np.asarray(population)
+    N = len(population)
+    k = N ** sample_size
+
+    for start in range(0, k, chunk_size):
+        index = np.arange(start, min(start + chunk_size, k), dtype=np.int64)
+        digits = np.empty((len(index), sample_size), dtype=np.int64)
+        # Mixed-radix decomposition: the last position varies fastest
+        for position in range(sample_size - 1, -1, -1):
+            digits[:, position] = index % N
+            index //= N
+        samples = population[digits]
+        totals = samples.sum(axis=1)
+        yield samples, totals, totals / sample_size
+
+
+def _combine_moments(count_a, mean_a, m2_a, count_b, mean_b, m2_b):
+    """Combine two (count, mean, M2) triples exactly (Chan et al. update)."""
+    total = count_a + count_b
+    if total == 0:
+        return 0, 0.0, 0.0
+    delta = mean_b - mean_a
+    mean = mean_a + delta * count_b / total
+    m2 = m2_a + m2_b + delta**2 * count_a * count_b / total
+    return total, mean, m2
 
-def sampling_dist(population, sample_size):
+
+def _merge_running_moments(count, mean, m2, batch):
+    """Fold a batch into a running (count, mean, M2) triple."""
+    if len(batch) == 0:
+        return count, mean, m2
+    batch_mean = batch.mean()
+    batch_m2 = ((batch - batch_mean) ** 2).sum()
+    return _combine_moments(count, mean, m2, len(batch), batch_mean, batch_m2)
+
+
+def _draw_sample_indices(rng, N, n, rows, replace):
+    """
+    Draw a (rows, n) matrix of population indices in one vectorized call.
+
+    Without replacement each row keeps the n smallest of N random keys,
+    which is a uniformly random n-subset in random order.
+    """
+    if replace:
+        return rng.integers(0, N, size=(rows, n))
+    keys = rng.random((rows, N))
+    subset = np.argpartition(keys, n - 1, axis=1)[:, :n]
+    return rng.permuted(subset, axis=1)
+
+
+def _monte_carlo_worker(population, n, reps, replace, seed_sequence, chunk_elements):
+    """
+    Simulate `reps` samples with one independent generator.
+
+    Returns:
+        tuple: (count, mean, M2, distinct sample means, their frequencies).
+    """
+    rng = np.random.default_rng(seed_sequence)
+    population = np.asarray(population, dtype=float)
+    N = len(population)
+    # Bound the index (and key) matrix to roughly `chunk_elements` entries
+    width = n if replace else N
+    rows_per_chunk = max(1, chunk_elements // width)
+
+    count, mean_, m2 = 0, 0.0, 0.0
+    means_seen, frequencies = [], []
+    for start in range(0, reps, rows_per_chunk):
+        rows = min(rows_per_chunk, reps - start)
+        indices = _draw_sample_indices(rng, N, n, rows, replace)
+        means = population[indices].sum(axis=1) / n
+        count, mean_, m2 = _merge_running_moments(count, mean_, m2, means)
+        values, counts = np.unique(means, return_counts=True)
+        means_seen.append(values)
+        frequencies.append(counts)
+
+    values, inverse = np.unique(np.concatenate(means_seen), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate(frequencies)).astype(np.int64)
+    return count, mean_, m2, values, counts
+
+
+def monte_carlo_sample_means(population, sample_size, reps=1_000_000, replace=True,
+                             seed=None, workers=1, chunk_elements=4_000_000):
+    """
+    Simulate the sampling distribution of the sample mean.
+
+    Args:
+        population (array-like): Population values.
+        sample_size (int): Sample size n.
+        reps (int): Number of simulated samples.
+        replace (bool): Sample with (True) or without (False) replacement.
+        seed (int or None): Seed for numpy.random.SeedSequence.
+        workers (int): Number of processes; each gets a spawned child seed,
+            so results are reproducible for a given seed and worker count.
+        chunk_elements (int): Maximum size of each random index/key matrix.
+
+    Returns:
+        tuple: (count, mean, M2, distinct sample means, their frequencies).
+    """
+    N = len(population)
+    if sample_size < 1:
+        raise ValueError("Sample size must be at least 1.")
+    if not replace and sample_size > N:
+        raise ValueError("Sample size cannot exceed the population size without replacement.")
+
+    workers = max(1, min(workers, reps))
+    children = np.random.SeedSequence(seed).spawn(workers)
+    shares = [reps // workers + (i < reps % workers) for i in range(workers)]
+    args = [(population, sample_size, share, replace, child, chunk_elements)
+            for share, child in zip(shares, children)]
+
+    if workers == 1:
+        results = [_monte_carlo_worker(*args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_monte_carlo_worker, *zip(*args)))
+
+    count, mean_, m2 = 0, 0.0, 0.0
+    for part_count, part_mean, part_m2, _, _ in results:
+        count, mean_, m2 = _combine_moments(count, mean_, m2, part_count, part_mean, part_m2)
+    values, inverse = np.unique(np.concatenate([r[3] for r in results]), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate([r[4] for r in results])).astype(np.int64)
+    return count, mean_, m2, values, counts
+
+
+def sampling_dist(population, sample_size, mode="table", chunk_size=65536,
+                  **monte_carlo_options):
+    """
+    Sampling distribution of the sample mean (sampling with replacement).
+
+    Args:
+        population (array-like): Population values.
+        sample_size (int): Sample size n.
+        mode (str): "table" materializes every sample (N^n rows, streamed in
+            blocks); "exact" returns one row per distinct sample mean with its
+            probability, computed by histogram convolution; "monte_carlo"
+            simulates `reps` samples and returns one row per observed sample
+            mean with its frequency and relative frequency.
+        chunk_size (int): Block size used by the "table" mode.
+        **monte_carlo_options: reps, replace, seed, workers and chunk_elements
+            for the "monte_carlo" mode (see monte_carlo_sample_means).
+
+    Returns:
+        tuple: (table, mean_of_sample_means, std_dev_of_sample_means). The
+        standard deviation uses ddof=1 over all N^n samples in the "table" and
+        "exact" modes, and over the simulated samples in "monte_carlo".
+    """
     N = len(population)  # Size of population
     n = sample_size  # Sample size
-    k = N ** n  # Total number of samples (with replacement)
+    if N == 0:
+        raise ValueError("The population must not be empty.")
+
+    if mode == "exact":
+        totals, probabilities = sum_distribution(population, n)
+        sample_means = totals / n
+        mean_of_sample_means = float(np.dot(probabilities, sample_means))
+        variance = float(np.dot(probabilities, (sample_means - mean_of_sample_means) ** 2))
+        # Match the sample (ddof=1) standard deviation over the N^n samples:
+        # k / (k - 1) = 1 / (1 - N^-n), kept in floats since N^n can overflow
+        variance = variance / (1 - float(N) ** -n) if N > 1 else float("nan")
+        table = pd.DataFrame({"SampleMean": sample_means, "Probability": probabilities})
+        return table, mean_of_sample_means, variance**0.5
+
+    if mode == "monte_carlo":
+        count, mean_, m2, sample_means, frequencies = monte_carlo_sample_means(
+            population, n, **monte_carlo_options
+        )
+        table = pd.DataFrame({
+            "SampleMean": sample_means,
+            "Frequency": frequencies,
+            "Probability": frequencies / count,
+        })
+        std_dev_of_sample_means = (m2 / (count - 1)) ** 0.5 if count > 1 else float("nan")
+        return table, mean_, std_dev_of_sample_means
+
+    if mode != "table":
+        raise ValueError(f"Unknown mode: {mode!r}")
+
+    frames = []
+    count, mean_, m2 = 0, 0.0, 0.0
+    for samples, totals, means in iter_sample_blocks(population, n, chunk_size):
+        frames.append(pd.DataFrame({
+            "Sample": list(map(tuple, samples.tolist())),
+            "Total": totals,
+            "SampleMean": means,
+        }))
+        count, mean_, m2 = _merge_running_moments(count, mean_, m2, means)
+
+    sample_mean_calculate_table = pd.concat(frames, ignore_index=True)
+    std_dev_of_sample_means = (m2 / (count - 1)) ** 0.5 if count > 1 else float("nan")
+
+    return sample_mean_calculate_table, mean_, std_dev_of_sample_means
 
-    # Create all possible samples of size `n` with replacement
-    samples = list(product(population, repeat=n))
 
-    # Collect rows in a list
-    rows = []
+def benchmark(population=range(1, 51), sample_size=8, reps=2_000_000, workers=2, seed=0):
+    """
+    Time the exact and Monte Carlo modes on the same problem and compare results.
+    """
+    population = list(population)
 
-    # Iterate through all samples to calculate the required values
-    for sample in samples:
-        total = sum(sample)  # Sum of the sample
-        sample_mean = total / n  # Mean of the sample
+    start = time.perf_counter()
+    _, exact_mean, exact_std = sampling_dist(population, sample_size, mode="exact")
+    exact_time = time.perf_counter() - start
+    print(f"exact:            {exact_time:8.3f} s  mean={exact_mean:.6f}  std={exact_std:.6f}")
 
-        # Append the results as a dictionary to the list
-        rows.append({"Sample": sample, "Total": total, "SampleMean": sample_mean})
+    for n_workers in sorted({1, workers}):
+        start = time.perf_counter()
+        _, mc_mean, mc_std = sampling_dist(population, sample_size, mode="monte_carlo",
+                                           reps=reps, seed=seed, workers=n_workers)
+        mc_time = time.perf_counter() - start
+        print(f"monte_carlo x{n_workers:<3d} {mc_time:8.3f} s  mean={mc_mean:.6f}  std={mc_std:.6f}"
+              f"  |mean err|={abs(mc_mean - exact_mean):.2e}  |std err|={abs(mc_std - exact_std):.2e}")
 
-    # Convert the list of dictionaries into a DataFrame
-    sample_mean_calculate_table = pd.DataFrame(rows)
 
-    # Calculate mean and standard deviation of sample means
-    sample_mean_values = sample_mean_calculate_table["SampleMean"]
-    mean_of_sample_means = sample_mean_values.mean()
-    std_dev_of_sample_means = sample_mean_values.std()
+if __name__ == "__main__":
+    # Example Usage
+    population = [3, 7, 11, 15]
+    sample_size = 2
+    result, mean_of_sample_means, std_dev_of_sample_means = sampling_dist(population, sample_size)
 
-    return sample_mean_calculate_table, mean_of_sample_means, std_dev_of_sample_means
+    # Display the results
+    print(result)
+    print("\nMean of Sample Means:", mean_of_sample_means)
+    print("Standard Deviation of Sample Means:", std_dev_of_sample_means)
 
+    # Exact distribution for a population far too large to enumerate (50^8 samples)
+    large_population = list(range(1, 51))
+    distribution, mean_of_sample_means, std_dev_of_sample_means = sampling_dist(
+        large_population, 8, mode="exact"
+    )
+    print("\nExact distribution of sample means (N = 50, n = 8):")
+    print(distribution)
+    print("Mean of Sample Means:", mean_of_sample_means)
+    print("Standard Deviation of Sample Means:", std_dev_of_sample_means)
 
-# Example Usage
-population = [3, 7, 11, 15]
-sample_size = 2
-result, mean_of_sample_means, std_dev_of_sample_means = sampling_dist(population, sample_size)
+    # Monte Carlo estimate, with and without replacement
+    _, mc_mean, mc_std = sampling_dist(large_population, 8, mode="monte_carlo",
+                                       reps=1_000_000, seed=42)
+    print("\nMonte Carlo (with replacement):    mean =", mc_mean, " std =", mc_std)
+    _, mc_mean, mc_std = sampling_dist(large_population, 8, mode="monte_carlo",
+                                       reps=1_000_000, replace=False, seed=42)
+    print("Monte Carlo (without replacement): mean =", mc_mean, " std =", mc_std)
 
-# Display the results
-print(result)
-print("\nMean of Sample Means:", mean_of_sample_means)
-print("Standard Deviation of Sample Means:", std_dev_of_sample_means)
+    print("\nBenchmark (exact vs Monte Carlo):")
+    benchmark()
@@ -16,8 +16,267 @@ This is a classic application of Bayes' Theorem in medical diagnostics.
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
 
+TestPosteriors = namedtuple("TestPosteriors", ["ppv", "npv", "p_test_positive"])
+
+
+def _log1mexp(log_x):
+    """Stable log(1 - exp(log_x)) for log_x <= 0."""
+    log_x = np.asarray(log_x, dtype=float)
+    return np.where(log_x > -np.log(2), np.log(-np.expm1(log_x)), np.log1p(-np.exp(log_x)))
+
+
+def bayes_posteriors(disease_prevalence, false_positive_rate, false_negative_rate,
+                     log_prevalence=False, return_log=False):
+    """
+    Vectorized posteriors for a single binary test, without printing.
+
+    All three parameters may be scalars or NumPy arrays; they are broadcast
+    against each other, e.g. one prevalence per patient with a shared test.
+
+    Parameters:
+    - disease_prevalence: P(Disease), or log P(Disease) if log_prevalence=True
+    - false_positive_rate: P(Test+|Healthy)
+    - false_negative_rate: P(Test-|Disease)
+    - log_prevalence: the prevalence is given as a natural log, for diseases so
+      rare that the probability itself would underflow
+    - return_log: return natural logs of the results
+
+    The computation runs in log space (log-sum-exp for the normalizers), so
+    tiny prevalences do not lose precision.
+
+    Returns:
+    - TestPosteriors(ppv, npv, p_test_positive) where
+      ppv = P(Disease|Test+), npv = P(Healthy|Test-), p_test_positive = P(Test+)
+    """
+    with np.errstate(divide="ignore"):
+        if log_prevalence:
+            log_prev = np.asarray(disease_prevalence, dtype=float)
+            log_healthy = _log1mexp(log_prev)
+        else:
+            prev = np.asarray(disease_prevalence, dtype=float)
+            log_prev, log_healthy = np.log(prev), np.log1p(-prev)
+
+        fpr = np.asarray(false_positive_rate, dtype=float)
+        fnr = np.asarray(false_negative_rate, dtype=float)
+        log_sens, log_spec = np.log1p(-fnr), np.log1p(-fpr)
+        log_fpr, log_fnr = np.log(fpr), np.log(fnr)
+
+        # Joint log-probabilities of (disease status, test result)
+        log_true_pos = log_sens + log_prev
+        log_false_pos = log_fpr + log_healthy
+        log_true_neg = log_spec + log_healthy
+        log_false_neg = log_fnr + log_prev
+
+        log_p_test_positive = np.logaddexp(log_true_pos, log_false_pos)
+        log_ppv = log_true_pos - log_p_test_positive
+        log_npv = log_true_neg - np.logaddexp(log_true_neg, log_false_neg)
+
+    if return_log:
+        return TestPosteriors(log_ppv, log_npv, log_p_test_positive)
+    return TestPosteriors(np.exp(log_ppv), np.exp(log_npv), np.exp(log_p_test_positive))
+
+
+def _test_log_likelihood_ratios(sensitivities, specificities):
+    """Per-test log LR+ = log(sens / (1 - spec)) and log LR- = log((1 - sens) / spec)."""
+    sens = np.asarray(sensitivities, dtype=float)
+    spec = np.asarray(specificities, dtype=float)
+    with np.errstate(divide="ignore"):
+        log_lr_positive = np.log(sens) - np.log1p(-spec)
+        log_lr_negative = np.log1p(-sens) - np.log(spec)
+    return log_lr_positive, log_lr_negative
+
+
+def _update_log_odds(results, log_prior_odds, log_lr_positive, log_lr_negative):
+    """Apply every test in a (patients, tests) block of results; -1 marks a test not taken."""
+    results = np.asarray(results)
+    evidence = np.where(results == 1, log_lr_positive,
+                        np.where(results == 0, log_lr_negative, 0.0))
+    return log_prior_odds + evidence.sum(axis=1)
+
+
+def _log_odds_to_probability(log_odds):
+    """Numerically stable logistic function."""
+    return np.exp(-np.logaddexp(0.0, -log_odds))
+
+
+def sequential_posteriors(results, sensitivities, specificities, prior,
+                          chunk_size=1_000_000, return_log_odds=False):
+    """
+    Posterior P(Disease) after a chain of tests, updated in log-odds space.
+
+    Each test multiplies the odds by its likelihood ratio:
+    LR+ = sensitivity / (1 - specificity) for a positive result and
+    LR- = (1 - sensitivity) / specificity for a negative one.
+
+    Parameters:
+    - results: (patients, tests) array of 1 (positive), 0 (negative) or -1
+      (not taken), or an iterable of such blocks for streamed records; a
+      streamed block may also be a (results, prior) pair with per-patient priors
+    - sensitivities, specificities: one value per test (column)
+    - prior: P(Disease), a scalar or one value per patient
+    - chunk_size: rows processed at a time when results is a single array
+    - return_log_odds: return posterior log-odds instead of probabilities
+
+    Returns:
+    - NumPy array with one posterior per patient
+    """
+    log_lr_positive, log_lr_negative = _test_log_likelihood_ratios(sensitivities, specificities)
+
+    def log_odds(p):
+        p = np.asarray(p, dtype=float)
+        with np.errstate(divide="ignore"):
+            return np.log(p) - np.log1p(-p)
+
+    if isinstance(results, np.ndarray):
+        prior_log_odds = log_odds(prior)
+        output = np.empty(len(results))
+        for start in range(0, len(results), chunk_size):
+            stop = start + chunk_size
+            block_prior = prior_log_odds if prior_log_odds.ndim == 0 else prior_log_odds[start:stop]
+            output[start:stop] = _update_log_odds(results[start:stop], block_prior,
+                                                  log_lr_positive, log_lr_negative)
+    else:
+        blocks = []
+        for block in results:
+            block_prior = prior
+            if isinstance(block, tuple):
+                block, block_prior = block
+            blocks.append(_update_log_odds(block, log_odds(block_prior),
+                                           log_lr_positive, log_lr_negative))
+        output = np.concatenate(blocks) if blocks else np.empty(0)
+
+    return output if return_log_odds else _log_odds_to_probability(output)
+
+
+def _sequential_file_worker(results_path, output_path, start, stop, sensitivities,
+                            specificities, prior, chunk_size):
+    results = np.load(results_path, mmap_mode="r")
+    output = np.load(output_path, mmap_mode="r+")
+    for block_start in range(start, stop, chunk_size):
+        block_stop = min(block_start + chunk_size, stop)
+        output[block_start:block_stop] = sequential_posteriors(
+            np.asarray(results[block_start:block_stop]), sensitivities, specificities,
+            prior, chunk_size=chunk_size,
+        )
+    output.flush()
+    return stop - start
+
+
+def sequential_posteriors_from_file(results_path, output_path, sensitivities, specificities,
+                                    prior, workers=4, chunk_size=1_000_000):
+    """
+    Sequential posteriors for a .npy results matrix that may not fit in RAM.
+
+    The (patients, tests) matrix is memory-mapped and split into row ranges
+    processed by a process pool; each worker writes its posteriors straight
+    into a memory-mapped .npy output file.
+
+    Parameters:
+    - results_path: .npy file of test results (1 / 0 / -1, e.g. int8)
+    - output_path: .npy file to create for the float64 posteriors
+    - prior: scalar P(Disease) shared by all patients
+    - see sequential_posteriors() for the other parameters
+
+    Returns:
+    - the posteriors as a read-only memory-mapped array
+    """
+    patients = np.load(results_path, mmap_mode="r").shape[0]
+    np.lib.format.open_memmap(output_path, mode="w+", dtype=np.float64, shape=(patients,)).flush()
+
+    bounds = np.linspace(0, patients, max(1, workers) + 1).astype(int)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_sequential_file_worker, results_path, output_path, start, stop,
+                               sensitivities, specificities, prior, chunk_size)
+                   for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        for future in futures:
+            future.result()
+
+    return np.load(output_path, mmap_mode="r")
+
+
+def plot_bayes_results(data):
+    """
+    Build the 2x2 Bayesian analysis figure from BayesianMedicalTest.visualization_data()
+    and return it; module-level so it can be rendered in a worker process.
+    """
+    prior, posterior = data['prior'], data['posterior']
+
+    # Create visualization
+    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+
+    # 1. Prior vs Posterior Probability
+    categories = ['Prior P(Disease)', 'Posterior P(Disease|Test+)']
+    probabilities = [prior, posterior]
+    colors = ['lightblue', 'darkred']
+
+    bars = axes[0,0].bar(categories, probabilities, color=colors, alpha=0.7, edgecolor='black')
+    axes[0,0].set_title('Prior vs Posterior Probability', fontsize=14, fontweight='bold')
+    axes[0,0].set_ylabel('Probability')
+    axes[0,0].grid(True, alpha=0.3)
+
+    # Add value labels on bars
+    for bar, prob in zip(bars, probabilities):
+        height = bar.get_height()
+        axes[0,0].text(bar.get_x() + bar.get_width()/2., height + 0.001,
+                     f'{prob:.4%}', ha='center', va='bottom', fontweight='bold')
+
+    # 2. Test Performance Metrics
+    metrics = ['Sensitivity\n(True Positive Rate)', 'Specificity\n(True Negative Rate)',
+              'False Positive Rate', 'False Negative Rate']
+    values = data['rates']
+    colors = ['green', 'green', 'red', 'red']
+
+    bars = axes[0,1].bar(metrics, values, color=colors, alpha=0.7, edgecolor='black')
+    axes[0,1].set_title('Test Performance Metrics', fontsize=14, fontweight='bold')
+    axes[0,1].set_ylabel('Rate')
+    axes[0,1].tick_params(axis='x', rotation=45)
+    axes[0,1].grid(True, alpha=0.3)
+
+    # Add value labels
+    for bar, val in zip(bars, values):
+        height = bar.get_height()
+        axes[0,1].text(bar.get_x() + bar.get_width()/2., height + 0.01,
+                     f'{val:.1%}', ha='center', va='bottom', fontweight='bold')
+
+    # 3. Population Breakdown (pie chart)
+    tp, fp = data['true_positives'], data['false_positives']
+
+    # Focus on positive tests
+    positive_breakdown = [tp, fp]
+    positive_labels = [f'True Positives\n{tp:,}', f'False Positives\n{fp:,}']
+    colors_pie = ['lightgreen', 'lightcoral']
+
+    wedges, texts, autotexts = axes[1,0].pie(positive_breakdown, labels=positive_labels,
+                                            colors=colors_pie, autopct='%1.1f%%',
+                                            startangle=90, explode=(0.1, 0))
+    axes[1,0].set_title('Breakdown of Positive Tests\n(Out of 100,000 people)',
+                       fontsize=14, fontweight='bold')
+
+    # 4. Effect of Disease Prevalence
+    prevalences, posterior_probs = data['prevalences'], data['prevalence_posteriors']
+
+    axes[1,1].semilogx(prevalences * 100, posterior_probs * 100,
+                      'b-', linewidth=2, label='P(Disease|Test+)')
+    axes[1,1].axvline(prior * 100, color='red', linestyle='--',
+                     linewidth=2, label=f'Current prevalence: {prior:.1%}')
+    axes[1,1].axhline(posterior * 100, color='red', linestyle=':',
+                     linewidth=2, label=f'Current posterior: {posterior:.2%}')
+    axes[1,1].set_xlabel('Disease Prevalence (%)')
+    axes[1,1].set_ylabel('P(Disease|Test+) (%)')
+    axes[1,1].set_title('Effect of Disease Prevalence on Posterior Probability',
+                       fontsize=14, fontweight='bold')
+    axes[1,1].grid(True, alpha=0.3)
+    axes[1,1].legend()
+
+    plt.tight_layout()
+
+    return fig
+
+
 class BayesianMedicalTest:
     def __init__(self, disease_prevalence, false_positive_rate, false_negative_rate):
         """
@@ -37,6 +296,18 @@ class BayesianMedicalTest:
         self.true_positive_rate = 1 - false_negative_rate  # Sensitivity
         self.true_negative_rate = 1 - false_positive_rate  # Specificity
 
+    def posteriors(self, disease_prevalence=None, false_positive_rate=None, false_negative_rate=None):
+        """
+        Print-free batch posteriors; any parameter left as None uses this test's value.
+
+        See bayes_posteriors() for the broadcasting rules and return value.
+        """
+        return bayes_posteriors(
+            self.disease_prevalence if disease_prevalence is None else disease_prevalence,
+            self.false_positive_rate if false_positive_rate is None else false_positive_rate,
+            self.false_negative_rate if false_negative_rate is None else false_negative_rate,
+        )
+
     def calculate_bayes_probability(self):
         """
         Calculate P(Disease|Test+) using Bayes' Theorem
@@ -71,7 +342,8 @@ class BayesianMedicalTest:
 
         prob_test_positive_given_disease = self.true_positive_rate * self.disease_prevalence
         prob_test_positive_given_healthy = self.false_positive_rate * self.healthy_rate
-        prob_test_positive = prob_test_positive_given_disease + prob_test_positive_given_healthy
+        result = self.posteriors()
+        prob_test_positive = float(result.p_test_positive)
 
         print(f"P(Test+) = {self.true_positive_rate:.4f} × {self.disease_prevalence:.4f} + {self.false_positive_rate:.4f} × {self.healthy_rate:.4f}")
         print(f"P(Test+) = {prob_test_positive_given_disease:.6f} + {prob_test_positive_given_healthy:.6f}")
@@ -81,7 +353,7 @@ class BayesianMedicalTest:
         print("\nStep 2: Apply Bayes' Theorem")
         print("P(Disease|Test+) = P(Test+|Disease) × P(Disease) / P(Test+)")
 
-        prob_disease_given_positive = (self.true_positive_rate * self.disease_prevalence) / prob_test_positive
+        prob_disease_given_positive = float(result.ppv)
 
         print(f"P(Disease|Test+) = {self.true_positive_rate:.4f} × {self.disease_prevalence:.4f} / {prob_test_positive:.6f}")
         print(f"P(Disease|Test+) = {prob_test_positive_given_disease:.6f} / {prob_test_positive:.6f}")
@@ -96,14 +368,10 @@ class BayesianMedicalTest:
 
         return prob_disease_given_positive, prob_test_positive
 
-    def create_contingency_table(self, population_size=100000):
+    def contingency_counts(self, population_size=100000):
         """
-        Create a contingency table to visualize the problem
+        Print-free (true_positives, false_positives, false_negatives, true_negatives)
         """
-        print(f"\n" + "="*60)
-        print(f"CONTINGENCY TABLE (Population: {population_size:,})")
-        print("="*60)
-
         # Calculate actual numbers
         diseased_population = int(population_size * self.disease_prevalence)
         healthy_population = population_size - diseased_population
@@ -118,6 +386,21 @@ class BayesianMedicalTest:
         # True negatives: healthy people who test negative
         true_negatives = healthy_population - false_positives
 
+        return true_positives, false_positives, false_negatives, true_negatives
+
+    def create_contingency_table(self, population_size=100000):
+        """
+        Create a contingency table to visualize the problem
+        """
+        print(f"\n" + "="*60)
+        print(f"CONTINGENCY TABLE (Population: {population_size:,})")
+        print("="*60)
+
+        true_positives, false_positives, false_negatives, true_negatives = \
+            self.contingency_counts(population_size)
+        diseased_population = true_positives + false_negatives
+        healthy_population = false_positives + true_negatives
+
         # Total positives and negatives
         total_positives = true_positives + false_positives
         total_negatives = false_negatives + true_negatives
@@ -136,89 +419,28 @@ class BayesianMedicalTest:
 
         return true_positives, false_positives, false_negatives, true_negatives
 
+    def visualization_data(self):
+        """
+        Print-free inputs for plot_bayes_results(), computed up front
+        """
+        tp, fp, _, _ = self.contingency_counts(100000)
+        prevalences = np.logspace(-4, -1, 50)  # From 0.01% to 10%
+        return {
+            'prior': self.disease_prevalence,
+            'posterior': float(self.posteriors().ppv),
+            'rates': [self.true_positive_rate, self.true_negative_rate,
+                      self.false_positive_rate, self.false_negative_rate],
+            'true_positives': tp,
+            'false_positives': fp,
+            'prevalences': prevalences,
+            'prevalence_posteriors': self.posteriors(disease_prevalence=prevalences).ppv,
+        }
+
     def visualize_results(self):
         """
         Create visualizations to illustrate the Bayesian analysis
         """
-        # Calculate probabilities
-        prob_disease_given_positive, prob_test_positive = self.calculate_bayes_probability()
-
-        # Create visualization
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-
-        # 1. Prior vs Posterior Probability
-        categories = ['Prior P(Disease)', 'Posterior P(Disease|Test+)']
-        probabilities = [self.disease_prevalence, prob_disease_given_positive]
-        colors = ['lightblue', 'darkred']
-
-        bars = axes[0,0].bar(categories, probabilities, color=colors, alpha=0.7, edgecolor='black')
-        axes[0,0].set_title('Prior vs Posterior Probability', fontsize=14, fontweight='bold')
-        axes[0,0].set_ylabel('Probability')
-        axes[0,0].grid(True, alpha=0.3)
-
-        # Add value labels on bars
-        for bar, prob in zip(bars, probabilities):
-            height = bar.get_height()
-            axes[0,0].text(bar.get_x() + bar.get_width()/2., height + 0.001,
-                         f'{prob:.4%}', ha='center', va='bottom', fontweight='bold')
-
-        # 2. Test Performance Metrics
-        metrics = ['Sensitivity\n(True Positive Rate)', 'Specificity\n(True Negative Rate)',
-                  'False Positive Rate', 'False Negative Rate']
-        values = [self.true_positive_rate, self.true_negative_rate,
-                 self.false_positive_rate, self.false_negative_rate]
-        colors = ['green', 'green', 'red', 'red']
-
-        bars = axes[0,1].bar(metrics, values, color=colors, alpha=0.7, edgecolor='black')
-        axes[0,1].set_title('Test Performance Metrics', fontsize=14, fontweight='bold')
-        axes[0,1].set_ylabel('Rate')
-        axes[0,1].tick_params(axis='x', rotation=45)
-        axes[0,1].grid(True, alpha=0.3)
-
-        # Add value labels
-        for bar, val in zip(bars, values):
-            height = bar.get_height()
-            axes[0,1].text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                         f'{val:.1%}', ha='center', va='bottom', fontweight='bold')
-
-        # 3. Population Breakdown (pie chart)
-        tp, fp, fn, tn = self.create_contingency_table(100000)
-
-        # Focus on positive tests
-        positive_breakdown = [tp, fp]
-        positive_labels = [f'True Positives\n{tp:,}', f'False Positives\n{fp:,}']
-        colors_pie = ['lightgreen', 'lightcoral']
-
-        wedges, texts, autotexts = axes[1,0].pie(positive_breakdown, labels=positive_labels,
-                                                colors=colors_pie, autopct='%1.1f%%',
-                                                startangle=90, explode=(0.1, 0))
-        axes[1,0].set_title('Breakdown of Positive Tests\n(Out of 100,000 people)',
-                           fontsize=14, fontweight='bold')
-
-        # 4. Effect of Disease Prevalence
-        prevalences = np.logspace(-4, -1, 50)  # From 0.01% to 10%
-        posterior_probs = []
-
-        for prev in prevalences:
-            # Calculate posterior for each prevalence
-            prob_pos = self.true_positive_rate * prev + self.false_positive_rate * (1 - prev)
-            posterior = (self.true_positive_rate * prev) / prob_pos
-            posterior_probs.append(posterior)
-
-        axes[1,1].semilogx(prevalences * 100, np.array(posterior_probs) * 100,
-                          'b-', linewidth=2, label='P(Disease|Test+)')
-        axes[1,1].axvline(self.disease_prevalence * 100, color='red', linestyle='--',
-                         linewidth=2, label=f'Current prevalence: {self.disease_prevalence:.1%}')
-        axes[1,1].axhline(prob_disease_given_positive * 100, color='red', linestyle=':',
-                         linewidth=2, label=f'Current posterior: {prob_disease_given_positive:.2%}')
-        axes[1,1].set_xlabel('Disease Prevalence (%)')
-        axes[1,1].set_ylabel('P(Disease|Test+) (%)')
-        axes[1,1].set_title('Effect of Disease Prevalence on Posterior Probability',
-                           fontsize=14, fontweight='bold')
-        axes[1,1].grid(True, alpha=0.3)
-        axes[1,1].legend()
-
-        plt.tight_layout()
+        plot_bayes_results(self.visualization_data())
         plt.show()
 
     def sensitivity_analysis(self):
@@ -230,18 +452,17 @@ class BayesianMedicalTest:
         print("="*60)
 
         # Vary false positive rates
-        false_pos_rates = [0.001, 0.005, 0.01, 0.02, 0.05, 0.1]
+        false_pos_rates = np.array([0.001, 0.005, 0.01, 0.02, 0.05, 0.1])
+        posteriors = self.posteriors(false_positive_rate=false_pos_rates).ppv
 
         print("Effect of False Positive Rate on Posterior Probability:")
         print("False Positive Rate | P(Disease|Test+)")
         print("-" * 40)
 
-        for fpr in false_pos_rates:
-            prob_pos = self.true_positive_rate * self.disease_prevalence + fpr * self.healthy_rate
-            posterior = (self.true_positive_rate * self.disease_prevalence) / prob_pos
+        for fpr, posterior in zip(false_pos_rates, posteriors):
             print(f"{fpr:15.1%} | {posterior:12.4%}")
 
-        print(f"\nCurrent test (FPR = {self.false_positive_rate:.1%}): {self.calculate_bayes_probability()[0]:.4%}")
+        print(f"\nCurrent test (FPR = {self.false_positive_rate:.1%}): {float(self.posteriors().ppv):.4%}")
 
 def main():
     """
@@ -269,6 +490,21 @@ def main():
     # Perform sensitivity analysis
     medical_test.sensitivity_analysis()
 
+    # Chain the screening test with a confirmation test (0.1% FPR, 2% FNR)
+    print("\n" + "="*60)
+    print("SEQUENTIAL TESTING (screening, then confirmation)")
+    print("="*60)
+    outcomes = np.array([[1, -1], [1, 1], [1, 0], [0, -1]])
+    posteriors = sequential_posteriors(
+        outcomes,
+        sensitivities=[medical_test.true_positive_rate, 0.98],
+        specificities=[medical_test.true_negative_rate, 0.999],
+        prior=medical_test.disease_prevalence,
+    )
+    labels = {1: "+", 0: "-", -1: "not taken"}
+    for (screen, confirm), posterior in zip(outcomes, posteriors):
+        print(f"Screening {labels[screen]:>9} | Confirmation {labels[confirm]:>9} | P(Disease) = {posterior:.4%}")
+
     # Create visualizations
     medical_test.visualize_results()
 
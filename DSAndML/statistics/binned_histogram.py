@@ -0,0 +1,195 @@
+"""
+Pre-binned histogram engine for very large arrays.
+
+histogram_central_tendency_PR01.py hands the raw data to plt.hist and
+statistics.mean/median, which iterate Python floats and sort the whole
+array. BinnedHistogram instead streams the data in chunks through
+np.histogram on fixed equal-width bins (the input can be a memory-mapped
+.npy file), keeps the exact count, mean and centered sum of squares (merged
+with the Chan et al. update, as in moments.py), and derives the
+median and other quantiles by interpolating inside the bin that holds the
+requested rank. Only the bin counts reach the plotting layer.
+
+The quantile error is at most one bin width; the mean and standard
+deviation are computed from the raw values and are not affected by binning.
+"""
+
+import time
+
+import numpy as np
+
+DEFAULT_CHUNK = 1 << 22
+
+
+def _chunks(data, chunk_size):
+    for start in range(0, len(data), chunk_size):
+        yield np.asarray(data[start:start + chunk_size]).ravel()
+
+
+class BinnedHistogram:
+    """
+    Equal-width histogram over [low, high] with exact running moments.
+
+    Values outside the range are counted in `below` / `above` and still
+    contribute to the mean and standard deviation.
+    """
+
+    def __init__(self, low, high, bins=1000):
+        if not high > low:
+            raise ValueError("high must be greater than low.")
+        if bins < 1:
+            raise ValueError("bins must be at least 1.")
+        self.low, self.high, self.bins = float(low), float(high), int(bins)
+        self.edges = np.linspace(self.low, self.high, self.bins + 1)
+        self.counts = np.zeros(self.bins, dtype=np.int64)
+        self.below = self.above = 0
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0  # sum of squared deviations from the mean
+
+    @classmethod
+    def from_array(cls, data, bins=1000, range=None, chunk_size=DEFAULT_CHUNK):
+        """
+        Bin an array (or memmap) chunk by chunk.
+
+        If `range` is None, a first chunked pass finds the minimum and maximum.
+        """
+        if range is None:
+            low, high = np.inf, -np.inf
+            for chunk in _chunks(data, chunk_size):
+                low, high = min(low, chunk.min()), max(high, chunk.max())
+            if low == high:
+                low, high = low - 0.5, high + 0.5
+            range = (low, high)
+        histogram = cls(range[0], range[1], bins)
+        for chunk in _chunks(data, chunk_size):
+            histogram.update(chunk)
+        return histogram
+
+    @classmethod
+    def from_file(cls, path, bins=1000, range=None, chunk_size=DEFAULT_CHUNK):
+        """Bin a .npy file through a read-only memory map."""
+        return cls.from_array(np.load(path, mmap_mode="r"), bins=bins, range=range, chunk_size=chunk_size)
+
+    def update(self, values):
+        """
+        Add a chunk of values.
+
+        Returns self so calls can be chained.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return self
+        counts, _ = np.histogram(values, bins=self.bins, range=(self.low, self.high))
+        self.counts += counts
+        self.below += int(np.count_nonzero(values < self.low))
+        self.above += int(np.count_nonzero(values > self.high))
+        mean = float(values.mean())
+        deviation = values - mean
+        self._merge_moments(values.size, mean, float(np.dot(deviation, deviation)))
+        return self
+
+    def _merge_moments(self, n, mean, M2):
+        total = self.n + n
+        delta = mean - self.mean
+        self.M2 += M2 + delta * delta * self.n * n / total
+        self.mean += delta * n / total
+        self.n = total
+
+    def merge(self, other):
+        """
+        Merge a histogram built with the same bins (e.g. on another shard).
+
+        Returns self so calls can be chained.
+        """
+        if (self.low, self.high, self.bins) != (other.low, other.high, other.bins):
+            raise ValueError("Histograms must share the same range and number of bins.")
+        self.counts += other.counts
+        self.below += other.below
+        self.above += other.above
+        if other.n:
+            self._merge_moments(other.n, other.mean, other.M2)
+        return self
+
+    @property
+    def std(self):
+        """Sample standard deviation (ddof=1); nan for fewer than two values."""
+        if self.n < 2:
+            return float("nan")
+        return (self.M2 / (self.n - 1)) ** 0.5
+
+    def quantiles(self, q):
+        """
+        Approximate quantiles by linear interpolation inside the bin holding
+        rank q * n. Ranks falling among out-of-range values clip to the edges.
+        """
+        q = np.asarray(q, dtype=float)
+        if np.any((q < 0) | (q > 1)):
+            raise ValueError("Quantiles must be in the range [0, 1].")
+        cumulative = self.below + np.concatenate(([0], np.cumsum(self.counts)))
+        rank = q * self.n
+        # First bin whose upper cumulative count reaches the rank
+        index = np.clip(np.searchsorted(cumulative, rank, side="left") - 1, 0, self.bins - 1)
+        inside = self.counts[index]
+        fraction = np.divide(rank - cumulative[index], inside,
+                             out=np.zeros_like(rank), where=inside > 0)
+        width = self.edges[1] - self.edges[0]
+        return self.edges[index] + np.clip(fraction, 0, 1) * width
+
+    @property
+    def median(self):
+        return float(self.quantiles(0.5))
+
+    @property
+    def modal_bin(self):
+        """(left edge, right edge, count) of the fullest bin (first one on ties)."""
+        i = int(np.argmax(self.counts))
+        return float(self.edges[i]), float(self.edges[i + 1]), int(self.counts[i])
+
+    def plot(self, ax=None, **kwargs):
+        """Draw the counts with Axes.stairs; no raw data is passed to Matplotlib."""
+        import matplotlib.pyplot as plt
+
+        ax = plt.gca() if ax is None else ax
+        kwargs.setdefault("fill", True)
+        return ax.stairs(self.counts, self.edges, **kwargs)
+
+    def __repr__(self):
+        return (f"BinnedHistogram(n={self.n}, bins={self.bins}, "
+                f"range=({self.low:.6g}, {self.high:.6g}), mean={self.mean:.6g})")
+
+
+def benchmark(size=10**7, bins=2000, seed=0):
+    """Compare the binned median and mean with NumPy's exact ones."""
+    data = np.random.default_rng(seed).exponential(2, size)
+
+    start = time.perf_counter()
+    histogram = BinnedHistogram.from_array(data, bins=bins)
+    binned_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exact_mean, exact_median = data.mean(), np.median(data)
+    exact_time = time.perf_counter() - start
+
+    width = histogram.edges[1] - histogram.edges[0]
+    print(f"{size:,} exponential values, {bins} bins (width {width:.4g})")
+    print(f"  binned: {binned_time:.3f} s  mean={histogram.mean:.6f}  median={histogram.median:.6f}")
+    print(f"  exact:  {exact_time:.3f} s  mean={exact_mean:.6f}  median={exact_median:.6f}")
+    print(f"  modal bin: {histogram.modal_bin}")
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    benchmark()
+
+    # Memory-mapped input, binned in two shards and merged
+    path = os.path.join(tempfile.mkdtemp(), "normal.npy")
+    np.save(path, np.random.default_rng(1).normal(50, 15, 5_000_000))
+    data = np.load(path, mmap_mode="r")
+    half = len(data) // 2
+    left = BinnedHistogram.from_array(data[:half], bins=500, range=(0, 100))
+    right = BinnedHistogram.from_array(data[half:], bins=500, range=(0, 100))
+    merged = left.merge(right)
+    print(merged, "median ≈", round(merged.median, 3), "out of range:", merged.below + merged.above)
@@ -0,0 +1,161 @@
+"""
+Discrete random variables backed by NumPy arrays.
+
+measureOfCentralTendencyforPD.py walks a probability list twice in Python
+and assumes the outcomes are 1, 2, ..., n. DiscreteRV stores an explicit
+support and probability vector, computes all moments from one matrix
+product, and adds independent variables by convolution (FFT-based once the
+supports get large), e.g. the sum of several dice.
+"""
+
+import numpy as np
+from scipy.signal import fftconvolve
+
+# Above this many output points np.convolve is slower than FFT convolution
+FFT_THRESHOLD = 500
+# Largest dense lattice vector __add__ allocates before summing support pairs instead
+MAX_LATTICE_POINTS = 10_000_000
+
+
+def _lattice(support):
+    """(start, step) if the support lies on an integer lattice, else None."""
+    if not np.all(support == np.round(support)):
+        return None
+    offsets = (support - support[0]).astype(np.int64)
+    step = int(np.gcd.reduce(offsets)) if len(offsets) > 1 else 1
+    return support[0], max(step, 1)
+
+
+def _convolve(a, b):
+    if len(a) + len(b) - 1 > FFT_THRESHOLD:
+        # FFT round-off leaves noise (also negative) of a few eps * max; zero
+        # it so it does not turn into spurious support points
+        result = fftconvolve(a, b)
+        result[result < 32 * np.finfo(float).eps * result.max()] = 0.0
+        return result
+    return np.convolve(a, b)
+
+
+class DiscreteRV:
+    """
+    Discrete random variable with finite support.
+
+    Parameters:
+    - support: outcomes (any order; duplicates are merged)
+    - probabilities: P(X = outcome), must sum to 1 within `tol`
+    """
+
+    def __init__(self, support, probabilities, tol=1e-9):
+        support = np.asarray(support, dtype=float).ravel()
+        probabilities = np.asarray(probabilities, dtype=float).ravel()
+        if support.shape != probabilities.shape or support.size == 0:
+            raise ValueError("support and probabilities must be non-empty and of equal length.")
+        if np.any(probabilities < 0):
+            raise ValueError("Probabilities must be non-negative.")
+        if abs(probabilities.sum() - 1) > tol:
+            raise ValueError(f"Probabilities sum to {probabilities.sum()}, not 1.")
+
+        self.support, inverse = np.unique(support, return_inverse=True)
+        self.probabilities = np.bincount(inverse, weights=probabilities)
+
+    @classmethod
+    def uniform(cls, outcomes):
+        """Equally likely outcomes, e.g. DiscreteRV.uniform(range(1, 7)) for a fair die."""
+        outcomes = np.asarray(outcomes, dtype=float)
+        return cls(outcomes, np.full(len(outcomes), 1 / len(outcomes)))
+
+    def moment(self, k, central=False):
+        """k-th raw moment E[X^k], or central moment E[(X - μ)^k]."""
+        values = self.support - self.mean() if central else self.support
+        return float(np.dot(self.probabilities, values**k))
+
+    def moments(self, k_max=4, central=False):
+        """Moments 1..k_max from a single (support, k_max) power matrix product."""
+        values = self.support - self.mean() if central else self.support
+        powers = np.cumprod(np.broadcast_to(values[:, None], (len(values), k_max)), axis=1)
+        return self.probabilities @ powers
+
+    def mean(self):
+        return float(np.dot(self.probabilities, self.support))
+
+    def var(self):
+        return float(self.moments(2, central=True)[1])
+
+    def std(self):
+        return self.var() ** 0.5
+
+    def skewness(self):
+        _, m2, m3 = self.moments(3, central=True)
+        return float(m3 / m2**1.5)
+
+    def kurtosis(self):
+        """Kurtosis m4 / m2^2 (not excess kurtosis)."""
+        _, m2, _, m4 = self.moments(4, central=True)
+        return float(m4 / m2**2)
+
+    def summary(self):
+        """Mean, variance, standard deviation, skewness and kurtosis in one pass."""
+        mean = self.mean()
+        _, m2, m3, m4 = self.moments(4, central=True)
+        return {"mean": mean, "variance": float(m2), "std": float(m2**0.5),
+                "skewness": float(m3 / m2**1.5), "kurtosis": float(m4 / m2**2)}
+
+    def __add__(self, other):
+        """Distribution of X + Y for independent X and Y."""
+        if not isinstance(other, DiscreteRV):
+            return DiscreteRV(self.support + other, self.probabilities)
+
+        lattice_a, lattice_b = _lattice(self.support), _lattice(other.support)
+        if lattice_a and lattice_b:
+            step = int(np.gcd(lattice_a[1], lattice_b[1]))
+            span = (np.ptp(self.support) + np.ptp(other.support)) / step
+        if lattice_a and lattice_b and span < MAX_LATTICE_POINTS:
+            dense_a = self._dense(lattice_a[0], step)
+            dense_b = other._dense(lattice_b[0], step)
+            result = _convolve(dense_a, dense_b)
+            support = lattice_a[0] + lattice_b[0] + step * np.arange(len(result))
+            keep = result > 0
+            return DiscreteRV(support[keep], result[keep] / result[keep].sum())
+
+        sums = (self.support[:, None] + other.support[None, :]).ravel()
+        weights = (self.probabilities[:, None] * other.probabilities[None, :]).ravel()
+        return DiscreteRV(sums, weights)
+
+    __radd__ = __add__
+
+    def _dense(self, start, step):
+        """Probability vector on the lattice start, start + step, ..."""
+        index = np.round((self.support - start) / step).astype(np.int64)
+        dense = np.zeros(index[-1] + 1)
+        dense[index] = self.probabilities
+        return dense
+
+    def iid_sum(self, n):
+        """Distribution of the sum of n independent copies, by repeated squaring."""
+        if n < 1:
+            raise ValueError("n must be at least 1.")
+        result, base = None, self
+        while n:
+            if n & 1:
+                result = base if result is None else result + base
+            n >>= 1
+            if n:
+                base = base + base
+        return result
+
+    def __repr__(self):
+        return f"DiscreteRV(support size={len(self.support)}, mean={self.mean():.6g}, var={self.var():.6g})"
+
+
+if __name__ == "__main__":
+    # Same distribution as measureOfCentralTendencyforPD.py
+    X = DiscreteRV(range(1, 7), [1/36, 3/36, 5/36, 7/36, 9/36, 11/36])
+    print(X, X.summary())
+
+    die = DiscreteRV.uniform(range(1, 7))
+    two_dice = die + die
+    print("P(sum of two dice = 7) =", two_dice.probabilities[two_dice.support == 7][0])
+
+    # 1,000 dice: the supports are large enough for FFT convolution
+    many = die.iid_sum(1000)
+    print(many, "expected mean 3500, var", 1000 * 35 / 12)
@@ -57,3 +57,10 @@ print("Mean of data set 4 is % s" % (mean(data4)))
 print("Mean of data set 5 is % s" % (mean(data5)))
 
 
+
+
+#5. exact rational mean, normalized once instead of after every addition
+
+from rational import exact_mean
+
+print("Exact mean of data set 4 is % s" % (exact_mean(data4)))
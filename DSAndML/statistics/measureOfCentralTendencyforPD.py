@@ -1,20 +1,18 @@
 from cmath import sqrt
 from fractions import Fraction as fr
 
+from rational import exact_dot
+
 # Function to calculate expected value
 def expectedvalue(distribution):
-    Mean = 0
-    for i in range(len(distribution)):
-        Mean += (i + 1) * distribution[i]  # (i + 1) is the outcome, distribution[i] is the probability
-    return Mean
+    outcomes = range(1, len(distribution) + 1)  # (i + 1) is the outcome, distribution[i] is the probability
+    return exact_dot(outcomes, distribution)
 
 # Function to calculate variance
 def variance(distribution):
     Mean = expectedvalue(distribution)  # Get the mean (expected value)
-    Var = 0
-    for i in range(len(distribution)):
-        X_squared = (i + 1) ** 2  # Square of the outcome (i + 1)
-        Var += X_squared * distribution[i]  # Multiply by probability P(X)
+    X_squared = [(i + 1) ** 2 for i in range(len(distribution))]  # Square of the outcome (i + 1)
+    Var = exact_dot(X_squared, distribution)  # E(X^2) = summation of X^2 * P(X)
     return Var - Mean ** 2  # Variance = E(X^2) - (E(X))^2
 
 # Define the distribution using fractions
@@ -36,4 +34,13 @@ print(f"Variance (Decimal): {round(float(var),2)}")
 
 # Print the result in both fraction and decimal form
 print(f"Standard Deviation (Fraction): {sqrt(var)}")
-print(f"Standard Deviation (Decimal): {sqrt(float(var))}")
\ No newline at end of file
+print(f"Standard Deviation (Decimal): {sqrt(float(var))}")
+
+# The same moments, plus skewness and kurtosis, from the vectorized random variable
+from discrete_rv import DiscreteRV
+
+X = DiscreteRV(range(1, len(distribution) + 1), [float(p) for p in distribution])
+print(f"\nDiscreteRV summary: {X.summary()}")
+
+# Sum of two independent draws from this distribution, by convolution
+print(f"E[X + X] = {(X + X).mean()}, Var(X + X) = {(X + X).var():.4f}")
@@ -1,4 +1,4 @@
-import numpy as np
+import quantiles
 
 data_set = [5, 2, 3, 4, 1, 6, 7, 8, 10]
 data_set_length = len(data_set)
@@ -53,10 +53,10 @@ print("First Quartile (Q1) = ", Q1)
 print("Third Quartile (Q3) = ", Q3)
 print("Quartile Deviation = ", quartile_deviation)
 
-# v. Quartile Deviation (Manual Calculation)
-Q1 = np.percentile(data_set, 25)  # First Quartile (25th percentile)
-Q3 = np.percentile(data_set, 75)  # Third Quartile (75th percentile)
-quartile_deviation = (Q3 - Q1) / 2
+# v. Quartile Deviation (linear interpolation, as numpy.percentile)
+# quantiles.quartile_deviation finds Q1 and Q3 with a single selection pass
+# instead of sorting
+Q1, Q3, quartile_deviation = quantiles.quartile_deviation(data_set)
 print("First Quartile (Q1) = ", Q1)
 print("Third Quartile (Q3) = ", Q3)
 print("Quartile Deviation = ", quartile_deviation)
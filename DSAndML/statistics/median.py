@@ -50,3 +50,9 @@ else:
 
 # Print the median of the list
 print("Median = " + str(res))
+
+# 5. Using selection (numpy.partition), no sorting required
+
+from quantiles import median as selection_median
+
+print("Median = ", selection_median(data_set))
@@ -103,4 +103,13 @@ print(f"Mode(s): {find_mode(data4)}")
 # String data
 data5 = ['apple', 'banana', 'apple', 'cherry', 'banana', 'apple']
 print(f"String data: {data5}")
-print(f"Mode(s): {find_mode(data5)}")
\ No newline at end of file
+print(f"Mode(s): {find_mode(data5)}")
+
+# 6. Using the vectorized mode engine (NumPy, hashing and streaming paths)
+from modes import multimode
+
+print("\n--- Testing modes.multimode ---")
+for data in [data1, data2, data3, data4, data5]:
+    print(f"Data: {data}")
+    for method in ("auto", "hash", "stream"):
+        print(f"  {method:>6}: {multimode(data, method=method)}")
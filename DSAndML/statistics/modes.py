@@ -0,0 +1,265 @@
+"""
+Mode / multimode engine with three counting paths.
+
+1. NumPy path for numeric data: np.bincount for compact integer ranges,
+   np.unique(return_counts=True) otherwise. Floats can be binned by rounding
+   to a number of decimals first, vectorized.
+2. Hashing path (collections.Counter) for arbitrary hashable objects such as
+   Fraction or strings.
+3. Streaming path: a Space-Saving heavy-hitter summary with a fixed number
+   of counters that can be updated batch by batch and merged across shards.
+
+Every path returns modes in order of first occurrence, like find_mode in
+mode.py does.
+"""
+
+import heapq
+import itertools
+from collections import Counter
+
+import numpy as np
+
+
+def _first_occurrence_order(arr, values):
+    """Sort `values` (all present in arr) by the index where each first appears."""
+    if len(values) < 2:
+        return values
+    mask = np.isin(arr, values)
+    positions = np.nonzero(mask)[0]
+    unique, first = np.unique(arr[mask], return_index=True)
+    order = np.argsort(positions[first], kind="stable")
+    return unique[order]
+
+
+def _numpy_multimode(arr):
+    if arr.dtype.kind in "iu" and arr.size:
+        low, high = int(arr.min()), int(arr.max())
+        # bincount is only worth it when the value range is compact
+        if high - low <= 4 * arr.size:
+            counts = np.bincount((arr - low).astype(np.intp))
+            modes = np.nonzero(counts == counts.max())[0] + low
+            return _first_occurrence_order(arr, modes.astype(arr.dtype)).tolist()
+
+    unique, first, counts = np.unique(arr, return_index=True, return_counts=True)
+    best = counts == counts.max()
+    order = np.argsort(first[best], kind="stable")
+    return unique[best][order].tolist()
+
+
+def _hash_multimode(data):
+    frequency = Counter(data)
+    max_freq = max(frequency.values())
+    return [key for key, freq in frequency.items() if freq == max_freq]
+
+
+def multimode(data, method="auto", decimals=None):
+    """
+    Return all most frequent values, in order of first occurrence.
+
+    Parameters:
+    - data: iterable or NumPy array
+    - method: "auto", "numpy", "hash" or "stream"
+    - decimals: if given, numeric data is rounded to this many decimals before
+      counting (decimals=0 bins to integers, like round(x))
+
+    "auto" picks the NumPy path when the data converts to a numeric array and
+    the hashing path otherwise (Fraction, strings, mixed objects).
+    """
+    if method == "stream":
+        if decimals is not None:
+            data = _round(np.asarray(data), decimals)
+        return SpaceSaving.from_iterable(data).multimode()
+
+    if method in ("auto", "numpy"):
+        if not isinstance(data, np.ndarray):
+            # Keep the original objects: NumPy would turn [1, '1'] into two equal strings
+            data = list(data)
+        arr = np.asarray(data)
+        if arr.dtype.kind in "biuf":
+            if arr.size == 0:
+                return []
+            if decimals is not None:
+                arr = _round(arr, decimals)
+            return _numpy_multimode(arr.ravel())
+        if method == "numpy":
+            raise TypeError("The NumPy path needs numeric data; use method='hash'.")
+        if isinstance(data, np.ndarray):
+            data = data.ravel().tolist()
+
+    if method not in ("auto", "hash"):
+        raise ValueError(f"Unknown method: {method!r}")
+    data = list(data)
+    if not data:
+        return []
+    if decimals is not None:
+        data = [round(x, decimals) for x in data]
+    return _hash_multimode(data)
+
+
+def mode(data, method="auto", decimals=None):
+    """First mode in order of occurrence (like statistics.mode)."""
+    modes = multimode(data, method=method, decimals=decimals)
+    if not modes:
+        raise ValueError("mode() requires at least one data point.")
+    return modes[0]
+
+
+def _round(arr, decimals):
+    if decimals == 0:
+        return np.rint(arr).astype(np.int64)
+    return np.round(arr, decimals)
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter summary with at most `capacity` counters.
+
+    Counts are exact while the number of distinct items stays within
+    capacity; beyond that each count overestimates the true frequency by at
+    most `error[item]`, and any item with frequency above n / capacity is
+    guaranteed to be tracked.
+
+    Memory is O(capacity + batch_size): batches are pre-aggregated at most
+    `batch_size` items at a time, and the minimum counter is found through a
+    lazily cleaned min-heap instead of a scan over all counters.
+    """
+
+    def __init__(self, capacity=1000, batch_size=100_000):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.n = 0
+        self.counts = {}
+        self.error = {}
+        self._heap = []  # (count, tiebreak, item); entries go stale when a count changes
+        self._tiebreak = itertools.count()
+
+    @classmethod
+    def from_iterable(cls, data, capacity=1000, batch_size=100_000):
+        return cls(capacity, batch_size).update(data)
+
+    def _push(self, item):
+        heapq.heappush(self._heap, (self.counts[item], next(self._tiebreak), item))
+        if len(self._heap) > 2 * self.capacity + 64:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = [(count, next(self._tiebreak), item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def _min_item(self):
+        while True:
+            count, _, item = self._heap[0]
+            if self.counts.get(item) == count:
+                return item
+            heapq.heappop(self._heap)
+
+    def _add(self, item, count):
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.error[item] = 0
+        else:
+            victim = self._min_item()
+            floor = self.counts.pop(victim)
+            del self.error[victim]
+            self.counts[item] = floor + count
+            self.error[item] = floor
+        self._push(item)
+
+    def _pairs(self, batch):
+        """(item, count) pairs, aggregated over at most batch_size items at a time."""
+        if isinstance(batch, np.ndarray) and batch.dtype.kind in "biuf":
+            batch = batch.ravel()
+            for start in range(0, batch.size, self.batch_size):
+                chunk = batch[start:start + self.batch_size]
+                unique, first, counts = np.unique(chunk, return_index=True, return_counts=True)
+                order = np.argsort(first, kind="stable")
+                yield from zip(unique[order].tolist(), counts[order].tolist())
+            return
+        items = iter(batch.ravel().tolist() if isinstance(batch, np.ndarray) else batch)
+        while True:
+            chunk = Counter(itertools.islice(items, self.batch_size))
+            if not chunk:
+                return
+            yield from chunk.items()
+
+    def update(self, batch):
+        """
+        Count an iterable of items (list, generator or NumPy array).
+
+        Returns self so calls can be chained.
+        """
+        for item, count in self._pairs(batch):
+            self.n += count
+            self._add(item, count)
+        return self
+
+    def merge(self, other):
+        """
+        Merge another summary (e.g. from another shard) into this one.
+
+        Items missing from a full summary are credited with that summary's
+        minimum count, which keeps the merged counts valid upper bounds.
+
+        Returns self so calls can be chained.
+        """
+        floor_self = min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+        floor_other = min(other.counts.values()) if len(other.counts) >= other.capacity else 0
+
+        counts, error = {}, {}
+        for item in list(self.counts) + [x for x in other.counts if x not in self.counts]:
+            counts[item] = self.counts.get(item, floor_self) + other.counts.get(item, floor_other)
+            error[item] = (self.error.get(item, floor_self)
+                           + other.error.get(item, floor_other))
+
+        if len(counts) > self.capacity:
+            keep = sorted(counts, key=counts.get, reverse=True)[:self.capacity]
+            keep = set(keep)
+            counts = {item: c for item, c in counts.items() if item in keep}
+            error = {item: e for item, e in error.items() if item in keep}
+
+        self.counts, self.error = counts, error
+        self.n += other.n
+        self._rebuild_heap()
+        return self
+
+    def top(self, k=10):
+        """The k items with the largest (estimated) counts."""
+        return sorted(self.counts.items(), key=lambda pair: pair[1], reverse=True)[:k]
+
+    def multimode(self):
+        """Items sharing the largest count, in order of first insertion."""
+        if not self.counts:
+            return []
+        max_count = max(self.counts.values())
+        return [item for item, count in self.counts.items() if count == max_count]
+
+
+if __name__ == "__main__":
+    from fractions import Fraction as fr
+
+    datasets = [
+        [1, 2, 3, 4, 4, 6, 7, 8, 4, 2, 2],
+        [1, 2, 3, 4, 4, 4, 5],
+        [1, 1, 2, 2, 3],
+        [1, 2, 3, 4, 5],
+        [fr(1, 2), fr(1, 2), fr(3, 4), fr(2, 3)],
+        ['apple', 'banana', 'apple', 'cherry', 'banana', 'apple'],
+    ]
+    for data in datasets:
+        results = {method: multimode(data, method=method) for method in ("auto", "hash", "stream")}
+        print(f"Data: {data}")
+        print(f"  Mode(s): {results['auto']}   all paths agree: {len(set(map(tuple, results.values()))) == 1}")
+
+    # Heavy hitters over a large stream, split across four shards
+    rng = np.random.default_rng(0)
+    stream = rng.zipf(1.5, 2_000_000)
+    shards = [SpaceSaving.from_iterable(part, capacity=200) for part in np.array_split(stream, 4)]
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+    print("\nTop 5 heavy hitters (Space-Saving):", merged.top(5))
+    print("Exact multimode (NumPy path):     ", multimode(stream))
@@ -1,58 +1,168 @@
-# Frequency distribution
-f = [5, 10, 15, 20, 25, 20, 15, 10, 5]
-# f = [1, 8, 28, 56, 70, 56, 28, 8, 1]
-
-# Initialize variables
-sum_fx = 0  # To store the sum of f * x
-N = sum(f)  # Total frequency N
-
-# Step 1: Calculate the sum of f * x (for mean calculation)
-for x in range(len(f)):
-    sum_fx += f[x] * x  # f[x] * x for each value
-
-# Step 2: Calculate the mean
-mean_ = sum_fx / N  # Mean is sum(f * x) / N
-
-# Initialize variables for higher moments calculations
-sum_f_into_x_sub_mean = 0
-sum_f_into_x_sub_mean_raise_2 = 0
-sum_f_into_x_sub_mean_raise_3 = 0
-sum_f_into_x_sub_mean_raise_4 = 0
-
-# Step 3: Calculate summation of f(x - mean), (x - mean)^2, (x - mean)^3, (x - mean)^4
-for x in range(len(f)):
-    deviation = x - mean_  # Calculate (x - mean) for each value of x
-    sum_f_into_x_sub_mean += f[x] * deviation  # Summation of f(x - mean)
-    sum_f_into_x_sub_mean_raise_2 += f[x] * (deviation**2)  # Summation of f(x - mean)^2
-    sum_f_into_x_sub_mean_raise_3 += f[x] * (deviation**3)  # Summation of f(x - mean)^3
-    sum_f_into_x_sub_mean_raise_4 += f[x] * (deviation**4)  # Summation of f(x - mean)^4
-
-# Print the intermediate results
-print("N = ", N)
-print("Summation of fx = ", sum_fx)
-print("Summation of f(x - mean) = ", sum_f_into_x_sub_mean)
-print("Summation of f(x - mean)^2 = ", sum_f_into_x_sub_mean_raise_2)
-print("Summation of f(x - mean)^3 = ", sum_f_into_x_sub_mean_raise_3)
-print("Summation of f(x - mean)^4 = ", sum_f_into_x_sub_mean_raise_4)
-
-# Step 4: Calculate moments about the actual mean
-m1 = sum_f_into_x_sub_mean / N  # First moment (about the mean, m1 should be close to 0)
-m2 = sum_f_into_x_sub_mean_raise_2 / N  # Second moment (variance)
-m3 = sum_f_into_x_sub_mean_raise_3 / N  # Third moment (skewness related)
-m4 = sum_f_into_x_sub_mean_raise_4 / N  # Fourth moment (kurtosis related)
-
-# Print moments
-print("Moments about Actual Mean:")
-print("m1 = ", m1)  # Should be close to 0, as it's the first moment about the mean
-print("m2 = ", m2)  # Second moment (variance)
-print("m3 = ", m3)  # Third moment (for skewness)
-print("m4 = ", m4)  # Fourth moment (for kurtosis)
-
-# Step 5: Calculate skewness and kurtosis
-skewness = m3 / (m2 ** (3 / 2))  # Skewness is m3 divided by m2 raised to 3/2
-kurtosis = m4 / (m2**2)  # Kurtosis is m4 divided by m2 squared
-
-# Print skewness and kurtosis
-print("Skewness = ", skewness)
-print("Kurtosis = ", kurtosis)
+import numpy as np
 
+
+class Moments:
+    """
+    Single-pass, mergeable accumulator for the first four central moments.
+
+    Batches are folded in with the Welford/Pébay update, so raw streams,
+    weighted frequency tables and per-shard partial results all combine
+    exactly without a second pass over the data.
+
+    Attributes:
+    - n: total weight (number of observations, or total frequency N)
+    - mean: running mean
+    - M2, M3, M4: summations of f(x - mean)^k for k = 2, 3, 4
+    """
+
+    def __init__(self):
+        self.n = 0.0
+        self.mean = 0.0
+        self.M2 = 0.0
+        self.M3 = 0.0
+        self.M4 = 0.0
+
+    @classmethod
+    def from_batches(cls, batches):
+        """Build an accumulator from an iterable of NumPy batches."""
+        acc = cls()
+        for batch in batches:
+            acc.update(batch)
+        return acc
+
+    @classmethod
+    def from_frequency_table(cls, f, x=None):
+        """
+        Build an accumulator from a frequency distribution.
+
+        Parameters:
+        - f: frequencies
+        - x: values; defaults to 0, 1, ..., len(f) - 1
+        """
+        f = np.asarray(f, dtype=float)
+        x = np.arange(len(f), dtype=float) if x is None else x
+        return cls().update(x, weights=f)
+
+    def update(self, values, weights=None):
+        """
+        Fold a batch of values (optionally weighted by frequencies) into the accumulator.
+
+        Returns self so calls can be chained.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if weights is None:
+            weights = np.ones_like(values)
+        else:
+            weights = np.asarray(weights, dtype=float).ravel()
+        n = weights.sum()
+        if n == 0:
+            return self
+
+        batch = Moments()
+        batch.n = n
+        batch.mean = np.dot(weights, values) / n
+        deviation = values - batch.mean
+        weighted = weights * deviation * deviation
+        batch.M2 = weighted.sum()
+        weighted *= deviation
+        batch.M3 = weighted.sum()
+        weighted *= deviation
+        batch.M4 = weighted.sum()
+        return self.merge(batch)
+
+    def merge(self, other):
+        """
+        Combine another accumulator into this one exactly (Pébay's pairwise update).
+
+        Returns self so calls can be chained.
+        """
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean = other.n, other.mean
+            self.M2, self.M3, self.M4 = other.M2, other.M3, other.M4
+            return self
+
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+
+        M4 = (self.M4 + other.M4
+              + delta * delta_n**3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * delta_n**2 * (na * na * other.M2 + nb * nb * self.M2)
+              + 4 * delta_n * (na * other.M3 - nb * self.M3))
+        M3 = (self.M3 + other.M3
+              + delta * delta_n**2 * na * nb * (na - nb)
+              + 3 * delta_n * (na * other.M2 - nb * self.M2))
+        M2 = self.M2 + other.M2 + delta * delta_n * na * nb
+
+        self.n = n
+        self.mean = self.mean + delta_n * nb
+        self.M2, self.M3, self.M4 = M2, M3, M4
+        return self
+
+    @property
+    def m2(self):
+        """Second moment about the mean (population variance)."""
+        return self.M2 / self.n
+
+    @property
+    def m3(self):
+        """Third moment about the mean."""
+        return self.M3 / self.n
+
+    @property
+    def m4(self):
+        """Fourth moment about the mean."""
+        return self.M4 / self.n
+
+    @property
+    def skewness(self):
+        """Skewness = m3 / m2^(3/2)."""
+        return self.m3 / self.m2 ** 1.5
+
+    @property
+    def kurtosis(self):
+        """Kurtosis = m4 / m2^2 (not excess kurtosis)."""
+        return self.m4 / self.m2**2
+
+    def __repr__(self):
+        return (f"Moments(n={self.n}, mean={self.mean}, m2={self.m2}, "
+                f"m3={self.m3}, m4={self.m4})")
+
+
+if __name__ == "__main__":
+    # Frequency distribution
+    f = [5, 10, 15, 20, 25, 20, 15, 10, 5]
+    # f = [1, 8, 28, 56, 70, 56, 28, 8, 1]
+
+    moments = Moments.from_frequency_table(f)
+
+    # Print the intermediate results
+    print("N = ", moments.n)
+    print("Summation of fx = ", moments.mean * moments.n)
+    print("Summation of f(x - mean)^2 = ", moments.M2)
+    print("Summation of f(x - mean)^3 = ", moments.M3)
+    print("Summation of f(x - mean)^4 = ", moments.M4)
+
+    # Moments about the actual mean (m1 is 0 by construction)
+    print("Moments about Actual Mean:")
+    print("m1 = ", 0.0)
+    print("m2 = ", moments.m2)  # Second moment (variance)
+    print("m3 = ", moments.m3)  # Third moment (for skewness)
+    print("m4 = ", moments.m4)  # Fourth moment (for kurtosis)
+
+    print("Skewness = ", moments.skewness)
+    print("Kurtosis = ", moments.kurtosis)
+
+    # Raw data streamed in shards, merged exactly as if processed in one pass
+    rng = np.random.default_rng(42)
+    data = rng.exponential(2.0, 1_000_000)
+    shards = [Moments.from_batches(np.array_split(part, 10)) for part in np.array_split(data, 4)]
+    merged = Moments()
+    for shard in shards:
+        merged.merge(shard)
+    print("\nMerged shards:", merged)
+    print("Skewness = ", merged.skewness, " (exponential: 2)")
+    print("Kurtosis = ", merged.kurtosis, " (exponential: 9)")
@@ -25,17 +25,309 @@ import seaborn as sns
 plt.style.use('seaborn-v0_8')
 np.random.seed(42)  # For reproducible results
 
+
+def _sampler(rng):
+    """The given Generator, or the legacy global state the demos were written against."""
+    return np.random if rng is None else rng
+
+# Figure builders: module-level so report_pipeline.py can render them in worker
+# processes on a headless backend. Each returns the figure instead of showing it.
+
+def plot_normal(samples, mu, sigma):
+    """Histogram with the normal PDF and a Q-Q plot; returns the figure."""
+    # Theoretical PDF
+    x = np.linspace(mu - 4*sigma, mu + 4*sigma, 100)
+    pdf = (1/(sigma * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mu) / sigma) ** 2)
+
+    # Create visualization
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+    # Histogram with PDF overlay
+    ax1.hist(samples, bins=50, density=True, alpha=0.7, color='skyblue',
+            edgecolor='black', label='Sample Data')
+    ax1.plot(x, pdf, 'r-', linewidth=2, label=f'Theoretical PDF\nμ={mu}, σ={sigma}')
+    ax1.axvline(np.mean(samples), color='green', linestyle='--',
+               label=f'Sample Mean = {np.mean(samples):.2f}')
+    ax1.set_title('Normal Distribution - Histogram vs PDF')
+    ax1.set_xlabel('Value')
+    ax1.set_ylabel('Density')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Q-Q plot to check normality
+    stats.probplot(samples, dist="norm", plot=ax2)
+    ax2.set_title('Q-Q Plot (Normal Distribution)')
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    return fig
+
+
+def plot_poisson(samples, lam):
+    """Sample PMF and CDF against the Poisson PMF and CDF; returns the figure."""
+    size = len(samples)
+
+    # Theoretical PMF
+    k_max = max(samples) + 5
+    k = np.arange(0, k_max)
+    pmf = (lam**k * np.exp(-lam)) / np.array([math.factorial(i) for i in k])
+
+    # Create visualization
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+    # Histogram with PMF overlay
+    unique, counts = np.unique(samples, return_counts=True)
+    ax1.bar(unique, counts/size, alpha=0.7, color='lightgreen',
+           edgecolor='black', label='Sample Data')
+    ax1.plot(k, pmf, 'ro-', linewidth=2, markersize=4,
+            label=f'Theoretical PMF\nλ={lam}')
+    ax1.axvline(np.mean(samples), color='blue', linestyle='--',
+               label=f'Sample Mean = {np.mean(samples):.2f}')
+    ax1.set_title('Poisson Distribution - Histogram vs PMF')
+    ax1.set_xlabel('Value (k)')
+    ax1.set_ylabel('Probability')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Cumulative distribution
+    sample_counts = Counter(samples)
+    k_sample = sorted(sample_counts.keys())
+    cdf_sample = np.cumsum([sample_counts[k]/size for k in k_sample])
+    cdf_theoretical = stats.poisson.cdf(k, lam)
+
+    ax2.step(k_sample, cdf_sample, where='post', label='Sample CDF', linewidth=2)
+    ax2.plot(k, cdf_theoretical, 'r-', label='Theoretical CDF', linewidth=2)
+    ax2.set_title('Cumulative Distribution Function')
+    ax2.set_xlabel('Value (k)')
+    ax2.set_ylabel('P(X ≤ k)')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    return fig
+
+
+def plot_bernoulli(samples, p):
+    """Sample vs theoretical outcome probabilities and the running average; returns the figure."""
+    size = len(samples)
+
+    # Calculate sample proportions
+    successes = np.sum(samples)
+    failures = size - successes
+    sample_p = successes / size
+
+    # Create visualization
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+    # Bar plot
+    categories = ['Failure (0)', 'Success (1)']
+    sample_probs = [failures/size, successes/size]
+    theoretical_probs = [1-p, p]
+
+    x = np.arange(len(categories))
+    width = 0.35
+
+    ax1.bar(x - width/2, sample_probs, width, label='Sample',
+           alpha=0.7, color='lightcoral')
+    ax1.bar(x + width/2, theoretical_probs, width, label='Theoretical',
+           alpha=0.7, color='lightblue')
+    ax1.set_title('Bernoulli Distribution - Sample vs Theoretical')
+    ax1.set_xlabel('Outcome')
+    ax1.set_ylabel('Probability')
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(categories)
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Time series of trials
+    cumulative_avg = np.cumsum(samples) / np.arange(1, size + 1)
+    ax2.plot(cumulative_avg, color='purple', linewidth=1)
+    ax2.axhline(y=p, color='red', linestyle='--', linewidth=2,
+               label=f'True p = {p}')
+    ax2.axhline(y=sample_p, color='green', linestyle='--', linewidth=2,
+               label=f'Sample p = {sample_p:.3f}')
+    ax2.set_title('Law of Large Numbers - Convergence to True Probability')
+    ax2.set_xlabel('Number of Trials')
+    ax2.set_ylabel('Cumulative Average')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    return fig
+
+
+def plot_binomial(samples, n, p):
+    """Histogram with the binomial PMF and a box plot; returns the figure."""
+    size = len(samples)
+
+    # Theoretical PMF
+    k = np.arange(0, n + 1)
+    pmf = stats.binom.pmf(k, n, p)
+
+    # Create visualization
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+    # Histogram with PMF overlay
+    unique, counts = np.unique(samples, return_counts=True)
+    ax1.bar(unique, counts/size, alpha=0.7, color='orange',
+           edgecolor='black', label='Sample Data', width=0.8)
+    ax1.plot(k, pmf, 'ro-', linewidth=2, markersize=4,
+            label=f'Theoretical PMF\nn={n}, p={p}')
+    ax1.axvline(np.mean(samples), color='green', linestyle='--',
+               label=f'Sample Mean = {np.mean(samples):.2f}')
+    ax1.set_title('Binomial Distribution - Histogram vs PMF')
+    ax1.set_xlabel('Number of Successes (k)')
+    ax1.set_ylabel('Probability')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Box plot and violin plot
+    ax2.boxplot(samples, patch_artist=True,
+               boxprops=dict(facecolor='lightblue', alpha=0.7))
+    ax2.set_title('Binomial Distribution - Box Plot')
+    ax2.set_ylabel('Number of Successes')
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    return fig
+
+
+def plot_exponential(samples, lam):
+    """Histogram with the exponential PDF and the sample vs theoretical CDF; returns the figure."""
+    # Theoretical PDF and CDF
+    x = np.linspace(0, np.max(samples), 1000)
+    pdf = lam * np.exp(-lam * x)
+    cdf = 1 - np.exp(-lam * x)
+
+    # Create visualization
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+    # Histogram with PDF overlay
+    ax1.hist(samples, bins=50, density=True, alpha=0.7, color='salmon',
+            edgecolor='black', label='Sample Data')
+    ax1.plot(x, pdf, 'b-', linewidth=2, label=f'Theoretical PDF\nλ={lam}')
+    ax1.axvline(np.mean(samples), color='green', linestyle='--',
+               label=f'Sample Mean = {np.mean(samples):.2f}')
+    ax1.set_title('Exponential Distribution - Histogram vs PDF')
+    ax1.set_xlabel('Value')
+    ax1.set_ylabel('Density')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # CDF comparison
+    sample_sorted = np.sort(samples)
+    sample_cdf = np.arange(1, len(sample_sorted) + 1) / len(sample_sorted)
+    theoretical_cdf = 1 - np.exp(-lam * sample_sorted)
+
+    ax2.plot(sample_sorted, sample_cdf, 'g-', linewidth=2, label='Sample CDF')
+    ax2.plot(sample_sorted, theoretical_cdf, 'r--', linewidth=2, label='Theoretical CDF')
+    ax2.set_title('Cumulative Distribution Function')
+    ax2.set_xlabel('Value')
+    ax2.set_ylabel('P(X ≤ x)')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    return fig
+
+
+def plot_uniform(samples, a, b):
+    """Histogram with the uniform PDF and the first 100 samples; returns the figure."""
+    # Theoretical PDF
+    pdf_value = 1/(b-a)
+
+    # Create visualization
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+    # Histogram with PDF overlay
+    ax1.hist(samples, bins=30, density=True, alpha=0.7, color='gold',
+            edgecolor='black', label='Sample Data')
+    ax1.axhline(y=pdf_value, color='red', linewidth=3,
+               label=f'Theoretical PDF = {pdf_value:.3f}')
+    ax1.axvline(np.mean(samples), color='green', linestyle='--',
+               label=f'Sample Mean = {np.mean(samples):.2f}')
+    ax1.axvline((a+b)/2, color='blue', linestyle=':',
+               label=f'Theoretical Mean = {(a+b)/2:.2f}')
+    ax1.set_title('Uniform Distribution - Histogram vs PDF')
+    ax1.set_xlabel('Value')
+    ax1.set_ylabel('Density')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xlim(a-1, b+1)
+
+    # Scatter plot to show randomness
+    ax2.scatter(range(len(samples[:100])), samples[:100], alpha=0.6, color='purple')
+    ax2.axhline(y=(a+b)/2, color='red', linestyle='--', label=f'Mean = {(a+b)/2}')
+    ax2.axhline(y=a, color='gray', linestyle=':', label=f'Lower bound = {a}')
+    ax2.axhline(y=b, color='gray', linestyle=':', label=f'Upper bound = {b}')
+    ax2.set_title('First 100 Random Samples')
+    ax2.set_xlabel('Sample Index')
+    ax2.set_ylabel('Value')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    return fig
+
+
+def plot_comparison(normal_samples, poisson_samples, exponential_samples, uniform_samples):
+    """2x2 grid comparing four sample histograms; returns the figure."""
+    # Create comparison plot
+    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+
+    # Normal
+    axes[0,0].hist(normal_samples, bins=50, density=True, alpha=0.7, color='skyblue')
+    axes[0,0].set_title('Normal Distribution\nμ=0, σ=1')
+    axes[0,0].set_xlabel('Value')
+    axes[0,0].set_ylabel('Density')
+    axes[0,0].grid(True, alpha=0.3)
+
+    # Poisson
+    axes[0,1].hist(poisson_samples, bins=range(0, max(poisson_samples)+2),
+                  density=True, alpha=0.7, color='lightgreen')
+    axes[0,1].set_title('Poisson Distribution\nλ=3')
+    axes[0,1].set_xlabel('Value')
+    axes[0,1].set_ylabel('Density')
+    axes[0,1].grid(True, alpha=0.3)
+
+    # Exponential
+    axes[1,0].hist(exponential_samples, bins=50, density=True, alpha=0.7, color='salmon')
+    axes[1,0].set_title('Exponential Distribution\nλ=1')
+    axes[1,0].set_xlabel('Value')
+    axes[1,0].set_ylabel('Density')
+    axes[1,0].grid(True, alpha=0.3)
+
+    # Uniform
+    axes[1,1].hist(uniform_samples, bins=50, density=True, alpha=0.7, color='gold')
+    axes[1,1].set_title('Uniform Distribution\na=-3, b=3')
+    axes[1,1].set_xlabel('Value')
+    axes[1,1].set_ylabel('Density')
+    axes[1,1].grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    return fig
+
+
 class ProbabilityDistributions:
     """Class containing various probability distribution implementations"""
 
     @staticmethod
-    def normal_distribution(mu=0, sigma=1, size=1000):
+    def normal_distribution(mu=0, sigma=1, size=1000, rng=None):
         """
         Normal Distribution Implementation
         Parameters:
         - mu: mean
         - sigma: standard deviation
         - size: number of samples
+        - rng: numpy Generator (e.g. from parallel_sampling.ParallelSampler);
+          defaults to the global np.random state
         """
         print("="*60)
         print("NORMAL DISTRIBUTION")
@@ -43,33 +335,10 @@ class ProbabilityDistributions:
         print(f"Parameters: μ = {mu}, σ = {sigma}")
 
         # Generate random samples
-        samples = np.random.normal(mu, sigma, size)
-
-        # Theoretical PDF
-        x = np.linspace(mu - 4*sigma, mu + 4*sigma, 100)
-        pdf = (1/(sigma * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mu) / sigma) ** 2)
+        samples = _sampler(rng).normal(mu, sigma, size)
 
         # Create visualization
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-
-        # Histogram with PDF overlay
-        ax1.hist(samples, bins=50, density=True, alpha=0.7, color='skyblue',
-                edgecolor='black', label='Sample Data')
-        ax1.plot(x, pdf, 'r-', linewidth=2, label=f'Theoretical PDF\nμ={mu}, σ={sigma}')
-        ax1.axvline(np.mean(samples), color='green', linestyle='--',
-                   label=f'Sample Mean = {np.mean(samples):.2f}')
-        ax1.set_title('Normal Distribution - Histogram vs PDF')
-        ax1.set_xlabel('Value')
-        ax1.set_ylabel('Density')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-
-        # Q-Q plot to check normality
-        stats.probplot(samples, dist="norm", plot=ax2)
-        ax2.set_title('Q-Q Plot (Normal Distribution)')
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
+        plot_normal(samples, mu, sigma)
         plt.show()
 
         # Statistics
@@ -81,12 +350,14 @@ class ProbabilityDistributions:
         return samples
 
     @staticmethod
-    def poisson_distribution(lam=3, size=1000):
+    def poisson_distribution(lam=3, size=1000, rng=None):
         """
         Poisson Distribution Implementation
         Parameters:
         - lam: rate parameter (λ)
         - size: number of samples
+        - rng: numpy Generator (e.g. from parallel_sampling.ParallelSampler);
+          defaults to the global np.random state
         """
         print("\n" + "="*60)
         print("POISSON DISTRIBUTION")
@@ -94,45 +365,10 @@ class ProbabilityDistributions:
         print(f"Parameter: λ = {lam}")
 
         # Generate random samples
-        samples = np.random.poisson(lam, size)
-
-        # Theoretical PMF
-        k_max = max(samples) + 5
-        k = np.arange(0, k_max)
-        pmf = (lam**k * np.exp(-lam)) / np.array([math.factorial(i) for i in k])
+        samples = _sampler(rng).poisson(lam, size)
 
         # Create visualization
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-
-        # Histogram with PMF overlay
-        unique, counts = np.unique(samples, return_counts=True)
-        ax1.bar(unique, counts/size, alpha=0.7, color='lightgreen',
-               edgecolor='black', label='Sample Data')
-        ax1.plot(k, pmf, 'ro-', linewidth=2, markersize=4,
-                label=f'Theoretical PMF\nλ={lam}')
-        ax1.axvline(np.mean(samples), color='blue', linestyle='--',
-                   label=f'Sample Mean = {np.mean(samples):.2f}')
-        ax1.set_title('Poisson Distribution - Histogram vs PMF')
-        ax1.set_xlabel('Value (k)')
-        ax1.set_ylabel('Probability')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-
-        # Cumulative distribution
-        sample_counts = Counter(samples)
-        k_sample = sorted(sample_counts.keys())
-        cdf_sample = np.cumsum([sample_counts[k]/size for k in k_sample])
-        cdf_theoretical = stats.poisson.cdf(k, lam)
-
-        ax2.step(k_sample, cdf_sample, where='post', label='Sample CDF', linewidth=2)
-        ax2.plot(k, cdf_theoretical, 'r-', label='Theoretical CDF', linewidth=2)
-        ax2.set_title('Cumulative Distribution Function')
-        ax2.set_xlabel('Value (k)')
-        ax2.set_ylabel('P(X ≤ k)')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
+        plot_poisson(samples, lam)
         plt.show()
 
         # Statistics
@@ -144,12 +380,14 @@ class ProbabilityDistributions:
         return samples
 
     @staticmethod
-    def bernoulli_distribution(p=0.3, size=1000):
+    def bernoulli_distribution(p=0.3, size=1000, rng=None):
         """
         Bernoulli Distribution Implementation
         Parameters:
         - p: probability of success
         - size: number of trials
+        - rng: numpy Generator (e.g. from parallel_sampling.ParallelSampler);
+          defaults to the global np.random state
         """
         print("\n" + "="*60)
         print("BERNOULLI DISTRIBUTION")
@@ -157,50 +395,14 @@ class ProbabilityDistributions:
         print(f"Parameter: p = {p}")
 
         # Generate random samples
-        samples = np.random.binomial(1, p, size)
+        samples = _sampler(rng).binomial(1, p, size)
 
         # Calculate sample proportions
         successes = np.sum(samples)
-        failures = size - successes
         sample_p = successes / size
 
         # Create visualization
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-
-        # Bar plot
-        categories = ['Failure (0)', 'Success (1)']
-        sample_probs = [failures/size, successes/size]
-        theoretical_probs = [1-p, p]
-
-        x = np.arange(len(categories))
-        width = 0.35
-
-        ax1.bar(x - width/2, sample_probs, width, label='Sample',
-               alpha=0.7, color='lightcoral')
-        ax1.bar(x + width/2, theoretical_probs, width, label='Theoretical',
-               alpha=0.7, color='lightblue')
-        ax1.set_title('Bernoulli Distribution - Sample vs Theoretical')
-        ax1.set_xlabel('Outcome')
-        ax1.set_ylabel('Probability')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(categories)
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-
-        # Time series of trials
-        cumulative_avg = np.cumsum(samples) / np.arange(1, size + 1)
-        ax2.plot(cumulative_avg, color='purple', linewidth=1)
-        ax2.axhline(y=p, color='red', linestyle='--', linewidth=2,
-                   label=f'True p = {p}')
-        ax2.axhline(y=sample_p, color='green', linestyle='--', linewidth=2,
-                   label=f'Sample p = {sample_p:.3f}')
-        ax2.set_title('Law of Large Numbers - Convergence to True Probability')
-        ax2.set_xlabel('Number of Trials')
-        ax2.set_ylabel('Cumulative Average')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
+        plot_bernoulli(samples, p)
         plt.show()
 
         # Statistics
@@ -213,13 +415,15 @@ class ProbabilityDistributions:
         return samples
 
     @staticmethod
-    def binomial_distribution(n=20, p=0.3, size=1000):
+    def binomial_distribution(n=20, p=0.3, size=1000, rng=None):
         """
         Binomial Distribution Implementation
         Parameters:
         - n: number of trials
         - p: probability of success
         - size: number of experiments
+        - rng: numpy Generator (e.g. from parallel_sampling.ParallelSampler);
+          defaults to the global np.random state
         """
         print("\n" + "="*60)
         print("BINOMIAL DISTRIBUTION")
@@ -227,37 +431,10 @@ class ProbabilityDistributions:
         print(f"Parameters: n = {n}, p = {p}")
 
         # Generate random samples
-        samples = np.random.binomial(n, p, size)
-
-        # Theoretical PMF
-        k = np.arange(0, n + 1)
-        pmf = stats.binom.pmf(k, n, p)
+        samples = _sampler(rng).binomial(n, p, size)
 
         # Create visualization
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-
-        # Histogram with PMF overlay
-        unique, counts = np.unique(samples, return_counts=True)
-        ax1.bar(unique, counts/size, alpha=0.7, color='orange',
-               edgecolor='black', label='Sample Data', width=0.8)
-        ax1.plot(k, pmf, 'ro-', linewidth=2, markersize=4,
-                label=f'Theoretical PMF\nn={n}, p={p}')
-        ax1.axvline(np.mean(samples), color='green', linestyle='--',
-                   label=f'Sample Mean = {np.mean(samples):.2f}')
-        ax1.set_title('Binomial Distribution - Histogram vs PMF')
-        ax1.set_xlabel('Number of Successes (k)')
-        ax1.set_ylabel('Probability')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-
-        # Box plot and violin plot
-        ax2.boxplot(samples, patch_artist=True,
-                   boxprops=dict(facecolor='lightblue', alpha=0.7))
-        ax2.set_title('Binomial Distribution - Box Plot')
-        ax2.set_ylabel('Number of Successes')
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
+        plot_binomial(samples, n, p)
         plt.show()
 
         # Statistics
@@ -272,12 +449,14 @@ class ProbabilityDistributions:
         return samples
 
     @staticmethod
-    def exponential_distribution(lam=1.5, size=1000):
+    def exponential_distribution(lam=1.5, size=1000, rng=None):
         """
         Exponential Distribution Implementation
         Parameters:
         - lam: rate parameter (λ)
         - size: number of samples
+        - rng: numpy Generator (e.g. from parallel_sampling.ParallelSampler);
+          defaults to the global np.random state
         """
         print("\n" + "="*60)
         print("EXPONENTIAL DISTRIBUTION")
@@ -285,42 +464,10 @@ class ProbabilityDistributions:
         print(f"Parameter: λ = {lam}")
 
         # Generate random samples
-        samples = np.random.exponential(1/lam, size)
-
-        # Theoretical PDF and CDF
-        x = np.linspace(0, np.max(samples), 1000)
-        pdf = lam * np.exp(-lam * x)
-        cdf = 1 - np.exp(-lam * x)
+        samples = _sampler(rng).exponential(1/lam, size)
 
         # Create visualization
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-
-        # Histogram with PDF overlay
-        ax1.hist(samples, bins=50, density=True, alpha=0.7, color='salmon',
-                edgecolor='black', label='Sample Data')
-        ax1.plot(x, pdf, 'b-', linewidth=2, label=f'Theoretical PDF\nλ={lam}')
-        ax1.axvline(np.mean(samples), color='green', linestyle='--',
-                   label=f'Sample Mean = {np.mean(samples):.2f}')
-        ax1.set_title('Exponential Distribution - Histogram vs PDF')
-        ax1.set_xlabel('Value')
-        ax1.set_ylabel('Density')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-
-        # CDF comparison
-        sample_sorted = np.sort(samples)
-        sample_cdf = np.arange(1, len(sample_sorted) + 1) / len(sample_sorted)
-        theoretical_cdf = 1 - np.exp(-lam * sample_sorted)
-
-        ax2.plot(sample_sorted, sample_cdf, 'g-', linewidth=2, label='Sample CDF')
-        ax2.plot(sample_sorted, theoretical_cdf, 'r--', linewidth=2, label='Theoretical CDF')
-        ax2.set_title('Cumulative Distribution Function')
-        ax2.set_xlabel('Value')
-        ax2.set_ylabel('P(X ≤ x)')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
+        plot_exponential(samples, lam)
         plt.show()
 
         # Statistics
@@ -335,13 +482,15 @@ class ProbabilityDistributions:
         return samples
 
     @staticmethod
-    def uniform_distribution(a=0, b=10, size=1000):
+    def uniform_distribution(a=0, b=10, size=1000, rng=None):
         """
         Uniform Distribution Implementation
         Parameters:
         - a: lower bound
         - b: upper bound
         - size: number of samples
+        - rng: numpy Generator (e.g. from parallel_sampling.ParallelSampler);
+          defaults to the global np.random state
         """
         print("\n" + "="*60)
         print("UNIFORM DISTRIBUTION")
@@ -349,42 +498,10 @@ class ProbabilityDistributions:
         print(f"Parameters: a = {a}, b = {b}")
 
         # Generate random samples
-        samples = np.random.uniform(a, b, size)
-
-        # Theoretical PDF
-        pdf_value = 1/(b-a)
+        samples = _sampler(rng).uniform(a, b, size)
 
         # Create visualization
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-
-        # Histogram with PDF overlay
-        ax1.hist(samples, bins=30, density=True, alpha=0.7, color='gold',
-                edgecolor='black', label='Sample Data')
-        ax1.axhline(y=pdf_value, color='red', linewidth=3,
-                   label=f'Theoretical PDF = {pdf_value:.3f}')
-        ax1.axvline(np.mean(samples), color='green', linestyle='--',
-                   label=f'Sample Mean = {np.mean(samples):.2f}')
-        ax1.axvline((a+b)/2, color='blue', linestyle=':',
-                   label=f'Theoretical Mean = {(a+b)/2:.2f}')
-        ax1.set_title('Uniform Distribution - Histogram vs PDF')
-        ax1.set_xlabel('Value')
-        ax1.set_ylabel('Density')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        ax1.set_xlim(a-1, b+1)
-
-        # Scatter plot to show randomness
-        ax2.scatter(range(len(samples[:100])), samples[:100], alpha=0.6, color='purple')
-        ax2.axhline(y=(a+b)/2, color='red', linestyle='--', label=f'Mean = {(a+b)/2}')
-        ax2.axhline(y=a, color='gray', linestyle=':', label=f'Lower bound = {a}')
-        ax2.axhline(y=b, color='gray', linestyle=':', label=f'Upper bound = {b}')
-        ax2.set_title('First 100 Random Samples')
-        ax2.set_xlabel('Sample Index')
-        ax2.set_ylabel('Value')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
+        plot_uniform(samples, a, b)
         plt.show()
 
         # Statistics
@@ -399,51 +516,20 @@ class ProbabilityDistributions:
 
         return samples
 
-def compare_distributions():
+def compare_distributions(rng=None):
     """Compare multiple distributions side by side"""
     print("\n" + "="*80)
     print("DISTRIBUTION COMPARISON")
     print("="*80)
 
     # Generate samples from different distributions
-    normal_samples = np.random.normal(0, 1, 1000)
-    poisson_samples = np.random.poisson(3, 1000)
-    exponential_samples = np.random.exponential(1, 1000)
-    uniform_samples = np.random.uniform(-3, 3, 1000)
+    normal_samples = _sampler(rng).normal(0, 1, 1000)
+    poisson_samples = _sampler(rng).poisson(3, 1000)
+    exponential_samples = _sampler(rng).exponential(1, 1000)
+    uniform_samples = _sampler(rng).uniform(-3, 3, 1000)
 
     # Create comparison plot
-    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-
-    # Normal
-    axes[0,0].hist(normal_samples, bins=50, density=True, alpha=0.7, color='skyblue')
-    axes[0,0].set_title('Normal Distribution\nμ=0, σ=1')
-    axes[0,0].set_xlabel('Value')
-    axes[0,0].set_ylabel('Density')
-    axes[0,0].grid(True, alpha=0.3)
-
-    # Poisson
-    axes[0,1].hist(poisson_samples, bins=range(0, max(poisson_samples)+2),
-                  density=True, alpha=0.7, color='lightgreen')
-    axes[0,1].set_title('Poisson Distribution\nλ=3')
-    axes[0,1].set_xlabel('Value')
-    axes[0,1].set_ylabel('Density')
-    axes[0,1].grid(True, alpha=0.3)
-
-    # Exponential
-    axes[1,0].hist(exponential_samples, bins=50, density=True, alpha=0.7, color='salmon')
-    axes[1,0].set_title('Exponential Distribution\nλ=1')
-    axes[1,0].set_xlabel('Value')
-    axes[1,0].set_ylabel('Density')
-    axes[1,0].grid(True, alpha=0.3)
-
-    # Uniform
-    axes[1,1].hist(uniform_samples, bins=50, density=True, alpha=0.7, color='gold')
-    axes[1,1].set_title('Uniform Distribution\na=-3, b=3')
-    axes[1,1].set_xlabel('Value')
-    axes[1,1].set_ylabel('Density')
-    axes[1,1].grid(True, alpha=0.3)
-
-    plt.tight_layout()
+    plot_comparison(normal_samples, poisson_samples, exponential_samples, uniform_samples)
     plt.show()
 
 def main():
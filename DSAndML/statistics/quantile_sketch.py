@@ -0,0 +1,198 @@
+"""
+Streaming approximate quantiles with a KLL sketch.
+
+The exact median/quartile code in median.py, measureOfDispersion.py and
+quantiles.py needs the whole dataset in memory. A KLL sketch keeps a few
+thousand weighted samples instead: items enter level 0 and, whenever a level
+overflows, it is sorted and every other item is promoted to the next level
+with double weight. Memory stays O(k log(n / k)) and the normalized rank
+error is roughly 1.7 / k with high probability.
+
+Sketches built on separate workers can be merged, and serialized to bytes
+to ship between processes.
+"""
+
+import math
+import struct
+
+import numpy as np
+
+from quantiles import quantiles as exact_quantiles
+
+_HEADER = struct.Struct("<4sIqI")
+_MAGIC = b"KLL1"
+
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch with bounded memory.
+
+    Parameters:
+    - k: accuracy parameter; larger k means smaller error and more memory
+    - seed: seed for the coin flips used when compacting a level
+    """
+
+    _decay = 2 / 3
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = int(k)
+        self.n = 0
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def for_error(cls, rank_error, seed=None):
+        """Create a sketch sized for the given normalized rank error (e.g. 0.01)."""
+        return cls(k=max(8, math.ceil(1.7 / rank_error)), seed=seed)
+
+    def _capacity(self, level):
+        depth = len(self._levels) - 1 - level
+        return max(2, int(math.ceil(self.k * self._decay**depth)))
+
+    def _max_size(self):
+        return sum(self._capacity(h) for h in range(len(self._levels)))
+
+    @property
+    def size(self):
+        """Number of items currently retained."""
+        return sum(len(items) for items in self._levels)
+
+    def _compress(self):
+        while self.size > self._max_size():
+            for h, items in enumerate(self._levels):
+                if len(items) < self._capacity(h):
+                    continue
+                if h + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind at this level
+                keep = items[len(items) - len(items) % 2:]
+                items = items[:len(items) - len(items) % 2]
+                promoted = items[self._rng.integers(2)::2]
+                self._levels[h + 1] = np.concatenate([self._levels[h + 1], promoted])
+                self._levels[h] = keep
+                break
+
+    def update(self, values):
+        """
+        Add a batch of values (a scalar or any array-like).
+
+        Returns self so calls can be chained.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return self
+        self.n += values.size
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Merge another sketch into this one.
+
+        Returns self so calls can be chained.
+        """
+        if other.k != self.k:
+            raise ValueError("Only sketches with the same k can be merged.")
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for h, items in enumerate(other._levels):
+            self._levels[h] = np.concatenate([self._levels[h], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantiles(self, q):
+        """
+        Approximate quantile(s) for q in [0, 1].
+
+        While nothing has been compacted the sketch still holds every value,
+        so the exact (interpolated) quantiles are returned.
+        """
+        if self.n == 0:
+            raise ValueError("The sketch is empty.")
+        if len(self._levels) == 1:
+            return exact_quantiles(self._levels[0], q)
+
+        q_arr = np.asarray(q, dtype=float)
+        if np.any((q_arr < 0) | (q_arr > 1)):
+            raise ValueError("Quantiles must be in the range [0, 1].")
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level), 2.0**h)
+                                  for h, level in enumerate(self._levels)])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, q_arr * cumulative[-1], side="left")
+        result = items[np.minimum(index, len(items) - 1)]
+        return float(result) if result.ndim == 0 else result
+
+    def median(self):
+        return self.quantiles(0.5)
+
+    def quartile_deviation(self):
+        """Q1, Q3 and the quartile deviation (Q3 - Q1) / 2, as in quantiles.py."""
+        Q1, Q3 = np.asarray(self.quantiles([0.25, 0.75])).tolist()
+        return Q1, Q3, (Q3 - Q1) / 2
+
+    def to_bytes(self):
+        """Serialize the sketch state (not the random generator) to bytes."""
+        lengths = struct.pack(f"<{len(self._levels)}q", *(len(items) for items in self._levels))
+        payload = b"".join(np.ascontiguousarray(items, dtype="<f8").tobytes()
+                           for items in self._levels)
+        return _HEADER.pack(_MAGIC, self.k, self.n, len(self._levels)) + lengths + payload
+
+    @classmethod
+    def from_bytes(cls, data, seed=None):
+        """Rebuild a sketch produced by to_bytes()."""
+        magic, k, n, num_levels = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a serialized KLL sketch.")
+        offset = _HEADER.size
+        lengths = struct.unpack_from(f"<{num_levels}q", data, offset)
+        offset += 8 * num_levels
+
+        sketch = cls(k=k, seed=seed)
+        sketch.n = n
+        sketch._levels = []
+        for length in lengths:
+            sketch._levels.append(np.frombuffer(data, dtype="<f8", count=length, offset=offset).copy())
+            offset += 8 * length
+        return sketch
+
+    def __repr__(self):
+        return f"KLLSketch(k={self.k}, n={self.n}, retained={self.size}, levels={len(self._levels)})"
+
+
+if __name__ == "__main__":
+    # Same data as measureOfDispersion.py: small enough to stay exact
+    sketch = KLLSketch().update([5, 2, 3, 4, 1, 6, 7, 8, 10])
+    Q1, Q3, QD = sketch.quartile_deviation()
+    print("Median = ", sketch.median())
+    print("First Quartile (Q1) = ", Q1)
+    print("Third Quartile (Q3) = ", Q3)
+    print("Quartile Deviation = ", QD)
+
+    # Simulated request latencies arriving in batches on four workers
+    rng = np.random.default_rng(7)
+    workers = [KLLSketch.for_error(0.01, seed=i) for i in range(4)]
+    latencies = []
+    for _ in range(50):
+        for worker in workers:
+            batch = rng.lognormal(3.0, 0.6, 100_000)
+            latencies.append(batch)
+            worker.update(batch)
+
+    merged = KLLSketch.from_bytes(workers[0].to_bytes())
+    for worker in workers[1:]:
+        merged.merge(KLLSketch.from_bytes(worker.to_bytes()))
+
+    latencies = np.concatenate(latencies)
+    print(f"\n{merged}, serialized size = {len(merged.to_bytes()):,} bytes")
+    for label, q in [("Q1", 0.25), ("Median", 0.5), ("Q3", 0.75), ("p99", 0.99)]:
+        approx = merged.quantiles(q)
+        exact = np.quantile(latencies, q)
+        rank_error = abs(np.mean(latencies <= approx) - q)
+        print(f"{label:<7} sketch = {approx:9.4f}   exact = {exact:9.4f}   rank error = {rank_error:.4%}")
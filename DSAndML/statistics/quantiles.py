@@ -0,0 +1,122 @@
+"""
+Selection-based median and quantiles.
+
+Instead of sorting (O(n log n)) or the heapq approach in median.py, these
+functions use numpy.partition (introselect), which places the requested order
+statistics in O(n) expected time. All quantiles requested in one call share a
+single partitioning pass.
+
+Quantiles use linear interpolation between order statistics, matching
+numpy.percentile's default method.
+"""
+
+import heapq
+import statistics
+import time
+
+import numpy as np
+
+
+def quantiles(data, q, overwrite_input=False):
+    """
+    Compute one or more quantiles with a single partitioning pass.
+
+    Parameters:
+    - data: array-like of numbers
+    - q: quantile or sequence of quantiles in [0, 1]
+    - overwrite_input: if True and data is a NumPy array, partition it in
+      place instead of working on a copy (its order is scrambled afterwards)
+
+    Returns:
+    - float for a scalar q, otherwise a NumPy array with one value per quantile
+    """
+    a = np.asarray(data)
+    if a.size == 0:
+        raise ValueError("quantiles() requires at least one data point.")
+    if a.ndim != 1:
+        a = a.ravel()
+
+    q_arr = np.asarray(q, dtype=float)
+    if np.any((q_arr < 0) | (q_arr > 1)):
+        raise ValueError("Quantiles must be in the range [0, 1].")
+
+    position = q_arr * (a.size - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, a.size - 1)
+    kth = np.unique(np.concatenate([lower.ravel(), upper.ravel()]))
+
+    if overwrite_input and a is data:
+        a.partition(kth)
+        part = a
+    else:
+        part = np.partition(a, kth)
+
+    low_values = part[lower].astype(float)
+    result = low_values + (position - lower) * (part[upper] - low_values)
+    return float(result) if result.ndim == 0 else result
+
+
+def median(data, overwrite_input=False):
+    """
+    Median in O(n) expected time.
+
+    For an even number of values this is the mean of the two middle values.
+    """
+    return quantiles(data, 0.5, overwrite_input=overwrite_input)
+
+
+def quartile_deviation(data, overwrite_input=False):
+    """
+    First quartile, third quartile and quartile deviation (Q3 - Q1) / 2.
+
+    Both quartiles come from the same partitioning pass.
+    """
+    Q1, Q3 = quantiles(data, [0.25, 0.75], overwrite_input=overwrite_input).tolist()
+    return Q1, Q3, (Q3 - Q1) / 2
+
+
+def _heapq_median(data_set):
+    """The heapq approach from median.py, kept for benchmarking."""
+    mid = len(data_set) // 2
+    if len(data_set) % 2 == 0:
+        return (heapq.nlargest(mid, data_set)[-1] + heapq.nsmallest(mid, data_set)[-1]) / 2
+    return heapq.nlargest(mid + 1, data_set)[-1]
+
+
+def benchmark(size=10**7, seed=0):
+    """
+    Compare selection-based median and quartiles with sorting and heapq.
+    """
+    rng = np.random.default_rng(seed)
+    data = rng.normal(size=size)
+    as_list = data.tolist()
+
+    def timed(label, func):
+        start = time.perf_counter()
+        value = func()
+        print(f"{label:<34}{time.perf_counter() - start:9.3f} s  -> {value}")
+
+    print(f"Median of {size:,} values")
+    timed("statistics.median", lambda: statistics.median(as_list))
+    timed("heapq nlargest/nsmallest", lambda: _heapq_median(as_list))
+    timed("np.median (sort)", lambda: float(np.median(data)))
+    timed("quantiles.median (copy)", lambda: median(data))
+    timed("quantiles.median (in place)", lambda: median(data.copy(), overwrite_input=True))
+
+    print(f"\nQ1/Q3 of {size:,} values")
+    timed("np.percentile", lambda: tuple(np.percentile(data, [25, 75])))
+    timed("sorted() then index", lambda: (lambda s: (s[size // 4], s[3 * size // 4]))(sorted(as_list)))
+    timed("quantiles.quartile_deviation", lambda: quartile_deviation(data)[:2])
+
+
+if __name__ == "__main__":
+    data_set = [5, 2, 3, 4, 1, 6, 7, 8, 10]
+    print("Median = ", median(data_set))
+    Q1, Q3, QD = quartile_deviation(data_set)
+    print("First Quartile (Q1) = ", Q1)
+    print("Third Quartile (Q3) = ", Q3)
+    print("Quartile Deviation = ", QD)
+    print("Deciles = ", quantiles(data_set, np.linspace(0.1, 0.9, 9)))
+
+    print()
+    benchmark()
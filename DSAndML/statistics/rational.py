@@ -0,0 +1,96 @@
+"""
+Exact rational accumulation without per-operation gcds.
+
+Adding Fractions one at a time renormalizes (a gcd on ever-growing
+integers) after every step. Here terms are grouped by denominator and summed
+as plain integers, the groups are brought to their least common multiple,
+and a single Fraction is built at the end. Results are identical to summing
+Fractions directly.
+"""
+
+import math
+import time
+from collections import defaultdict
+from fractions import Fraction
+
+
+def _combine(groups, saw_float):
+    if not groups:
+        return 0.0 if saw_float else Fraction(0)
+    common = math.lcm(*groups)
+    total = Fraction(sum(numerator * (common // denominator)
+                         for denominator, numerator in groups.items()), common)
+    return float(total) if saw_float else total
+
+
+def exact_sum(values):
+    """
+    Exact sum of ints/Fractions, normalized once.
+
+    Floats are converted exactly (Fraction(float)) and, if any are present,
+    the correctly rounded float of the exact sum is returned.
+    """
+    groups = defaultdict(int)
+    saw_float = False
+    for value in values:
+        if isinstance(value, float):
+            value = Fraction(value)
+            saw_float = True
+        groups[value.denominator] += value.numerator
+    return _combine(groups, saw_float)
+
+
+def exact_dot(values, weights):
+    """
+    Exact Σ values[i] * weights[i], e.g. Σ x * P(x) for an expected value.
+    """
+    groups = defaultdict(int)
+    saw_float = False
+    for value, weight in zip(values, weights):
+        if isinstance(value, float) or isinstance(weight, float):
+            value, weight = Fraction(value), Fraction(weight)
+            saw_float = True
+        groups[value.denominator * weight.denominator] += value.numerator * weight.numerator
+    return _combine(groups, saw_float)
+
+
+def exact_mean(values):
+    """Exact arithmetic mean of ints/Fractions."""
+    values = list(values)
+    if not values:
+        raise ValueError("exact_mean() requires at least one data point.")
+    return exact_sum(values) / len(values)
+
+
+def benchmark(terms=10**5, seed=0):
+    """
+    Compare the common-denominator sum with sum() over Fractions on a
+    `terms`-term distribution and check both give the same Fraction.
+    """
+    import random
+
+    rng = random.Random(seed)
+    denominators = [36, 48, 60, 120, 1000, 1024, 4096, 7 * 9 * 11 * 13]
+    values = [Fraction(rng.randrange(1, 50), rng.choice(denominators)) for _ in range(terms)]
+
+    start = time.perf_counter()
+    expected = sum(values, Fraction(0))
+    fraction_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = exact_sum(values)
+    exact_time = time.perf_counter() - start
+
+    print(f"Sum of {terms:,} Fractions")
+    print(f"  sum() of Fractions:  {fraction_time:8.4f} s")
+    print(f"  exact_sum():         {exact_time:8.4f} s  ({fraction_time / exact_time:.0f}x faster)")
+    print(f"  identical result:    {result == expected}  ({result})")
+
+
+if __name__ == "__main__":
+    distribution = [Fraction(1, 36), Fraction(3, 36), Fraction(5, 36),
+                    Fraction(7, 36), Fraction(9, 36), Fraction(11, 36)]
+    print("Sum of probabilities =", exact_sum(distribution))
+    print("Expected value =", exact_dot(range(1, 7), distribution))
+    print()
+    benchmark()
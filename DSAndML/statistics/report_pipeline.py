@@ -0,0 +1,115 @@
+"""
+Headless batch rendering for the PR01/PR02/PR03 reports.
+
+The scripts compute statistics and call plt.show() figure by figure, which
+blocks a nightly run. Here every statistic and sample is computed first in
+the parent process; the figure builders (plot_central_tendency,
+plot_normal ..., plot_bayes_results) then run on the Agg backend in a
+process pool, and each worker writes its PNG/SVG files directly.
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+import histogram_central_tendency_PR01 as pr01
+import probability_distributions_comprehensive_PR02 as pr02
+from bayes_medical_testing_PR03 import BayesianMedicalTest, plot_bayes_results
+
+FigureJob = namedtuple("FigureJob", ["name", "builder", "kwargs"])
+
+
+def _init_worker():
+    # Spawned workers start without the parent's backend choice
+    matplotlib.use("Agg", force=True)
+
+
+def _render(job, output_dir, formats, dpi):
+    fig = job.builder(**job.kwargs)
+    paths = []
+    for fmt in formats:
+        path = os.path.join(output_dir, f"{job.name}.{fmt}")
+        fig.savefig(path, format=fmt, dpi=dpi)
+        paths.append(path)
+    plt.close(fig)
+    return paths
+
+
+def render_figures(jobs, output_dir="reports", formats=("png", "svg"), workers=None, dpi=100):
+    """
+    Render FigureJobs to `output_dir`, one file per job and format.
+
+    Parameters:
+    - jobs: FigureJob(name, builder, kwargs); builder must be a module-level
+      function returning a Figure, and kwargs must be picklable
+    - workers: process count (None = os.cpu_count()); 1 renders in-process
+
+    Returns:
+    - dict mapping job name to the list of written paths
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if workers == 1:
+        return {job.name: _render(job, output_dir, formats, dpi) for job in jobs}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {job.name: pool.submit(_render, job, output_dir, formats, dpi) for job in jobs}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def histogram_jobs(seed=42):
+    """PR01: the three central-tendency histograms."""
+    return [FigureJob(spec['name'], pr01.plot_central_tendency, spec['plot'])
+            for spec in pr01.figure_specs(seed)]
+
+
+def distribution_jobs(seed=42, size=1000):
+    """PR02: one figure per distribution plus the comparison grid, same parameters as main()."""
+    rng = np.random.default_rng(seed)
+    return [
+        FigureJob("normal", pr02.plot_normal, dict(samples=rng.normal(5, 2, size), mu=5, sigma=2)),
+        FigureJob("poisson", pr02.plot_poisson, dict(samples=rng.poisson(4, size), lam=4)),
+        FigureJob("bernoulli", pr02.plot_bernoulli, dict(samples=rng.binomial(1, 0.4, size), p=0.4)),
+        FigureJob("binomial", pr02.plot_binomial, dict(samples=rng.binomial(15, 0.6, size), n=15, p=0.6)),
+        FigureJob("exponential", pr02.plot_exponential, dict(samples=rng.exponential(1 / 0.5, size), lam=0.5)),
+        FigureJob("uniform", pr02.plot_uniform, dict(samples=rng.uniform(2, 8, size), a=2, b=8)),
+        FigureJob("comparison", pr02.plot_comparison, dict(
+            normal_samples=rng.normal(0, 1, size), poisson_samples=rng.poisson(3, size),
+            exponential_samples=rng.exponential(1, size), uniform_samples=rng.uniform(-3, 3, size))),
+    ]
+
+
+def bayes_jobs(tests):
+    """PR03: the Bayesian analysis figure for each (name, BayesianMedicalTest)."""
+    return [FigureJob(name, plot_bayes_results, dict(data=test.visualization_data()))
+            for name, test in tests]
+
+
+def nightly_report(output_dir="reports", formats=("png", "svg"), workers=None, seed=42):
+    """
+    Compute every report statistic, then render all figures in parallel.
+
+    Returns:
+    - dict mapping figure name to the list of written paths
+    """
+    jobs = histogram_jobs(seed) + distribution_jobs(seed) + bayes_jobs([
+        ("bayes_medical_test", BayesianMedicalTest(1/1000, 0.01, 0.05)),
+    ])
+    return render_figures(jobs, output_dir=output_dir, formats=formats, workers=workers)
+
+
+if __name__ == "__main__":
+    for workers in (1, None):
+        start = time.perf_counter()
+        written = nightly_report(workers=workers)
+        elapsed = time.perf_counter() - start
+        label = "serial" if workers == 1 else f"{os.cpu_count()} processes"
+        print(f"{sum(map(len, written.values()))} files for {len(written)} figures "
+              f"({label}): {elapsed:.2f} s")
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The scripts import each other by bare module name (e.g. `import quantiles`),
+# so put their folders on the path the same way running them directly would.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("statistics", "Sampling", "Jupyternotebook"):
+    sys.path.insert(0, os.path.join(ROOT, folder))
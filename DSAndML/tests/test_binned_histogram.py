@@ -0,0 +1,39 @@
+import math
+
+import numpy as np
+import pytest
+
+from binned_histogram import BinnedHistogram
+
+
+def test_merge_matches_single_pass():
+    data = np.random.default_rng(0).normal(50.0, 10.0, 100_000)
+    single = BinnedHistogram(20, 80, bins=60).update(data)
+    merged = BinnedHistogram(20, 80, bins=60)
+    for shard in np.array_split(data, 9):
+        merged.merge(BinnedHistogram(20, 80, bins=60).update(shard))
+
+    np.testing.assert_array_equal(merged.counts, single.counts)
+    assert (merged.below, merged.above, merged.n) == (single.below, single.above, single.n)
+    assert merged.mean == pytest.approx(single.mean)
+    assert merged.std == pytest.approx(single.std)
+    assert single.std == pytest.approx(data.std(ddof=1))
+    assert single.below + single.counts.sum() + single.above == len(data)
+
+
+def test_counts_match_numpy_histogram():
+    data = np.random.default_rng(1).random(10_000)
+    histogram = BinnedHistogram.from_array(data, bins=25, range=(0, 1), chunk_size=1000)
+    np.testing.assert_array_equal(histogram.counts, np.histogram(data, bins=25, range=(0, 1))[0])
+
+
+def test_std_needs_two_values():
+    histogram = BinnedHistogram(0, 10)
+    assert math.isnan(histogram.std)
+    assert math.isnan(histogram.update([3.0]).std)
+    assert histogram.update([5.0]).std == pytest.approx(2**0.5)
+
+
+def test_merge_rejects_different_bins():
+    with pytest.raises(ValueError):
+        BinnedHistogram(0, 1, bins=10).merge(BinnedHistogram(0, 1, bins=20))
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from sklearn.neighbors import KNeighborsClassifier as SkKNeighborsClassifier
+
+from knn import KNeighborsClassifier
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(3_000, 3))
+    y = (X[:, 0] + 0.5 * X[:, 1] > 0).astype(int) + (X[:, 2] > 1)
+    return X, y, rng.normal(size=(500, 3))
+
+
+def _brute_force(X, queries, k):
+    distances = np.sqrt(((queries[:, np.newaxis, :] - X[np.newaxis, :, :]) ** 2).sum(axis=2))
+    indices = np.argsort(distances, axis=1, kind="stable")[:, :k]
+    return np.take_along_axis(distances, indices, axis=1), indices
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree"])
+def test_kneighbors_after_save_load_matches_brute_force(data, tmp_path, algorithm):
+    X, y, queries = data
+    model = KNeighborsClassifier(7, algorithm=algorithm, leaf_size=16, block_size=500, batch_size=128)
+    model.fit(X, y).save(tmp_path / "model")
+    loaded = KNeighborsClassifier.load(tmp_path / "model")
+
+    expected_distances, expected_indices = _brute_force(X, queries, 7)
+    for fitted in (model, loaded):
+        distances, indices = fitted.kneighbors(queries)
+        np.testing.assert_array_equal(indices, expected_indices)
+        np.testing.assert_allclose(distances, expected_distances, rtol=1e-9, atol=1e-9)
+    np.testing.assert_array_equal(loaded.predict(queries), model.predict(queries))
+
+
+@pytest.mark.parametrize("weights", ["uniform", "distance"])
+def test_predictions_match_sklearn(data, weights):
+    X, y, queries = data
+    ours = KNeighborsClassifier(5, algorithm="kd_tree", weights=weights).fit(X, y)
+    theirs = SkKNeighborsClassifier(5, weights=weights).fit(X, y)
+    np.testing.assert_allclose(ours.predict_proba(queries), theirs.predict_proba(queries), atol=1e-12)
+    np.testing.assert_array_equal(ours.predict(queries), theirs.predict(queries))
+
+
+def test_kneighbors_rejects_bad_queries(data):
+    X, y, queries = data
+    model = KNeighborsClassifier(3).fit(X, y)
+    with pytest.raises(ValueError):
+        model.kneighbors(queries[:, :2])
+    with pytest.raises(ValueError):
+        model.kneighbors(queries, n_neighbors=len(X) + 1)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression as SkLinearRegression
+
+from linear_regression import LinearRegression, simple_linear_regression
+
+
+def _data(rows=2_000, features=3, seed=0):
+    rng = np.random.default_rng(seed)
+    # Large offsets, like head size, to exercise the centered statistics
+    X = rng.normal(3_000, 300, (rows, features))
+    y = 10 + X @ np.arange(1, features + 1) + rng.normal(0, 50, rows)
+    return X, y
+
+
+@pytest.mark.parametrize("fit_intercept", [True, False])
+def test_merge_matches_single_pass(fit_intercept):
+    X, y = _data()
+    single = LinearRegression(fit_intercept).fit(X, y)
+    merged = LinearRegression(fit_intercept)
+    for rows in np.array_split(np.arange(len(y)), 6):
+        merged.merge(LinearRegression(fit_intercept).fit(X[rows], y[rows]))
+
+    assert merged.n == single.n
+    np.testing.assert_allclose(merged.mean_x, single.mean_x)
+    np.testing.assert_allclose(merged.Sxx, single.Sxx, rtol=1e-9)
+    np.testing.assert_allclose(merged.Sxy, single.Sxy, rtol=1e-9)
+    assert merged.Syy == pytest.approx(single.Syy, rel=1e-9)
+    np.testing.assert_allclose(merged.coef_, single.coef_, rtol=1e-8)
+    assert merged.intercept_ == pytest.approx(single.intercept_, rel=1e-6, abs=1e-8)
+
+
+@pytest.mark.parametrize("fit_intercept", [True, False])
+def test_matches_sklearn(fit_intercept):
+    X, y = _data(seed=1)
+    ours = LinearRegression(fit_intercept).fit(X, y)
+    theirs = SkLinearRegression(fit_intercept=fit_intercept).fit(X, y)
+    np.testing.assert_allclose(ours.coef_, theirs.coef_, rtol=1e-7)
+    assert ours.intercept_ == pytest.approx(theirs.intercept_, rel=1e-6, abs=1e-8)
+    if fit_intercept:
+        assert ours.r2 == pytest.approx(theirs.score(X, y))
+    np.testing.assert_allclose(ours.predict(X), theirs.predict(X), rtol=1e-9)
+
+
+def test_simple_regression():
+    x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    y = 2.0 + 3.0 * x
+    b1, b0 = simple_linear_regression(x, y)
+    assert (b1, b0) == (pytest.approx(3.0), pytest.approx(2.0))
+
+
+def test_merge_rejects_different_feature_counts():
+    X, y = _data(rows=20)
+    with pytest.raises(ValueError):
+        LinearRegression().fit(X, y).merge(LinearRegression().fit(X[:, :2], y))
+
+
+def test_partial_fit_matches_fit():
+    X, y = _data(seed=2)
+    streamed = LinearRegression()
+    for start in range(0, len(y), 37):
+        streamed.partial_fit(X[start:start + 37], y[start:start + 37])
+    fitted = LinearRegression().fit(X, y)
+    np.testing.assert_allclose(streamed.coef_, fitted.coef_, rtol=1e-8)
+    assert streamed.intercept_ == pytest.approx(fitted.intercept_, rel=1e-6)
+
+
+def test_sample_weights_match_sklearn():
+    X, y = _data(seed=3)
+    weights = np.random.default_rng(3).uniform(0.1, 5.0, len(y))
+    ours = LinearRegression().update(X, y, sample_weight=weights)
+    theirs = SkLinearRegression().fit(X, y, sample_weight=weights)
+    np.testing.assert_allclose(ours.coef_, theirs.coef_, rtol=1e-7)
+    assert ours.intercept_ == pytest.approx(theirs.intercept_, rel=1e-6)
+
+
+def test_forgetting_is_exponentially_weighted_least_squares():
+    X, y = _data(rows=500, seed=4)
+    forgetting = 0.99
+    streamed = LinearRegression(forgetting=forgetting)
+    for start in range(0, len(y), 23):
+        streamed.partial_fit(X[start:start + 23], y[start:start + 23])
+    # The newest row has weight 1, the one before it λ, and so on
+    weights = forgetting ** np.arange(len(y) - 1, -1, -1)
+    theirs = SkLinearRegression().fit(X, y, sample_weight=weights)
+    assert streamed.n == pytest.approx(weights.sum())
+    np.testing.assert_allclose(streamed.coef_, theirs.coef_, rtol=1e-7)
+    assert streamed.intercept_ == pytest.approx(theirs.intercept_, rel=1e-6)
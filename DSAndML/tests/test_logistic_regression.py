@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression as SkLogisticRegression
+
+from logistic_regression import ConvergenceWarning, LogisticRegression, _synthetic_suv
+
+
+@pytest.fixture(scope="module")
+def suv():
+    return _synthetic_suv(400, np.random.default_rng(0))
+
+
+def _sklearn(X, y, C):
+    return SkLogisticRegression(C=C, tol=1e-10, max_iter=10_000).fit(X, y)
+
+
+@pytest.mark.parametrize("C", [1.0, 0.01])
+def test_newton_matches_sklearn(suv, C):
+    X, y = suv
+    ours = LogisticRegression("newton", C=C).fit(X, y)
+    theirs = _sklearn(X, y, C)
+    np.testing.assert_allclose(ours.coef_, theirs.coef_[0], rtol=1e-6)
+    assert ours.intercept_ == pytest.approx(theirs.intercept_[0], rel=1e-6)
+    np.testing.assert_allclose(ours.predict_proba(X), theirs.predict_proba(X)[:, 1], atol=1e-6)
+
+
+@pytest.mark.parametrize("solver", ["sgd", "adam"])
+def test_first_order_solvers_approach_sklearn(suv, solver):
+    X, y = suv
+    ours = LogisticRegression(solver, batch_size=32, max_iter=200, seed=0).fit(X, y)
+    theirs = _sklearn(X, y, 1.0)
+    assert np.abs(ours.predict_proba(X) - theirs.predict_proba(X)[:, 1]).max() < 0.05
+    assert np.mean(ours.predict(X) == theirs.predict(X)) >= 0.98
+
+
+def test_fit_chunks_matches_fit(suv):
+    X, y = suv
+
+    def chunks():
+        return ((X[s:s + 64], y[s:s + 64]) for s in range(0, len(y), 64))
+
+    chunked = LogisticRegression("newton").fit_chunks(chunks)
+    whole = LogisticRegression("newton").fit(X, y)
+    np.testing.assert_allclose(chunked.coef_, whole.coef_, rtol=1e-8)
+    assert chunked.intercept_ == pytest.approx(whole.intercept_, rel=1e-8)
+
+
+def test_running_out_of_iterations_warns(suv):
+    X, y = suv
+    with pytest.warns(ConvergenceWarning):
+        LogisticRegression("newton", max_iter=1).fit(X, y)
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        LogisticRegression("lbfgs")
+    with pytest.raises(ValueError):
+        LogisticRegression("sgd", max_iter=0)
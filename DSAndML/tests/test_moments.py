@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from moments import Moments
+
+
+def _assert_same(a, b):
+    assert a.n == pytest.approx(b.n)
+    for name in ("mean", "M2", "M3", "M4"):
+        assert getattr(a, name) == pytest.approx(getattr(b, name), rel=1e-9, abs=1e-6)
+
+
+def test_merge_matches_single_pass():
+    data = np.random.default_rng(0).gamma(2.0, 3.0, 10_000)
+    single = Moments().update(data)
+    merged = Moments()
+    for shard in np.array_split(data, 7):
+        merged.merge(Moments().update(shard))
+    _assert_same(merged, single)
+
+
+def test_from_batches_matches_scipy():
+    data = np.random.default_rng(1).normal(5.0, 2.0, 5_000)
+    acc = Moments.from_batches(np.array_split(data, 13))
+    assert acc.mean == pytest.approx(data.mean())
+    assert acc.skewness == pytest.approx(stats.skew(data))
+    assert acc.kurtosis == pytest.approx(stats.kurtosis(data, fisher=False))
+
+
+def test_frequency_table_matches_expanded_data():
+    f = np.array([3, 0, 5, 2, 7])
+    expanded = Moments().update(np.repeat(np.arange(len(f)), f))
+    _assert_same(Moments.from_frequency_table(f), expanded)
+
+
+def test_merge_with_empty():
+    acc = Moments().update([1.0, 2.0, 4.0])
+    _assert_same(Moments().merge(acc), acc)
+    _assert_same(acc.merge(Moments()), Moments().update([1.0, 2.0, 4.0]))
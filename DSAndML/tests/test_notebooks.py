@@ -0,0 +1,28 @@
+import glob
+import json
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NOTEBOOKS = sorted(glob.glob(os.path.join(ROOT, "**", "*.ipynb"), recursive=True))
+
+
+def _is_source(value):
+    return isinstance(value, str) or (isinstance(value, list) and all(isinstance(line, str) for line in value))
+
+
+@pytest.mark.parametrize("path", NOTEBOOKS, ids=os.path.basename)
+def test_notebook_is_valid_nbformat4_json(path):
+    with open(path, encoding="utf-8") as f:
+        notebook = json.load(f)
+
+    assert notebook["nbformat"] == 4
+    assert isinstance(notebook["metadata"], dict)
+    for cell in notebook["cells"]:
+        assert cell["cell_type"] in ("code", "markdown", "raw")
+        assert _is_source(cell["source"])
+        assert isinstance(cell["metadata"], dict)
+        if cell["cell_type"] == "code":
+            assert isinstance(cell["outputs"], list)
+            assert cell["execution_count"] is None or isinstance(cell["execution_count"], int)
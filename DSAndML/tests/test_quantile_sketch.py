@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import quantiles
+from quantile_sketch import KLLSketch
+
+Q = np.linspace(0.01, 0.99, 99)
+
+
+def _rank_errors(data, estimates):
+    """Normalized rank error of each estimate against the exact data."""
+    ordered = np.sort(data)
+    low = np.searchsorted(ordered, estimates, side="left") / len(data)
+    high = np.searchsorted(ordered, estimates, side="right") / len(data)
+    # Any rank in [low, high] is attained by the estimate (ties)
+    return np.maximum(0, np.maximum(low - Q, Q - high))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rank_error_within_bound(seed):
+    rank_error = 0.01
+    data = np.random.default_rng(seed).lognormal(0.0, 1.5, 200_000)
+    sketch = KLLSketch.for_error(rank_error, seed=seed)
+    for batch in np.array_split(data, 50):
+        sketch.update(batch)
+    assert sketch.n == len(data)
+    assert _rank_errors(data, sketch.quantiles(Q)).max() <= rank_error
+
+
+def test_merged_shards_within_bound():
+    rank_error = 0.01
+    data = np.random.default_rng(7).normal(size=200_000)
+    shards = [KLLSketch.for_error(rank_error, seed=i).update(part)
+              for i, part in enumerate(np.array_split(data, 8))]
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+    assert merged.n == len(data)
+    assert _rank_errors(data, merged.quantiles(Q)).max() <= rank_error
+
+
+def test_small_input_is_exact():
+    data = [5, 2, 3, 4, 1, 6, 7, 8, 10]
+    assert KLLSketch().update(data).quartile_deviation() == quantiles.quartile_deviation(data)
+
+
+def test_bytes_round_trip():
+    sketch = KLLSketch(k=64, seed=0).update(np.random.default_rng(0).random(50_000))
+    restored = KLLSketch.from_bytes(sketch.to_bytes())
+    assert restored.n == sketch.n
+    np.testing.assert_array_equal(restored.quantiles(Q), sketch.quantiles(Q))
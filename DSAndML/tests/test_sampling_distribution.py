@@ -0,0 +1,68 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from samplingDistribution import sampling_dist, sum_distribution
+
+
+def _enumerated_totals(population, n):
+    totals = np.array([sum(sample) for sample in itertools.product(population, repeat=n)], dtype=float)
+    # Float sums of equal totals differ in the last bits; group them like sum_distribution does
+    values, counts = np.unique(np.round(totals, 9), return_counts=True)
+    return values, counts / counts.sum()
+
+
+@pytest.mark.parametrize("population, n", [
+    ([1, 2, 3, 4, 5, 6], 4),
+    ([0, 3, 3, 9, 12], 3),
+    ([0.1, 0.2, 0.7], 5),
+    ([-2.5, 0.0, 1.25, 4.0], 3),
+])
+def test_sum_distribution_matches_enumeration(population, n):
+    totals, probabilities = sum_distribution(population, n)
+    expected_totals, expected_probabilities = _enumerated_totals(population, n)
+    np.testing.assert_allclose(totals, expected_totals, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(probabilities, expected_probabilities, rtol=1e-9)
+
+
+def test_sparse_fallback_matches_lattice():
+    dense = sum_distribution([0, 1, 5, 40], 6)
+    sparse = sum_distribution([0, 1, 5, 40], 6, max_lattice_points=10)
+    np.testing.assert_allclose(sparse[0], dense[0])
+    np.testing.assert_allclose(sparse[1], dense[1], rtol=1e-9)
+
+
+def test_fft_path_keeps_probabilities_normalized():
+    totals, probabilities = sum_distribution(range(1, 101), 20)
+    assert probabilities.sum() == pytest.approx(1.0)
+    assert probabilities.min() >= 0
+    assert np.dot(totals, probabilities) == pytest.approx(20 * 50.5)
+
+
+def test_exact_matches_table():
+    population = [2, 4, 4, 7, 10]
+    table, mean, std = sampling_dist(population, 3, mode="table")
+    _, exact_mean, exact_std = sampling_dist(population, 3, mode="exact")
+    assert exact_mean == pytest.approx(mean)
+    assert exact_std == pytest.approx(std)
+    assert std == pytest.approx(table["SampleMean"].std(ddof=1))
+
+
+def test_exact_matches_monte_carlo():
+    population = [1, 2, 2, 3, 5, 8, 13]
+    exact, exact_mean, exact_std = sampling_dist(population, 4, mode="exact")
+    simulated, mc_mean, mc_std = sampling_dist(population, 4, mode="monte_carlo", reps=400_000, seed=0)
+
+    assert mc_mean == pytest.approx(exact_mean, rel=2e-3)
+    assert mc_std == pytest.approx(exact_std, rel=5e-3)
+    merged = exact.merge(simulated, on="SampleMean", how="outer", suffixes=("", "_mc")).fillna(0.0)
+    total_variation = 0.5 * np.abs(merged["Probability"] - merged["Probability_mc"]).sum()
+    assert total_variation < 0.01
+
+
+def test_empty_population_is_rejected():
+    with pytest.raises(ValueError):
+        sampling_dist([], 2, mode="exact")
+    with pytest.raises(ValueError):
+        sum_distribution([], 2)